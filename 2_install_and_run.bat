@@ -12,6 +12,10 @@ REM Install dependencies
 echo Installing dependencies...
 pip install -r requirements.txt
 
+REM Build icon assets (theme variants, PNGs and the indexed bundle; incremental)
+echo Building assets...
+python scripts\build_assets.py
+
 REM Run the application
 echo Starting application...
 python main.py
@@ -1,15 +1,14 @@
-import google.generativeai as genai
-import os
-from dotenv import load_dotenv
+from services.genai_client import get_client
 
-load_dotenv()
-api_key = os.getenv("GOOGLE_API_KEY")
-genai.configure(api_key=api_key)
+client = get_client()
+if client is None:
+    print("No API Key found")
+    exit()
 
 print("Listando modelos disponibles...")
 try:
-    for m in genai.list_models():
-        if 'generateContent' in m.supported_generation_methods:
+    for m in client.models.list():
+        if "generateContent" in (m.supported_actions or []):
             print(f"- {m.name}")
 except Exception as e:
     print(f"Error listando modelos: {e}")
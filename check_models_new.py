@@ -1,16 +1,11 @@
-from google import genai
-import os
-from dotenv import load_dotenv
+from services.genai_client import get_client
 
-load_dotenv()
-api_key = os.getenv("GOOGLE_API_KEY")
+client = get_client()
 
-if not api_key:
+if client is None:
     print("No API Key found")
     exit()
 
-client = genai.Client(api_key=api_key)
-
 print("Listando modelos del nuevo SDK:")
 try:
     # La paginación en el nuevo SDK puede ser distinta, intentamos listar
@@ -1,5 +1,10 @@
 """marco: QFrame ,  marco del sidebar"""
 
+import importlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Union
+
 # 1. QtWidgets
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module, unused-import # noqa
     QFrame,
@@ -13,6 +18,7 @@ from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module, unused-imp
 # 2. QtCore
 from PySide6.QtCore import (  # pylint: disable=no-name-in-module, unused-import # noqa
     Qt,
+    QObject,
     QPropertyAnimation,
     QEasingCurve,
     Property,
@@ -24,12 +30,81 @@ from PySide6.QtGui import (  # pylint: disable=no-name-in-module, unused-import
     QIcon,
 )
 
+from utils.startup_profiler import profiler
+
+
+# Una página puede registrarse ya construida (instancia) o de forma perezosa:
+# clase, callable sin argumentos que devuelva el QWidget, o ruta "modulo:Clase".
+PageSource = Union[QWidget, Callable[[], QWidget], str]
+
+# Estimación por defecto cuando la página no implementa `estimated_memory()`
+DEFAULT_BYTES_PER_OBJECT = 4 * 1024
+
+
+@dataclass
+class PageCachePolicy:
+    """
+    Política LRU para las páginas perezosas que el Canvas mantiene vivas.
+
+    Cuando se supera algún límite, las páginas ocultas menos usadas se destruyen
+    y vuelven a ser un placeholder; se reconstruyen al navegar a ellas otra vez.
+    Solo se desalojan páginas registradas como clase/factory (las instancias no
+    se pueden reconstruir). `None` desactiva el límite correspondiente.
+
+    Protocolo opcional de las páginas (todos los métodos son opcionales):
+    - save_state() -> Any: estado a conservar antes de destruir la página.
+    - restore_state(blob): recibe ese estado tras reconstruirla.
+    - can_evict() -> bool: False para no ser desalojada en este momento.
+    - estimated_memory() -> int: bytes estimados que ocupa la página.
+    """
+
+    max_pages: Optional[int] = None  # Páginas perezosas construidas a la vez
+    max_memory_bytes: Optional[int] = None  # Presupuesto de memoria estimada
+
+
+def import_page_class(path: str) -> Callable[[], QWidget]:
+    """
+    Importa una clase de página a partir de su ruta "paquete.modulo:Clase".
+
+    Ej: import_page_class("pages.main.Demo_page:DemoPage")
+    """
+    module_name, sep, class_name = path.partition(":")
+    if not sep or not module_name or not class_name:
+        raise ValueError(f"Ruta de página inválida '{path}' (formato: 'modulo:Clase')")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def page_factory(page: PageSource) -> Callable[[], QWidget]:
+    """Normaliza una página perezosa a un callable que la construye."""
+    if isinstance(page, str):
+        # El módulo se importa recién al construir la página
+        return lambda: import_page_class(page)()
+    return page
 
 
+class PagePlaceholder(QWidget):
+    """
+    Marcador liviano que ocupa el lugar de una página aún no construida.
+    No tiene layout ni hijos: registrar 20+ módulos cuesta lo mismo que registrar uno.
+    """
+
+    def __init__(self, key: str):
+        super().__init__()
+        self.setObjectName("PagePlaceholder")
+        self.page_key = key
+
 
 class Canvas(QFrame):
     """es el marco de trabajo y hereda de QFrame ."""
 
+    # Se emite cada vez que una página perezosa se construye (key, instancia).
+    # Tras un desalojo se vuelve a emitir con la nueva instancia.
+    page_created = Signal(str, object)
+    # Se emite cuando una página se destruye por la política de caché (key)
+    page_evicted = Signal(str)
+    # Se emite al mostrar una página con set_current_page (key)
+    current_page_changed = Signal(str)
+
     def __init__(self):
         # 1. self:Canvas = QFrame:
         super().__init__()
@@ -38,6 +113,25 @@ class Canvas(QFrame):
         self.setObjectName("QCanvas")  # id para los estilos
         # El canvas crece automáticamente por defecto en un HBox si el otro es fijo,
 
+        # Registro de páginas: key -> widget en el stack (página real o placeholder)
+        self._pages: Dict[str, QWidget] = {}
+        # key -> factory para las páginas perezosas
+        self._factories: Dict[str, Callable[[], QWidget]] = {}
+        # widget -> key (búsqueda inversa para navegar por instancia)
+        self._keys: Dict[QWidget, str] = {}
+
+        # Caché LRU de páginas perezosas construidas (la más reciente al final)
+        self.cache_policy = PageCachePolicy()
+        self._lru: "OrderedDict[str, None]" = OrderedDict()
+        self._memory: Dict[str, int] = {}  # key -> bytes estimados al construir
+        self._memory_reporters: Set[str] = set()  # Páginas con estimated_memory()
+        self._saved_states: Dict[str, Any] = {}
+        self._pinned: Set[str] = set()
+
+        # Páginas "stale" tras un cambio de tema: key -> placeholder que las
+        # reemplaza en el stack mientras la página real está fuera del árbol
+        self._stale: Dict[str, PagePlaceholder] = {}
+
         # 1. Crear el layout para el QFrame
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -58,10 +152,237 @@ class Canvas(QFrame):
         # 5. Agregar al layout
         layout.addWidget(self.scroll_area)
 
-    def add_page(self, widget: QWidget):
-        """Agrega una página a la pila."""
+    def add_page(self, page: PageSource, key: Optional[str] = None) -> str:
+        """
+        Agrega una página a la pila.
+
+        Si `page` es una instancia se agrega tal cual. Si es una clase, factory o
+        ruta "modulo:Clase", se agrega un `PagePlaceholder` y la página real se
+        construye (importando su módulo si hace falta) la primera vez que se navega a ella.
+
+        Returns:
+            str: La clave con la que quedó registrada la página.
+        """
+        if key is None:
+            key = f"page_{len(self._pages)}"
+
+        if isinstance(page, QWidget):
+            widget = page
+        else:
+            self._factories[key] = page_factory(page)
+            widget = PagePlaceholder(key)
+
+        self._pages[key] = widget
+        self._keys[widget] = key
         self.stack.addWidget(widget)
+        return key
+
+    def set_current_page(self, page: Union[QWidget, str]):
+        """Cambia la página visible (acepta la clave o la instancia)."""
+        key = self.key_of(page)
+        if key is None:
+            return
+        self.stack.setCurrentWidget(self.ensure_page(key))
+
+        if key in self._lru:
+            self._lru.move_to_end(key)
+        self._enforce_cache_policy()
+        self.current_page_changed.emit(key)
+
+    def set_cache_policy(self, policy: PageCachePolicy):
+        """Configura la política LRU y la aplica de inmediato."""
+        self.cache_policy = policy
+        self._enforce_cache_policy()
+
+    def can_cache_more(self) -> bool:
+        """Indica si se puede construir otra página sin exceder la política de caché."""
+        policy = self.cache_policy
+        if policy.max_pages is not None and len(self._lru) >= policy.max_pages:
+            return False
+        if (
+            policy.max_memory_bytes is not None
+            and sum(self._memory.values()) >= policy.max_memory_bytes
+        ):
+            return False
+        return True
+
+    def pin_page(self, key: str, pinned: bool = True):
+        """Excluye (o vuelve a incluir) una página del desalojo LRU."""
+        if pinned:
+            self._pinned.add(key)
+        else:
+            self._pinned.discard(key)
+
+    def evict_page(self, key: str) -> bool:
+        """
+        Destruye una página perezosa oculta y deja un placeholder en su lugar.
+        Si la página implementa `save_state()`, su estado se restaura al reconstruirla.
+
+        Returns:
+            bool: True si la página fue desalojada.
+        """
+        page = self.page(key)
+        if page is None or not self._can_evict(key, page):
+            return False
+
+        if hasattr(page, "save_state"):
+            self._saved_states[key] = page.save_state()
+
+        if key in self._stale:
+            # Ya está fuera del árbol: su placeholder ocupa el lugar en el stack
+            placeholder = self._stale.pop(key)
+        else:
+            placeholder = PagePlaceholder(key)
+            self._swap_in_stack(page, placeholder)
+        del self._keys[page]
+        page.deleteLater()
+
+        self._pages[key] = placeholder
+        self._keys[placeholder] = key
+        self._lru.pop(key, None)
+        self._memory.pop(key, None)
+        self._memory_reporters.discard(key)
+        self.page_evicted.emit(key)
+        return True
+
+    def key_of(self, page: Union[QWidget, str]) -> Optional[str]:
+        """Retorna la clave de una página registrada (o None si no existe)."""
+        if isinstance(page, str):
+            return page if page in self._pages else None
+        return self._keys.get(page)
+
+    def page(self, key: str) -> Optional[QWidget]:
+        """Retorna la instancia de la página si ya fue construida, sin construirla."""
+        widget = self._pages.get(key)
+        if widget is None or isinstance(widget, PagePlaceholder):
+            return None
+        return widget
+
+    def is_created(self, key: str) -> bool:
+        """Indica si la página ya fue construida."""
+        return self.page(key) is not None
+
+    def ensure_page(self, key: str) -> QWidget:
+        """Retorna la página real, construyéndola (o re-estilizándola si está stale)."""
+        widget = self._pages[key]
+        if isinstance(widget, PagePlaceholder):
+            widget = self._build_page(key)
+        elif key in self._stale:
+            self._refresh_stale_page(key)
+        return widget
+
+    def mark_hidden_pages_stale(self) -> int:
+        """
+        Saca del árbol de widgets las páginas construidas que están ocultas.
+
+        Cuando el tema se aplica con QSS a nivel de ventana, Qt re-pule todo el árbol
+        de la ventana, incluidas las páginas que nadie ve. Fuera del árbol no se
+        re-pulen; al volver al stack (en `set_current_page`) heredan el QSS vigente.
+
+        Returns:
+            int: Cantidad de páginas marcadas como stale.
+        """
+        current = self.stack.currentWidget()
+        count = 0
+        for key, page in self._pages.items():
+            if isinstance(page, PagePlaceholder) or page is current or key in self._stale:
+                continue
+            placeholder = PagePlaceholder(key)
+            self._swap_in_stack(page, placeholder)
+            page.setParent(None)
+            self._stale[key] = placeholder
+            count += 1
+        return count
+
+    def is_stale(self, key: str) -> bool:
+        """Indica si la página espera ser re-estilizada al mostrarse."""
+        return key in self._stale
+
+    def showEvent(self, event):
+        # La primera página agregada queda como actual aunque sea un placeholder:
+        # se construye recién cuando el Canvas se muestra.
+        current = self.stack.currentWidget()
+        if isinstance(current, PagePlaceholder):
+            self.set_current_page(current.page_key)
+        super().showEvent(event)
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _build_page(self, key: str) -> QWidget:
+        """Construye la página perezosa y la coloca en el lugar de su placeholder."""
+        placeholder = self._pages[key]
+
+        with profiler.phase(f"build_page: {key}"):
+            page = self._factories[key]()
+
+        self._swap_in_stack(placeholder, page)
+        del self._keys[placeholder]
+        placeholder.deleteLater()
+
+        self._pages[key] = page
+        self._keys[page] = key
+        self._lru[key] = None
+        self._memory[key] = self._estimate_memory(page)
+        if hasattr(page, "estimated_memory"):
+            self._memory_reporters.add(key)
+
+        if key in self._saved_states and hasattr(page, "restore_state"):
+            page.restore_state(self._saved_states.pop(key))
+
+        self.page_created.emit(key, page)
+        return page
+
+    def _refresh_stale_page(self, key: str):
+        """Devuelve una página stale al stack: al re-parentarla hereda el QSS actual."""
+        placeholder = self._stale.pop(key)
+        self._swap_in_stack(placeholder, self._pages[key])
+        placeholder.deleteLater()
+
+    def _swap_in_stack(self, old: QWidget, new: QWidget):
+        """Reemplaza `old` por `new` en la misma posición del stack (conservando la actual)."""
+        was_current = self.stack.currentWidget() is old
+        self.stack.insertWidget(self.stack.indexOf(old), new)
+        if was_current:
+            self.stack.setCurrentWidget(new)
+        self.stack.removeWidget(old)
+
+    def _can_evict(self, key: str, page: QWidget) -> bool:
+        """Una página es desalojable si es perezosa, está oculta y no está fijada."""
+        if key not in self._factories or key in self._pinned:
+            return False
+        if page is self.stack.currentWidget():
+            return False
+        if hasattr(page, "can_evict") and not page.can_evict():
+            return False
+        return True
+
+    def _estimate_memory(self, page: QWidget) -> int:
+        """Bytes estimados de la página (heurística por número de objetos hijos)."""
+        if hasattr(page, "estimated_memory"):
+            return int(page.estimated_memory())
+        return (len(page.findChildren(QObject)) + 1) * DEFAULT_BYTES_PER_OBJECT
+
+    def _over_budget(self) -> bool:
+        policy = self.cache_policy
+        if policy.max_pages is not None and len(self._lru) > policy.max_pages:
+            return True
+        if (
+            policy.max_memory_bytes is not None
+            and sum(self._memory.values()) > policy.max_memory_bytes
+        ):
+            return True
+        return False
+
+    def _enforce_cache_policy(self):
+        """Desaloja las páginas menos usadas hasta respetar la política."""
+        # Las páginas que reportan su memoria pueden haber crecido desde que se construyeron
+        if self.cache_policy.max_memory_bytes is not None:
+            for key in self._memory_reporters:
+                self._memory[key] = int(self._pages[key].estimated_memory())
 
-    def set_current_page(self, widget: QWidget):
-        """Cambia la página visible."""
-        self.stack.setCurrentWidget(widget)
+        if not self._over_budget():
+            return
+        for key in list(self._lru):
+            if self.evict_page(key) and not self._over_budget():
+                return
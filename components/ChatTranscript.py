@@ -0,0 +1,396 @@
+"""
+Transcript de chat virtualizado (reemplaza al QTextEdit de DemoPage).
+
+- TranscriptStore: guarda los mensajes en listas compactas (rol + texto). Pasado
+  `memory_cap`, los textos más viejos se mueven por lotes a un archivo temporal y
+  se leen de nuevo solo si vuelven a verse.
+- ChatTranscript (QAbstractScrollArea): mide cada burbuja una vez y guarda las
+  alturas en un árbol de Fenwick (sumas prefijas O(log n)), así agregar un
+  mensaje o ubicar la primera burbuja visible no depende del largo de la sesión.
+  Solo se arman y pintan las burbujas visibles; sus QTextLayout se cachean (LRU).
+"""
+
+import tempfile
+from array import array
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+
+from PySide6.QtWidgets import QAbstractScrollArea, QApplication, QMenu
+from PySide6.QtCore import QEvent, QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QTextCharFormat, QTextLayout, QTextOption
+
+# Estilo de cada rol: (fondo de la burbuja, color del texto, alineación, rótulo)
+ROLE_STYLES = {
+    "user": ("#0078d4", "#ffffff", Qt.AlignRight, "Tú: "),
+    "ai": ("#3d3d3d", "#e0e0e0", Qt.AlignLeft, "Gemini: "),
+    "system": (None, "#888888", Qt.AlignHCenter, ""),
+}
+ROLES = tuple(ROLE_STYLES)
+
+
+class TranscriptStore:
+    """Mensajes del chat en memoria compacta, con los más viejos paginados a disco."""
+
+    def __init__(self, memory_cap: int = 2000, spill_batch: int = 500):
+        self.memory_cap = max(memory_cap, 1)
+        self.spill_batch = max(min(spill_batch, self.memory_cap), 1)
+        self._roles = bytearray()
+        self._texts: List[Optional[str]] = []  # None = paginado a disco
+        self._offsets = array("q")  # Posición en el archivo (-1 = en memoria)
+        self._lengths = array("i")
+        self._first_in_memory = 0
+        self._spill_file = None
+        self._read_cache: "OrderedDict[int, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @property
+    def spilled(self) -> int:
+        """Cantidad de mensajes cuyo texto está en disco."""
+        return self._first_in_memory
+
+    def append(self, role: str, text: str) -> int:
+        self._roles.append(ROLES.index(role))
+        self._texts.append(text)
+        self._offsets.append(-1)
+        self._lengths.append(0)
+        if len(self._texts) - self._first_in_memory > self.memory_cap:
+            self._spill()
+        return len(self._texts) - 1
+
+    def extend_last(self, text: str):
+        """Agrega texto al último mensaje (streaming). El último nunca está en disco."""
+        self._texts[-1] += text
+
+    def role(self, index: int) -> str:
+        return ROLES[self._roles[index]]
+
+    def text(self, index: int) -> str:
+        text = self._texts[index]
+        if text is not None:
+            return text
+
+        text = self._read_cache.get(index)
+        if text is None:
+            self._spill_file.seek(self._offsets[index])
+            text = self._spill_file.read(self._lengths[index]).decode("utf-8")
+            self._read_cache[index] = text
+            if len(self._read_cache) > 64:
+                self._read_cache.popitem(last=False)
+        else:
+            self._read_cache.move_to_end(index)
+        return text
+
+    def messages(self) -> Iterator[Tuple[str, str]]:
+        """(rol, texto) de todos los mensajes, del más viejo al más nuevo."""
+        for index in range(len(self._texts)):
+            yield self.role(index), self.text(index)
+
+    def clear(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+        self.__init__(self.memory_cap, self.spill_batch)
+
+    def _spill(self):
+        """Escribe en disco el lote de textos más viejo que sigue en memoria."""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="chat_transcript_")
+        self._spill_file.seek(0, 2)
+
+        end = min(self._first_in_memory + self.spill_batch, len(self._texts) - 1)
+        for index in range(self._first_in_memory, end):
+            data = self._texts[index].encode("utf-8")
+            self._offsets[index] = self._spill_file.tell()
+            self._lengths[index] = len(data)
+            self._spill_file.write(data)
+            self._texts[index] = None
+        self._spill_file.flush()
+        self._first_in_memory = end
+
+
+class _HeightIndex:
+    """Árbol de Fenwick de alturas: agregar, actualizar, suma prefija y búsqueda en O(log n)."""
+
+    def __init__(self):
+        self._values = array("i")
+        self._tree = array("q", [0])  # 1-indexado
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def value(self, index: int) -> int:
+        return self._values[index]
+
+    def append(self, value: int):
+        self._values.append(value)
+        position = len(self._values)
+        # El nodo nuevo cubre (position - lowbit, position]
+        lowbit = position & -position
+        self._tree.append(value + self.prefix(position - 1) - self.prefix(position - lowbit))
+
+    def update(self, index: int, value: int):
+        delta = value - self._values[index]
+        if not delta:
+            return
+        self._values[index] = value
+        position = index + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def prefix(self, count: int) -> int:
+        """Suma de las primeras `count` alturas (posición y de la burbuja `count`)."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def total(self) -> int:
+        return self.prefix(len(self._values))
+
+    def find(self, offset: int) -> int:
+        """Índice de la burbuja que contiene la coordenada y `offset`."""
+        position, remaining = 0, offset
+        step = 1 << (len(self._values).bit_length())
+        while step:
+            nxt = position + step
+            if nxt <= len(self._values) and self._tree[nxt] <= remaining:
+                position = nxt
+                remaining -= self._tree[nxt]
+            step >>= 1
+        return min(position, max(len(self._values) - 1, 0))
+
+    def clear(self):
+        self.__init__()
+
+
+class ChatTranscript(QAbstractScrollArea):
+    """
+    Vista virtualizada de los mensajes del chat.
+
+    API: append_message(role, text), append_to_last(text), messages(),
+    set_messages(messages) y clear(). `role` es "user", "ai" o "system".
+    """
+
+    SPACING = 10  # Separación vertical entre burbujas
+    PADDING_X = 10
+    PADDING_Y = 6
+    BUBBLE_RATIO = 0.75  # Ancho máximo de las burbujas user/ai respecto al viewport
+
+    def __init__(self, memory_cap: int = 2000, layout_cache_size: int = 256):
+        super().__init__()
+        self.setObjectName("ChatTranscript")
+        self.store = TranscriptStore(memory_cap)
+        self.layout_cache_size = layout_cache_size
+
+        self._heights = _HeightIndex()
+        self._measured_width = array("i")  # Ancho de viewport con el que se midió cada burbuja
+        # index -> (ancho de texto, QTextLayout, ancho natural, alto)
+        self._layouts: "OrderedDict[int, Tuple[int, QTextLayout, float, float]]" = OrderedDict()
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(20)
+
+    # -------------------------------------------------------------------------
+    # API
+    # -------------------------------------------------------------------------
+    def append_message(self, role: str, text: str) -> int:
+        """Agrega un mensaje y retorna su índice. Costo independiente del largo de la sesión."""
+        at_bottom = self._at_bottom()
+        index = self.store.append(role, text)
+        width = self.viewport().width()
+        self._heights.append(self._measure(index, width))
+        self._measured_width.append(width)
+        self._content_changed(at_bottom)
+        return index
+
+    def append_to_last(self, text: str):
+        """Agrega texto al último mensaje (respuestas en streaming)."""
+        if not len(self.store):
+            return
+        at_bottom = self._at_bottom()
+        index = len(self.store) - 1
+        self.store.extend_last(text)
+        self._layouts.pop(index, None)
+        width = self.viewport().width()
+        self._heights.update(index, self._measure(index, width))
+        self._measured_width[index] = width
+        self._content_changed(at_bottom)
+
+    def messages(self) -> List[Tuple[str, str]]:
+        return list(self.store.messages())
+
+    def set_messages(self, messages):
+        self.clear()
+        for role, text in messages:
+            self.append_message(role, text)
+
+    def clear(self):
+        self.store.clear()
+        self._heights.clear()
+        self._measured_width = array("i")
+        self._layouts.clear()
+        self._content_changed(True)
+
+    def message_at(self, y: int) -> int:
+        """Índice del mensaje en la coordenada y del viewport (-1 si no hay)."""
+        if not len(self._heights):
+            return -1
+        offset = y + self.verticalScrollBar().value()
+        if offset >= self._heights.total():
+            return -1
+        return self._heights.find(offset)
+
+    # -------------------------------------------------------------------------
+    # EVENTOS
+    # -------------------------------------------------------------------------
+    def paintEvent(self, event):
+        count = len(self._heights)
+        if not count:
+            return
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        width = self.viewport().width()
+        height = self.viewport().height()
+        top = self.verticalScrollBar().value()
+        index = self._heights.find(top)
+        y = self._heights.prefix(index) - top
+        remeasured = False
+
+        while index < count and y < height:
+            if self._measured_width[index] != width:
+                # Medida con otro ancho (resize): se corrige al hacerse visible
+                self._heights.update(index, self._measure(index, width))
+                self._measured_width[index] = width
+                remeasured = True
+            self._paint_bubble(painter, index, y, width)
+            y += self._heights.value(index)
+            index += 1
+        painter.end()
+
+        if remeasured:
+            self._update_scrollbar()
+
+    def resizeEvent(self, event):
+        at_bottom = self._at_bottom()
+        super().resizeEvent(event)
+        self._update_scrollbar()
+        if at_bottom:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def changeEvent(self, event):
+        # Otra fuente (ej. el stylesheet): todas las medidas se rehacen al hacerse visibles
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._layouts.clear()
+            self._measured_width = array("i", [-1]) * len(self._measured_width)
+            self.viewport().update()
+        super().changeEvent(event)
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        self.viewport().update()
+
+    def contextMenuEvent(self, event):
+        index = self.message_at(event.pos().y())
+        if index < 0:
+            return
+        menu = QMenu(self)
+        action = menu.addAction("Copiar mensaje")
+        if menu.exec(event.globalPos()) is action:
+            QApplication.clipboard().setText(self.store.text(index))
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _text_width(self, role: str, width: int) -> int:
+        if role == "system":
+            return max(width - 2 * self.PADDING_X, 1)
+        return max(int(width * self.BUBBLE_RATIO) - 2 * self.PADDING_X, 1)
+
+    def _layout(self, index: int, width: int) -> Tuple[QTextLayout, float, float]:
+        """QTextLayout de la burbuja para el ancho actual (cacheado, LRU)."""
+        role = self.store.role(index)
+        text_width = self._text_width(role, width)
+        cached = self._layouts.get(index)
+        if cached is not None and cached[0] == text_width:
+            self._layouts.move_to_end(index)
+            return cached[1:]
+
+        label = ROLE_STYLES[role][3]
+        # QTextLayout no corta en "\n": se usa el separador de línea Unicode
+        text = (label + self.store.text(index)).replace("\n", "\u2028")
+        layout = QTextLayout(text, self.font())
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        layout.setTextOption(option)
+
+        # Rótulo en negrita ("Tú:", "Gemini:"); los mensajes del sistema en cursiva
+        text_format = QTextCharFormat()
+        if role == "system":
+            text_format.setFontItalic(True)
+            length = len(layout.text())
+        else:
+            text_format.setFontWeight(QFont.Bold)
+            length = len(label)
+        span = QTextLayout.FormatRange()
+        span.start, span.length, span.format = 0, length, text_format
+        layout.setFormats([span])
+
+        layout.beginLayout()
+        y = natural = 0.0
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(text_width)
+            line.setPosition(QPointF(0, y))
+            y += line.height()
+            natural = max(natural, line.naturalTextWidth())
+        layout.endLayout()
+
+        self._layouts[index] = (text_width, layout, natural, y)
+        if len(self._layouts) > self.layout_cache_size:
+            self._layouts.popitem(last=False)
+        return layout, natural, y
+
+    def _measure(self, index: int, width: int) -> int:
+        _layout, _natural, text_height = self._layout(index, width)
+        return int(text_height + 2 * self.PADDING_Y + self.SPACING + 0.999)
+
+    def _paint_bubble(self, painter: QPainter, index: int, y: int, width: int):
+        background, foreground, alignment, _label = ROLE_STYLES[self.store.role(index)]
+        layout, natural, text_height = self._layout(index, width)
+        bubble_width = natural + 2 * self.PADDING_X
+        bubble_height = text_height + 2 * self.PADDING_Y
+
+        if alignment == Qt.AlignRight:
+            x = width - bubble_width - self.PADDING_X
+        elif alignment == Qt.AlignHCenter:
+            x = (width - bubble_width) / 2
+        else:
+            x = self.PADDING_X
+
+        if background is not None:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(background))
+            painter.drawRoundedRect(QRectF(x, y, bubble_width, bubble_height), 10, 10)
+        painter.setPen(QColor(foreground))
+        layout.draw(painter, QPointF(x + self.PADDING_X, y + self.PADDING_Y))
+
+    def _at_bottom(self) -> bool:
+        scrollbar = self.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum() - 2
+
+    def _update_scrollbar(self):
+        scrollbar = self.verticalScrollBar()
+        page = self.viewport().height()
+        scrollbar.setPageStep(page)
+        scrollbar.setRange(0, max(self._heights.total() - page, 0))
+
+    def _content_changed(self, stick_to_bottom: bool):
+        self._update_scrollbar()
+        if stick_to_bottom:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        self.viewport().update()
@@ -0,0 +1,168 @@
+"""
+Paleta de comandos sobre la barra de búsqueda del Header.
+
+Busca en las páginas y páginas de configuración registradas (y sus palabras
+clave) usando el índice incremental de `services.search_index`. La búsqueda se
+ejecuta con debounce mientras se escribe; los resultados se muestran en un
+popup debajo de la barra y Enter (o click) emite `command_selected`.
+"""
+
+from typing import Iterable, List
+
+from PySide6.QtWidgets import (
+    QApplication,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QAbstractItemView,
+)
+from PySide6.QtCore import QEvent, QObject, QPoint, Qt, QTimer, Signal
+
+from services.search_index import SearchEntry, SearchIndex
+
+# Texto secundario por tipo de entrada
+KIND_LABELS = {"page": "", "config": "Configuración"}
+
+
+class CommandPalettePopup(QListWidget):
+    """Lista de resultados flotante. No toma el foco: el teclado sigue en la barra."""
+
+    def __init__(self, parent: QLineEdit):
+        super().__init__(parent)
+        self.setObjectName("CommandPalettePopup")
+        self.setWindowFlags(Qt.Tool | Qt.FramelessWindowHint | Qt.WindowDoesNotAcceptFocus)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+
+
+class CommandPalette(QObject):
+    """
+    Convierte un QLineEdit en paleta de comandos.
+
+    Uso:
+        palette = CommandPalette(header.search_bar)
+        palette.add_entry("page", "home", "Inicio", ["dashboard"])
+        palette.command_selected.connect(lambda kind, key: ...)
+    """
+
+    # (kind, key) de la entrada elegida: kind es "page" o "config"
+    command_selected = Signal(str, str)
+
+    def __init__(
+        self,
+        line_edit: QLineEdit,
+        index: SearchIndex = None,
+        debounce_ms: int = 150,
+        max_results: int = 8,
+    ):
+        super().__init__(line_edit)
+        self.line_edit = line_edit
+        self.index = index or SearchIndex()
+        self.max_results = max_results
+        self._results: List[SearchEntry] = []
+
+        self.popup = CommandPalettePopup(line_edit)
+        self.popup.itemClicked.connect(lambda item: self._activate(self.popup.row(item)))
+
+        # Debounce: la búsqueda corre cuando se deja de escribir
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._run_search)
+
+        self.line_edit.textEdited.connect(lambda _text: self._debounce.start())
+        self.line_edit.installEventFilter(self)
+
+    def add_entry(self, kind: str, key: str, title: str, keywords: Iterable[str] = ()):
+        """Indexa una entrada (incremental). Si el popup está abierto, se refresca."""
+        self.index.add(kind, key, title, keywords)
+        self._refresh_if_open()
+
+    def add_keywords(self, kind: str, key: str, keywords: Iterable[str]):
+        """Suma palabras clave a una entrada ya indexada."""
+        if self.index.add_keywords(kind, key, keywords) is not None:
+            self._refresh_if_open()
+
+    def eventFilter(self, obj, event):
+        if obj is self.line_edit:
+            if event.type() == QEvent.KeyPress and self._handle_key(event.key()):
+                return True
+            if event.type() == QEvent.FocusOut:
+                # Diferido: al mostrarse, algunas plataformas activan el popup un instante
+                QTimer.singleShot(0, self._hide_if_unfocused)
+        return super().eventFilter(obj, event)
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _handle_key(self, key: int) -> bool:
+        """Navegación del popup con el teclado. Retorna True si la tecla se consumió."""
+        if key in (Qt.Key_Return, Qt.Key_Enter):
+            if self._debounce.isActive():
+                # Enter antes de que venza el debounce: buscar ya
+                self._debounce.stop()
+                self._run_search()
+            if self.popup.isVisible():
+                self._activate(max(self.popup.currentRow(), 0))
+            return True
+        if key == Qt.Key_Escape and self.popup.isVisible():
+            self.popup.hide()
+            return True
+        if key in (Qt.Key_Down, Qt.Key_Up) and self.popup.isVisible():
+            step = 1 if key == Qt.Key_Down else -1
+            row = (self.popup.currentRow() + step) % max(self.popup.count(), 1)
+            self.popup.setCurrentRow(row)
+            return True
+        return False
+
+    def _run_search(self):
+        self._results = self.index.search(self.line_edit.text(), self.max_results)
+        self.popup.clear()
+        if not self._results:
+            self.popup.hide()
+            return
+
+        for entry in self._results:
+            label = KIND_LABELS.get(entry.kind, entry.kind)
+            item = QListWidgetItem(f"{entry.title}   ·   {label}" if label else entry.title)
+            item.setToolTip(", ".join(entry.keywords))
+            self.popup.addItem(item)
+        self.popup.setCurrentRow(0)
+        self._show_popup()
+
+    def _show_popup(self):
+        """Ubica el popup debajo de la barra, con alto justo para los resultados."""
+        rows_height = self.popup.sizeHintForRow(0) * self.popup.count()
+        margins = self.popup.contentsMargins()
+        self.popup.setFixedSize(
+            self.line_edit.width(), rows_height + margins.top() + margins.bottom()
+        )
+        self.popup.move(self.line_edit.mapToGlobal(QPoint(0, self.line_edit.height() + 4)))
+        self.popup.show()
+
+    def _hide_if_unfocused(self):
+        if self.line_edit.hasFocus() or self.popup.underMouse():
+            return
+        if QApplication.activeWindow() is self.popup:
+            # El popup no debe quedarse con el foco del teclado
+            self.line_edit.activateWindow()
+            self.line_edit.setFocus()
+            return
+        self.popup.hide()
+
+    def _refresh_if_open(self):
+        if self.popup.isVisible() and self.line_edit.text():
+            self._run_search()
+
+    def _activate(self, row: int):
+        if not 0 <= row < len(self._results):
+            return
+        entry = self._results[row]
+        self.popup.hide()
+        self.line_edit.clear()
+        self.line_edit.clearFocus()
+        self.command_selected.emit(entry.kind, entry.key)
@@ -1,15 +1,27 @@
+from typing import Callable, Dict, Optional, Union
+
 from PySide6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel, 
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QListWidget, QStackedWidget, QFrame
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, Signal
+
+from components.Canvas import PagePlaceholder, PageSource, page_factory
+from utils.startup_profiler import profiler
 
 class Configuracion(QWidget):
+    # Se emite cuando una página de configuración perezosa se construye (key, instancia)
+    page_created = Signal(str, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Configuración")
-        self.setMinimumSize(600, 400) 
-        
+        self.setMinimumSize(600, 400)
+
+        # Registro de páginas: key -> widget en el stack (página real o placeholder)
+        self._pages: Dict[str, QWidget] = {}
+        self._factories: Dict[str, Callable[[], QWidget]] = {}
+
         # Layout Principal Horizontal (Menú Izq | Contenido Der)
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -20,32 +32,84 @@ class Configuracion(QWidget):
         self.list_menu.setFixedWidth(150)
         # self.list_menu.addItems(...) -> Se agregan dinámicamente
         self.list_menu.setObjectName("ConfigSidebar")
-        
+
         # Estilos visuales se definen en style.qss bajo #ConfigSidebar
-        
+
         main_layout.addWidget(self.list_menu)
 
         # 2. PANEL DERECHO (Stack de Páginas)
         self.stack = QStackedWidget()
         self.stack.setStyleSheet("background-color: transparent;") # Usa el fondo de la ventana
         main_layout.addWidget(self.stack)
-        
+
         # Lógica de Cambio
-        self.list_menu.currentRowChanged.connect(self.stack.setCurrentIndex)
-        
+        self.list_menu.currentRowChanged.connect(self._on_row_changed)
+
         # Estilo Global del Widget (se define en style.qss por #ConfigWindow si se desea)
         self.setObjectName("ConfigWindow")
 
-    def add_config_page(self, name: str, widget: QWidget):
+    def add_config_page(self, name: str, widget: PageSource, key: Optional[str] = None) -> str:
         """
         Agrega una página de configuración dinámicamente.
+
+        `widget` puede ser una instancia, una clase/factory o una ruta "modulo:Clase";
+        en los dos últimos casos la página se construye al seleccionarla por primera vez.
+
+        Returns:
+            str: La key de la página (por defecto, su nombre).
         """
+        key = key or name
+
+        if isinstance(widget, QWidget):
+            page = widget
+        else:
+            self._factories[key] = page_factory(widget)
+            page = PagePlaceholder(key)
+        self._pages[key] = page
+
         # 1. Agregar al menú lateral
         self.list_menu.addItem(name)
-        
+
         # 2. Agregar al stack de contenido
-        self.stack.addWidget(widget)
-        
+        self.stack.addWidget(page)
+
         # Si es la primera página, seleccionarla por defecto
         if self.list_menu.count() == 1:
             self.list_menu.setCurrentRow(0)
+
+        return key
+
+    def index_of(self, page: Union[QWidget, str]) -> int:
+        """Retorna el índice de una página (por key o instancia), o -1 si no existe."""
+        if isinstance(page, str):
+            page = self._pages.get(page)
+            if page is None:
+                return -1
+        return self.stack.indexOf(page)
+
+    def showEvent(self, event):
+        # La página seleccionada se construye recién cuando la ventana se muestra
+        self._on_row_changed(self.list_menu.currentRow())
+        super().showEvent(event)
+
+    def _on_row_changed(self, row: int):
+        """Muestra la página de la fila, construyéndola si es perezosa y la ventana es visible."""
+        widget = self.stack.widget(row)
+        if isinstance(widget, PagePlaceholder) and self.isVisible():
+            widget = self._build_page(widget.page_key)
+        self.stack.setCurrentIndex(row)
+
+    def _build_page(self, key: str) -> QWidget:
+        """Construye la página perezosa y la coloca en el lugar de su placeholder."""
+        placeholder = self._pages[key]
+        with profiler.phase(f"build_config_page: {key}"):
+            page = self._factories[key]()
+
+        index = self.stack.indexOf(placeholder)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+        self._pages[key] = page
+        self.page_created.emit(key, page)
+        return page
@@ -1,4 +1,3 @@
-import os
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -11,12 +10,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QIcon
 
-
-def get_icon_path(filename: str) -> str:
-    # Reciclar lógica de ruta de iconos.
-    # Podríamos mover esto a un utils.py pero por ahora lo duplicamos por simplicidad en el componente.
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_dir, "assets", "icons", filename)
+from components.CommandPalette import CommandPalette
+from services.icon_service import get_icon_service
 
 
 class Header(QFrame):
@@ -44,21 +39,24 @@ class Header(QFrame):
         self.search_bar.setPlaceholderText("Buscar...")
         self.search_bar.setFixedWidth(250)
         # Icono de búsqueda (acción)
-        # search_action = self.search_bar.addAction(QIcon(get_icon_path("search.svg")), QLineEdit.LeadingPosition)
+        # search_action = self.search_bar.addAction(get_icon_service().icon("search.svg"), QLineEdit.LeadingPosition)
         # QLineEdit.addAction es soportado en PySide6 recientes, probamos:
         try:
             self.search_bar.addAction(
-                QIcon(get_icon_path("search.svg")), QLineEdit.LeadingPosition
+                get_icon_service().icon("search.svg"), QLineEdit.LeadingPosition
             )
         except:
             pass  # Fallback si versión antigua
 
         layout.addWidget(self.search_bar)
 
+        # Paleta de comandos: busca páginas/configuración registradas (Interface llena el índice)
+        self.command_palette = CommandPalette(self.search_bar)
+
         # 3. Iconos de Acción
         # Notificaciones
         btn_notif = QPushButton()
-        btn_notif.setIcon(QIcon(get_icon_path("bell.svg")))
+        btn_notif.setIcon(get_icon_service().icon("bell.svg"))
         btn_notif.setIconSize(QSize(20, 20))
         btn_notif.setFixedSize(32, 32)
         btn_notif.setCursor(Qt.PointingHandCursor)
@@ -66,7 +64,7 @@ class Header(QFrame):
 
         # Ajustes (opcional)
         # btn_settings = QPushButton()
-        # btn_settings.setIcon(QIcon(get_icon_path("settings.svg")))
+        # btn_settings.setIcon(get_icon_service().icon("settings.svg"))
         # btn_settings.setIconSize(QSize(20, 20))
         # btn_settings.setFixedSize(32, 32)
         # layout.addWidget(btn_settings)
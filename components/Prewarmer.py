@@ -0,0 +1,191 @@
+"""
+Pre-construcción de páginas en segundo plano (idle) para que la primera visita
+a un módulo pesado no se note.
+"""
+
+import time
+from typing import Dict, Iterator, List, Optional
+
+# 2. QtCore
+from PySide6.QtCore import (  # pylint: disable=no-name-in-module, unused-import # noqa
+    QObject,
+    QSettings,
+    QTimer,
+)
+
+from components.Canvas import Canvas
+
+
+class PagePrewarmer(QObject):
+    """
+    Construye las páginas perezosas del Canvas mientras el event loop está ocioso.
+
+    - Prioridad: primero las páginas de la sección "fixed", luego las más usadas
+      en sesiones anteriores (contadores persistidos con QSettings).
+    - Presupuesto: cada tick trabaja como máximo `budget_ms`; si el timer llega
+      tarde (el event loop está ocupado con input/paint) se espera más.
+    - Trabajo troceado: una página puede exponer `prewarm_steps()`, un generador
+      cuyos pasos se ejecutan en ticks sucesivos dentro del presupuesto.
+    - Costo medido: se guarda cuánto tardó cada página en construirse. Una página
+      solo se construye si su último tiempo entra en lo que queda del tick (si no,
+      pasa al siguiente); las que superaron el presupuesto completo no se
+      pre-construyen (se construyen al visitarlas).
+    - Sin medición (primer arranque) el costo es desconocido: esas páginas solo se
+      construyen con el event loop ocioso desde hace `idle_before_unmeasured_ms`.
+    """
+
+    SETTINGS_GROUP = "page_usage"
+    BUILD_MS_GROUP = "page_build_ms"
+
+    def __init__(self, canvas: Canvas, budget_ms: float = 8.0, parent: QObject = None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.budget_ms = budget_ms
+        self.busy_backoff_ms = 50  # Espera cuando el event loop está ocupado
+        self.idle_before_unmeasured_ms = 1000  # Ocio requerido para páginas sin medir
+
+        self._settings = QSettings("TemplatePySide6", "Navigation")
+        self._usage: Dict[str, int] = self._load_group(self.SETTINGS_GROUP, int)
+        # Último tiempo de construcción medido por página (ms)
+        self._build_ms: Dict[str, float] = self._load_group(self.BUILD_MS_GROUP, float)
+        self._fixed: List[str] = []
+        self._order: List[str] = []  # Orden de registro (desempate)
+        self._queue: List[str] = []
+        self._steps: Optional[Iterator] = None
+        self._started = False
+        self._expected_at = 0.0
+        self._idle_since: Optional[float] = None  # Desde cuándo los ticks llegan a tiempo
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+
+        self.canvas.current_page_changed.connect(self.record_visit)
+
+    def add_page(self, key: str, fixed: bool = False):
+        """Registra una página candidata a pre-construirse."""
+        self._order.append(key)
+        if fixed:
+            self._fixed.append(key)
+
+    def start(self):
+        """Comienza a pre-construir (una sola vez, normalmente tras mostrar la ventana)."""
+        if self._started:
+            return
+        self._started = True
+        self._queue = sorted(
+            self._order,
+            key=lambda k: (
+                k not in self._fixed,
+                -self._usage.get(k, 0),
+                self._order.index(k),
+            ),
+        )
+        self._schedule(0)
+
+    def stop(self):
+        """Detiene el pre-construido pendiente."""
+        self._timer.stop()
+        self._queue.clear()
+        self._steps = None
+
+    def record_visit(self, key: str):
+        """Incrementa y persiste el contador de uso de una página."""
+        self._usage[key] = self._usage.get(key, 0) + 1
+        self._settings.setValue(f"{self.SETTINGS_GROUP}/{key}", self._usage[key])
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _load_group(self, group: str, value_type: type) -> Dict[str, float]:
+        values = {}
+        self._settings.beginGroup(group)
+        for key in self._settings.childKeys():
+            try:
+                values[key] = value_type(self._settings.value(key, 0))
+            except (TypeError, ValueError):
+                pass
+        self._settings.endGroup()
+        return values
+
+    def _record_build(self, key: str, elapsed_ms: float):
+        """Guarda el tiempo de construcción de la página para los próximos arranques."""
+        self._build_ms[key] = elapsed_ms
+        self._settings.setValue(f"{self.BUILD_MS_GROUP}/{key}", round(elapsed_ms, 1))
+        if elapsed_ms > self.budget_ms:
+            print(
+                f"⚠️ Advertencia: la página '{key}' tardó {elapsed_ms:.0f} ms en construirse; "
+                "ya no se pre-construye (se construye al visitarla)."
+            )
+
+    def _schedule(self, delay_ms: int):
+        self._expected_at = time.perf_counter() + delay_ms / 1000
+        self._timer.start(delay_ms)
+
+    def _next_key(self, allow_unmeasured: bool = True) -> Optional[str]:
+        """Siguiente página a construir; las sin medir quedan en cola si no se permiten."""
+        for key in list(self._queue):
+            # Ya construida, o no entraría en ningún tick (se deja para la primera visita)
+            if self.canvas.is_created(key) or self._build_ms.get(key, 0.0) > self.budget_ms:
+                self._queue.remove(key)
+                continue
+            if allow_unmeasured or key in self._build_ms:
+                self._queue.remove(key)
+                return key
+        return None
+
+    def _is_idle(self) -> bool:
+        if self._idle_since is None:
+            return False
+        return (time.perf_counter() - self._idle_since) * 1000 >= self.idle_before_unmeasured_ms
+
+    def _tick(self):
+        # Si el timer llegó tarde, el event loop tiene trabajo: cedemos el turno.
+        lateness_ms = (time.perf_counter() - self._expected_at) * 1000
+        if lateness_ms > self.budget_ms:
+            self._idle_since = None
+            self._schedule(self.busy_backoff_ms)
+            return
+        if self._idle_since is None:
+            self._idle_since = time.perf_counter()
+
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        worked = False
+        while time.perf_counter() < deadline:
+            # 1. Continuar el trabajo troceado de la última página construida
+            if self._steps is not None:
+                try:
+                    next(self._steps)
+                except StopIteration:
+                    self._steps = None
+                worked = True
+                continue
+
+            # 2. Construir la siguiente página (sin desbordar la caché del Canvas)
+            if not self.canvas.can_cache_more():
+                self.stop()
+                return
+            # Sin medición: solo al inicio de un tick y con el loop ocioso
+            key = self._next_key(allow_unmeasured=not worked and self._is_idle())
+            if key is None:
+                if not self._queue:
+                    return
+                if worked:
+                    break
+                # Solo quedan páginas sin medir: esperar a que el loop esté ocioso
+                self._schedule(self.busy_backoff_ms)
+                return
+
+            remaining_ms = (deadline - time.perf_counter()) * 1000
+            if worked and self._build_ms[key] > remaining_ms:
+                self._queue.insert(0, key)
+                break
+
+            started = time.perf_counter()
+            page = self.canvas.ensure_page(key)
+            self._record_build(key, (time.perf_counter() - started) * 1000)
+            worked = True
+            if hasattr(page, "prewarm_steps"):
+                self._steps = iter(page.prewarm_steps())
+
+        self._schedule(0)
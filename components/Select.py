@@ -1,14 +1,44 @@
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import QComboBox
 
+from services.icon_service import get_icon_service
+
+ARROW_SIZE = 24
+ARROW_MARGIN_RIGHT = 10
+
 
 class Select(QComboBox):
     """
     Componente personalizado de QComboBox que incluye sus propios estilos.
+    Las flechas se pintan con los pixmaps en memoria del IconService (re-teñidos
+    con el tema activo): un cambio de tema solo repinta, sin archivos en disco.
     """
 
     def __init__(self):
         super().__init__()
 
+        self._apply_style()
+        get_icon_service().color_changed.connect(self.update)
+
+    def paintEvent(self, event):
+        """El QSS dibuja la caja; la flecha (abajo, o arriba con la lista abierta) se pinta aquí."""
+        super().paintEvent(event)
+        name = "chevron_up.svg" if self.view().isVisible() else "chevron_down.svg"
+        pixmap = get_icon_service().pixmap(
+            name,
+            QSize(ARROW_SIZE, ARROW_SIZE),
+            self.devicePixelRatioF(),
+            disabled=not self.isEnabled(),
+        )
+        x = self.width() - ARROW_MARGIN_RIGHT - ARROW_SIZE
+        y = (self.height() - ARROW_SIZE) // 2
+        painter = QPainter(self)
+        painter.drawPixmap(x, y, pixmap)
+        painter.end()
+
+    def _apply_style(self):
+        """Aplica el QSS del componente (fijo: no depende del color de los iconos)."""
         self.setStyleSheet(
             """
         /* =============================================== */
@@ -42,16 +72,9 @@ class Select(QComboBox):
             border-bottom-right-radius: 6px;
         }
 
-        /* Flecha usando icono SVG */
+        /* La flecha la pinta Select.paintEvent con el icono del tema */
         QComboBox::down-arrow {
-            image: url(assets/icons/chevron_down.svg);
-            width: 24px;
-            height: 24px;
-            margin-right: 10px;
-        }
-
-        QComboBox::down-arrow:on {
-            image: url(assets/icons/chevron_up.svg);
+            image: none;
             width: 24px;
             height: 24px;
             margin-right: 10px;
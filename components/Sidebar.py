@@ -3,10 +3,8 @@ Componente principal del Sidebar.
 Maneja la lógica de navegación, animación de colapso/expansión y layout de botones.
 """
 
-import os
-
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 # 1. QtWidgets
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module, unused-import # noqa
@@ -17,6 +15,11 @@ from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module, unused-imp
     QScrollArea,
     QSizePolicy,
     QButtonGroup,
+    QListView,
+    QAbstractItemView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QStyle,
 )
 
 # 2. QtCore
@@ -26,6 +29,10 @@ from PySide6.QtCore import (  # pylint: disable=no-name-in-module, unused-import
     QEasingCurve,
     QSize,
     Signal,
+    QAbstractListModel,
+    QModelIndex,
+    QEvent,
+    QRect,
 )
 
 from PySide6.QtGui import (
@@ -35,6 +42,8 @@ from PySide6.QtGui import (
     QColor,
 )
 
+from services.icon_service import get_icon_service
+
 
 @dataclass
 class MenuItemProp:
@@ -42,18 +51,17 @@ class MenuItemProp:
 
     text: str  # Texto visible
     icon: str  # Nombre del archivo de icono
-    page_class: QWidget  # instancia
+    # Instancia ya construida, o clase/factory/ruta "modulo:Clase" para construirla al primer uso
+    page_class: Union[QWidget, Callable[[], QWidget], str]
     section: Literal["scroll", "fixed"] = (
         "scroll"  # valores opcionales: 'fixed' o 'scroll'
     )
+    key: Optional[str] = None  # ID único de la página (por defecto: text)
+    keywords: Tuple[str, ...] = ()  # Palabras extra para la búsqueda del Header
 
-
-# Helpers
-def get_icon_path(filename: str) -> str:
-    """Retorna la ruta absoluta al icono."""
-    # Sidebar.py está en components/, así que subimos un nivel para llegar a la raíz
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_dir, "assets", "icons", filename)
+    def __post_init__(self):
+        if self.key is None:
+            self.key = self.text
 
 
 class SidebarButton(QPushButton):
@@ -64,7 +72,7 @@ class SidebarButton(QPushButton):
     def __init__(self, icon_svg: str, text: str = ""):
         super().__init__()
         self.setObjectName("BtnSidebar")
-        self.icon_path = get_icon_path(icon_svg)
+        self.icon_name = icon_svg
 
         # Propiedades Visuales
         self.setIconSize(QSize(24, 24))
@@ -75,8 +83,8 @@ class SidebarButton(QPushButton):
         if text:
             self.setText(text)
 
-        # 2. Carga inicial
-        self.setIcon(QIcon(self.icon_path))
+        # 2. Carga inicial (icono compartido, se re-tiñe solo al cambiar el tema)
+        self.setIcon(get_icon_service().icon(icon_svg))
 
 
 class MenuButton(SidebarButton):
@@ -87,6 +95,10 @@ class MenuButton(SidebarButton):
         self.setFixedWidth(44)
         self.setCheckable(False)  # El botón de menú no debe quedarse presionado
 
+        # Iconos de ambos estados creados una sola vez (no en cada colapso)
+        self.icon_open = self.icon()
+        self.icon_closed = get_icon_service().icon("menu.svg")
+
 
 # ===============================
 # SCROLL AREA
@@ -127,6 +139,162 @@ class SidebarScrollArea(QScrollArea):
         self.widgetContent.setObjectName("ContentWidget")
 
 
+# ===============================
+# LISTA VIRTUALIZADA (Modelo / Vista)
+# ===============================
+
+
+class SidebarListModel(QAbstractListModel):
+    """
+    Modelo de los ítems de la sección scroll en modo virtualizado.
+    Guarda solo los MenuItemProp; los QIcon se comparten por nombre de archivo.
+    """
+
+    KeyRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[MenuItemProp] = []
+        self._rows_by_key: Dict[str, int] = {}
+        self._icons: Dict[str, QIcon] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return item.text
+        if role == Qt.DecorationRole:
+            return self._icons[item.icon]
+        if role == self.KeyRole:
+            return item.key
+        return None
+
+    def append_item(self, item: MenuItemProp) -> int:
+        """Agrega un ítem al final y retorna su fila."""
+        row = len(self._items)
+        if item.icon not in self._icons:
+            self._icons[item.icon] = get_icon_service().icon(item.icon)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(item)
+        self._rows_by_key[item.key] = row
+        self.endInsertRows()
+        return row
+
+    def row_of(self, key: str) -> int:
+        """Fila de la key, o -1 si no está en el modelo (O(1))."""
+        return self._rows_by_key.get(key, -1)
+
+    def key_at(self, row: int) -> str:
+        return self._items[row].key
+
+
+class SidebarItemDelegate(QStyledItemDelegate):
+    """
+    Delegate de la lista virtualizada: altura fija igual a SidebarButton (48px)
+    e icono de 24px. El fondo, los colores y los estados hover/checked los
+    pinta el estilo a partir de las reglas `#SidebarListView::item` de style.qss.
+    """
+
+    ROW_HEIGHT = 48
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        super().initStyleOption(option, index)
+        option.decorationSize = QSize(24, 24)
+        # Sin rectángulo de foco: el estado seleccionado ya marca el ítem activo
+        option.state &= ~QStyle.State_HasFocus
+
+
+class SidebarListView(QListView):
+    """
+    Vista de la sección scroll en modo virtualizado.
+    Solo pinta las filas visibles; con uniformItemSizes el layout no mide cada fila.
+    """
+
+    def __init__(self, model: SidebarListModel):
+        super().__init__()
+        self.setObjectName("SidebarListView")
+        self.setModel(model)
+        self.setItemDelegate(SidebarItemDelegate(self))
+
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setTextElideMode(Qt.ElideRight)
+        self.setIconSize(QSize(24, 24))
+        self.setFrameShape(QFrame.NoFrame)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setMouseTracking(True)  # Necesario para :hover en los ítems
+
+
+# ===============================
+# OVERLAY DE ANIMACIÓN
+# ===============================
+
+
+class SidebarOverlay(QWidget):
+    """
+    Captura del sidebar expandido que se anima por encima del contenido.
+    Solo cambia el área visible de la captura: el layout de la ventana no se toca.
+    """
+
+    def __init__(self, parent: QWidget, snapshot: QPixmap, fill_rest: bool):
+        """
+        Args:
+            snapshot: Captura del sidebar expandido.
+            fill_rest: Si es True, el ancho fijo del overlay se completa con el color de
+                fondo del sidebar más allá de lo revelado (colapso); si no, el overlay
+                crece con lo revelado y deja ver el contenido detrás (expansión).
+        """
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)  # La captura cubre todo lo que pinta
+        self._snapshot = snapshot
+        self._fill_rest = fill_rest
+        self._reveal = snapshot.width()
+
+        # Color de fondo: el margen derecho de la captura (antes del borde de 1px)
+        image = snapshot.toImage()
+        self._background = image.pixelColor(max(image.width() - 4, 0), image.height() // 2)
+
+    def set_reveal(self, width: int):
+        """Ancho visible de la captura (valor animado)."""
+        self._reveal = int(width)
+        if not self._fill_rest:
+            self.resize(self._reveal, self.height())
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        dpr = self._snapshot.devicePixelRatio()
+        height = self.height()
+        reveal = self._reveal
+
+        # Captura recortada a lo revelado + su borde derecho de 1px al final
+        painter.drawPixmap(
+            QRect(0, 0, reveal - 1, height),
+            self._snapshot,
+            QRect(0, 0, int((reveal - 1) * dpr), int(height * dpr)),
+        )
+        painter.drawPixmap(
+            QRect(reveal - 1, 0, 1, height),
+            self._snapshot,
+            QRect(int(self._snapshot.width() - dpr), 0, int(dpr), int(height * dpr)),
+        )
+        if self._fill_rest and reveal < self.width():
+            painter.fillRect(QRect(reveal, 0, self.width() - reveal, height), self._background)
+        painter.end()
+
+
 class ConfigButton(SidebarButton):
     """Botón de configuración situado en la parte inferior."""
 
@@ -143,9 +311,22 @@ class Sidebar(QFrame):
     # Señal para abrir configuración
     action_config = Signal()
 
-    def __init__(self):
+    def __init__(
+        self,
+        virtualized: bool = False,
+        collapse_mode: Literal["overlay", "layout"] = "overlay",
+    ):
+        """
+        Args:
+            virtualized: Si es True, la sección scroll usa una lista modelo/vista
+                (SidebarListView) en lugar de un botón por ítem. Recomendado para
+                cientos de páginas.
+            collapse_mode: Animación de colapso (ver handleCollapse).
+        """
         super().__init__()
         self.setObjectName("sidebarContainer")
+        self.virtualized = virtualized
+        self.collapse_mode = collapse_mode
 
         # Propiedades de ancho
         self.minWidth = 60
@@ -154,6 +335,11 @@ class Sidebar(QFrame):
 
         self.isAnimating = False
 
+        # Captura del estado expandido (modo overlay) y lo que la invalida
+        self._expanded_snapshot: Optional[QPixmap] = None
+        self._snapshot_key: tuple = ()
+        self._selection_version = 0
+
         # Layout principal
         self.mainLayout = QVBoxLayout(self)
         self.mainLayout.setObjectName("sidebar_content")
@@ -168,6 +354,15 @@ class Sidebar(QFrame):
         # Grupo de botones para selección exclusiva
         self.btnGroup = QButtonGroup(self)
         self.btnGroup.setExclusive(True)
+        # Un único slot para todos los botones: el id del grupo indexa _keys_by_id
+        self.btnGroup.idClicked.connect(self._on_button_clicked)
+        self.btnGroup.buttonToggled.connect(self._bump_selection_version)
+
+        # Registro O(1) de botones: por key, por instancia de página y por id del grupo
+        self._buttons_by_key: Dict[str, SidebarButton] = {}
+        self._keys_by_page: Dict[QWidget, str] = {}
+        self._pages_by_key: Dict[str, QWidget] = {}
+        self._keys_by_id: List[str] = []
 
         # Contenedor para botones fijos
         self.fixedLayout = QVBoxLayout()
@@ -177,7 +372,15 @@ class Sidebar(QFrame):
         # --------------------------------------------------
 
         # 3. Área de Scroll (Lista de opciones dinámica)
-        self.scrollArea = SidebarScrollArea()
+        if virtualized:
+            # Modo virtualizado: un solo widget pinta todas las filas
+            self.listModel = SidebarListModel(self)
+            self.scrollArea = SidebarListView(self.listModel)
+            self.scrollArea.clicked.connect(self._on_row_clicked)
+            self.scrollArea.selectionModel().currentChanged.connect(self._bump_selection_version)
+        else:
+            self.listModel = None
+            self.scrollArea = SidebarScrollArea()
         self.mainLayout.addWidget(self.scrollArea, 1)  # stretch priority 1
 
         # 4. Spacer Widget
@@ -196,14 +399,23 @@ class Sidebar(QFrame):
         """
         Agrega un botón al menú (Fixed o Scroll) y conecta la navegación.
         """
+        self._bump_selection_version()
+        if self.virtualized and item.section == "scroll":
+            self._add_list_item(item)
+            return
+
         # 1. Crear botón
         btn = SidebarButton(item.icon, item.text)
         # GUARDAR REFERENCIA PARA PROGRAMMATIC SELECTION
-        btn._page_instance = item.page_class
-        self.btnGroup.addButton(btn)
-        
+        btn._page_key = item.key
+        self._buttons_by_key[item.key] = btn
+        if isinstance(item.page_class, QWidget):
+            self.bind_page(item.key, item.page_class)
+        self.btnGroup.addButton(btn, len(self._keys_by_id))
+        self._keys_by_id.append(item.key)
+
         # Selección visual por defecto (si es el primero)
-        if len(self.btnGroup.buttons()) == 1:
+        if self._item_count() == 1:
             btn.setChecked(True)
 
         # 2. Agregar al layout correspondiente
@@ -223,30 +435,182 @@ class Sidebar(QFrame):
             else:
                 scroll_layout.addWidget(btn)
 
-        # 3. Conexión de señal
-        # Emitimos la instancia de la página directamente
-        btn.clicked.connect(lambda: self.action_navigate.emit(item.page_class))
+        # 3. Conexión de señal: btnGroup.idClicked -> _on_button_clicked (ver __init__)
 
-    def select_by_page_instance(self, page_instance):
+    def bind_page(self, key: str, page: Optional[QWidget]):
         """
-        Busca el botón asociado a esta instancia y lo marca como checked.
+        Asocia (o desasocia, con None) la instancia construida de una página a su key.
+        Interface lo conecta a Canvas.page_created / page_evicted.
         """
-        for btn in self.btnGroup.buttons():
-            if getattr(btn, "_page_instance", None) == page_instance:
-                btn.setChecked(True)
-                return
+        previous = self._pages_by_key.pop(key, None)
+        if previous is not None:
+            self._keys_by_page.pop(previous, None)
+        if page is not None:
+            self._pages_by_key[key] = page
+            self._keys_by_page[page] = key
+
+    def select_by_key(self, key: str) -> bool:
+        """Marca como checked el botón (o la fila) de la key (O(1)). Retorna False si no existe."""
+        btn = self._buttons_by_key.get(key)
+        if btn is not None:
+            btn.setChecked(True)
+            if self.listModel is not None:
+                self.scrollArea.clearSelection()
+            return True
 
+        row = self.listModel.row_of(key) if self.listModel is not None else -1
+        if row < 0:
+            return False
+        self._select_row(row)
+        return True
 
+    def select_by_page_instance(self, page_instance):
+        """
+        Busca el botón asociado a esta instancia (o key) y lo marca como checked.
+        """
+        if isinstance(page_instance, str):
+            self.select_by_key(page_instance)
+        else:
+            key = self._keys_by_page.get(page_instance)
+            if key is not None:
+                self.select_by_key(key)
+
+    # ---- MÉTODOS PRIVADOS (Auxiliares) ----
+
+    def _on_button_clicked(self, button_id: int):
+        # Emitimos la KEY: la página puede no existir todavía (lazy loading)
+        if self.listModel is not None:
+            self.scrollArea.clearSelection()
+        self.action_navigate.emit(self._keys_by_id[button_id])
+
+    def _on_row_clicked(self, index: QModelIndex):
+        self._uncheck_buttons()
+        self.action_navigate.emit(self.listModel.key_at(index.row()))
+
+    def _add_list_item(self, item: MenuItemProp):
+        """Modo virtualizado: el ítem es solo una fila del modelo (sin widget propio)."""
+        if isinstance(item.page_class, QWidget):
+            self.bind_page(item.key, item.page_class)
+        row = self.listModel.append_item(item)
+        if self._item_count() == 1:
+            self._select_row(row)
+
+    def _select_row(self, row: int):
+        """Selecciona la fila en la lista y quita el checked de los botones fijos."""
+        self._uncheck_buttons()
+        self.scrollArea.setCurrentIndex(self.listModel.index(row))
+
+    def _uncheck_buttons(self):
+        # Un grupo exclusivo no permite desmarcar su botón activo
+        checked = self.btnGroup.checkedButton()
+        if checked is not None:
+            self.btnGroup.setExclusive(False)
+            checked.setChecked(False)
+            self.btnGroup.setExclusive(True)
+
+    def _bump_selection_version(self, *_args):
+        self._selection_version += 1
+
+    def _item_count(self) -> int:
+        rows = self.listModel.rowCount() if self.listModel is not None else 0
+        return len(self._keys_by_id) + rows
 
     def handleCollapse(self):
         """
         Maneja la animación de colapso y expansión del sidebar.
-        Usa QVariantAnimation para modificar setFixedWidth directamente,
-        asegurando que el layout se fuerce a adaptar.
+
+        - collapse_mode "overlay": anima una captura (SidebarOverlay) por encima del
+          contenido y aplica el ancho final UNA sola vez al terminar; el Canvas no
+          se re-layoutea en cada frame. Expandir usa la captura del estado expandido
+          guardada al colapsar; si ya no es válida, se usa el modo "layout".
+        - collapse_mode "layout": QVariantAnimation modifica setFixedWidth en cada
+          frame, forzando al layout a adaptarse (re-layout de todo el contenido).
         """
         if self.isAnimating:
             return
 
+        collapsing = self.width() > 64
+        if self.collapse_mode == "overlay" and self.parentWidget() is not None:
+            if collapsing:
+                self._collapse_with_overlay()
+                return
+            if self._snapshot_is_valid():
+                self._expand_with_overlay()
+                return
+        self._animate_layout()
+
+    # ---- ANIMACIÓN (modo overlay) ----
+
+    def _collapse_with_overlay(self):
+        """Captura el estado expandido, pasa el sidebar real a colapsado y encoge la captura."""
+        self.isAnimating = True
+        self._expanded_snapshot = self.grab()
+        self._snapshot_key = self._current_snapshot_key()
+
+        self._set_collapsed_state(True)
+        self._run_overlay(self.width(), 64, fill_rest=True)
+
+    def _expand_with_overlay(self):
+        """Despliega la captura expandida sobre el contenido; el layout cambia al final."""
+        self.isAnimating = True
+        self._run_overlay(self.width(), 200, fill_rest=False)
+
+    def _run_overlay(self, start: int, end: int, fill_rest: bool):
+        overlay = SidebarOverlay(self.parentWidget(), self._expanded_snapshot, fill_rest)
+        overlay.setGeometry(self.geometry().x(), self.geometry().y(), max(start, end), self.height())
+        overlay.set_reveal(start)
+        overlay.show()
+        overlay.raise_()
+
+        self.animation = QVariantAnimation()
+        self.animation.setStartValue(start)
+        self.animation.setEndValue(end)
+        self.animation.setDuration(300)
+        self.animation.setEasingCurve(QEasingCurve.InOutQuart)
+        self.animation.valueChanged.connect(overlay.set_reveal)
+
+        def onFinished():
+            # Único cambio de geometría: el layout principal se recalcula una vez
+            if end > start:
+                self._set_collapsed_state(False)
+            self.setFixedWidth(end)
+            overlay.hide()
+            overlay.deleteLater()
+            self.isAnimating = False
+
+        self.animation.finished.connect(onFinished)
+        self.animation.start()
+
+    def _set_collapsed_state(self, collapsed: bool):
+        """Muestra/oculta la lista y cambia el icono del menú (sin tocar el ancho)."""
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setVisible(not collapsed)
+        self.spacer.setVisible(collapsed)
+        self.btnMenu.setIcon(self.btnMenu.icon_closed if collapsed else self.btnMenu.icon_open)
+
+    def _current_snapshot_key(self) -> tuple:
+        """Lo que, si cambia, deja desactualizada la captura del estado expandido."""
+        return (self.height(), self._selection_version, get_icon_service().color)
+
+    def _snapshot_is_valid(self) -> bool:
+        return (
+            self._expanded_snapshot is not None
+            and self._snapshot_key == self._current_snapshot_key()
+        )
+
+    def changeEvent(self, event):
+        # Cambio de tema/fuente: la captura ya no coincide con lo que se vería
+        if event.type() in (QEvent.StyleChange, QEvent.PaletteChange, QEvent.FontChange):
+            self._expanded_snapshot = None
+        super().changeEvent(event)
+
+    # ---- ANIMACIÓN (modo layout) ----
+
+    def _animate_layout(self):
+        """
+        Usa QVariantAnimation para modificar setFixedWidth directamente,
+        asegurando que el layout se fuerce a adaptar.
+        """
         self.isAnimating = True
         currentWidth = self.width()
 
@@ -258,16 +622,12 @@ class Sidebar(QFrame):
         if currentWidth > 64:
             # COLAPSANDO
             targetWidth = 64
-            self.scrollArea.hide()
-            self.spacer.show()
-            self.btnMenu.setIcon(QIcon(get_icon_path("menu.svg")))
+            self._set_collapsed_state(True)
         else:
             # EXPANDIENDO
             targetWidth = 200
             # Preparamos UI para expandir
-            self.spacer.hide()
-            self.scrollArea.show()
-            self.btnMenu.setIcon(QIcon(get_icon_path("menu_open.svg")))
+            self._set_collapsed_state(False)
             # Opcional: Si quisieras scroll horizontal al expandir, lo activas aquí.
             # Pero para un sidebar limpio, mejor dejarlo off siempre o AsNeeded.
             # self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -1,17 +1,58 @@
 import sys
 
-# 3rd Party
-from PySide6.QtWidgets import QApplication, QWidget
+# El profiler se importa primero para medir también las importaciones
+from utils.startup_profiler import profiler
 
-# Local
-from main_ui import Interface
-from styles.themes import ThemeManager, ThemeType
-from components.Sidebar import MenuItemProp
+with profiler.phase("imports"):
+    # 3rd Party
+    with profiler.phase("import PySide6"):
+        from PySide6.QtWidgets import QApplication, QWidget
+        from PySide6.QtCore import QTimer
 
-# Importar páginas (Nueva estructura)
-from pages.main.Home_page import HomePage
-from pages.main.Demo_page import DemoPage
-from pages.config.General_config import GeneralConfigPage
+    # Local
+    with profiler.phase("import main_ui"):
+        from main_ui import Interface
+    from styles.themes import ThemeManager, ThemeType
+    from components.Sidebar import MenuItemProp
+    from components.Canvas import PageCachePolicy
+
+# =============================================================================
+# CONFIGURACIÓN DECLARATIVA
+# =============================================================================
+# Las páginas se declaran con su ruta "modulo:Clase": el módulo (y sus
+# dependencias pesadas, ej. google.genai en Demo) se importa recién cuando la
+# página se necesita por primera vez.
+
+MAIN_MENU_CONFIG = [
+    MenuItemProp(
+        key="home",
+        text="Home",
+        icon="home.svg",
+        page_class="pages.main.Home_page:HomePage",
+        section="fixed",
+    ),
+    # 'code.svg' no existía, cambiamos a 'html.svg' que sí existe
+    MenuItemProp(
+        key="demo",
+        text="Demo",
+        icon="html.svg",
+        page_class="pages.main.Demo_page:DemoPage",
+        keywords=("chat", "gemini", "ia"),
+    ),
+]
+
+CONFIG_MENU_CONFIG = [
+    {
+        "key": "general",
+        "text": "General",
+        "page_class": "pages.config.General_config:GeneralConfigPage",
+        "keywords": ("tema", "apariencia"),
+    },
+]
+
+# Espera tras mostrar la ventana antes de abrir la conexión con la IA en segundo
+# plano (así no compite con la primera pintura)
+GENAI_WARMUP_DELAY_MS = 500
 
 # =============================================================================
 # CONTROLADOR PRINCIPAL
@@ -19,38 +60,74 @@ from pages.config.General_config import GeneralConfigPage
 
 
 class Ventana(Interface):
-    def __init__(self):
+    def __init__(self, theme_manager: ThemeManager):
         super().__init__()
+        self.theme_manager = theme_manager
 
-        # 2. Registrar Páginas
-        # Usamos la sintaxis directa: registramos y guardamos la referencia en una sola línea
-        self.homePage = self.register_page(
-            MenuItemProp("Home", "home.svg", HomePage(), "fixed")
-        )
-
-        # 'code.svg' no existía, cambiamos a 'html.svg' que sí existe
-        self.demoPage = self.register_page(
-            MenuItemProp("Demo", "html.svg", DemoPage(), "scroll")
-        )
+        # 1. Política de memoria: las páginas ocultas menos usadas se destruyen
+        # y se reconstruyen (restaurando su estado) al volver a visitarlas.
+        self.Canvas.set_cache_policy(PageCachePolicy(max_pages=8))
 
-        self.navigate_to(self.demoPage)
+        # 2. Registrar Páginas y Configuración
+        self._inicializar_paginas()
 
-        # 3. Registrar Configuración
-        self.generalConfigPage = self.register_config(
-            "General", GeneralConfigPage()
-        )
+        self.navigate_to("demo")
 
         # Opcional: Probar navegación a config
-        # self.navigate_to_config(self.generalConfigPage)
+        # self.navigate_to_config("general")
+
+    def showEvent(self, event):
+        """
+        Precalienta la conexión con la IA (el primer mensaje no paga el handshake) y
+        renueva en segundo plano el catálogo de modelos si está vencido.
+        """
+        super().showEvent(event)
+        QTimer.singleShot(GENAI_WARMUP_DELAY_MS, self._warm_up_genai)
+
+    def on_config_page_created(self, key: str, page):
+        """Conecta las páginas de configuración cuando se construyen."""
+        if key == "general":
+            page.check_stall_watchdog.setChecked(self.stall_watchdog.enabled)
+            page.stall_watchdog_toggled.connect(self.stall_watchdog.set_enabled)
+            page.set_current_theme(self.theme_manager.current_theme)
+            page.theme_selected.connect(
+                lambda theme: self.apply_theme(self.theme_manager, ThemeType(theme))
+            )
+
+    def _warm_up_genai(self):
+        # El cliente de IA (y el .env) se importan recién aquí: no suman al arranque
+        from services.genai_client import warm_up_in_background
+        from services.model_catalog import shared_catalog
+
+        warm_up_in_background()
+        shared_catalog().refresh_in_background()
+
+    def _inicializar_paginas(self):
+        """Registra en la UI las páginas declaradas en MAIN_MENU_CONFIG y CONFIG_MENU_CONFIG."""
+        for item in MAIN_MENU_CONFIG:
+            self.register_page(item)
+
+        for entry in CONFIG_MENU_CONFIG:
+            self.register_config(
+                entry["text"],
+                entry["page_class"],
+                key=entry["key"],
+                keywords=entry.get("keywords", ()),
+            )
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    # Perfil de arranque: python main.py --profile-startup  (o APP_PROFILE_STARTUP=1)
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
 
     initial_theme = ThemeType.GRAY
     theme_manager = ThemeManager(initial_theme)
     theme_manager.apply_theme(initial_theme)
 
-    windows = Ventana()
-    windows.show()
+    with profiler.phase("Ventana.__init__"):
+        windows = Ventana(theme_manager)
+    profiler.watch_first_paint(windows)
+    with profiler.phase("Ventana.show"):
+        windows.show()
     sys.exit(app.exec())
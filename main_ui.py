@@ -1,7 +1,7 @@
 """Interfaz principal de la app"""
 
 from dataclasses import dataclass
-from typing import Literal, List
+from typing import Iterable, Literal, List, Optional, Union
 
 # 1. QtWidgets
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module, unused-import # noqa
@@ -12,23 +12,34 @@ from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module, unused-imp
 )
 
 from components.Sidebar import Sidebar, MenuItemProp
-from components.Canvas import Canvas
+from components.Canvas import Canvas, PageSource
+from components.Prewarmer import PagePrewarmer
 from components.Header import Header
 from components.Configuracion import Configuracion
+from styles.themes import ThemeManager, ThemeType
+from utils.startup_profiler import profiler
+from utils.stall_watchdog import StallWatchdog, watchdog_requested
 
 
 class Interface(QMainWindow):
-    def __init__(self):
+    def __init__(self, virtual_sidebar: bool = False):
         """
         Inicializa la ventana principal de la app.
 
+        Args:
+            virtual_sidebar: Usa la lista virtualizada del Sidebar (para cientos de páginas).
+
         Métodos principales de navegación:
         - register_page(item): Registra una página en el Sidebar y el Canvas.
         - navigate_to(page): Navega programáticamente a una página específica.
+        - get_page(key): Retorna la instancia de una página (construyéndola si es perezosa).
+
+        La barra de búsqueda del Header indexa todo lo registrado (texto, keywords
+        y `search_keywords` de las páginas) y navega con Enter.
 
         Métodos de configuración:
-        - register_config(name, widget): Registra una página en la ventana de configuración.
-        - navigate_to_config(widget): Abre la config y navega a la página.
+        - register_config(name, widget, key): Registra una página en la ventana de configuración.
+        - navigate_to_config(widget): Abre la config y navega a la página (instancia o key).
         """
         super().__init__()
         self.setWindowTitle("mi app")
@@ -47,7 +58,7 @@ class Interface(QMainWindow):
         # ---------------------------------------------------------
         # 1. EL SIDEBAR (Izquierda)
         # ---------------------------------------------------------
-        self.sidebar = Sidebar()
+        self.sidebar = Sidebar(virtualized=virtual_sidebar)
         self.layout_main.addWidget(self.sidebar)
 
         # ---------------------------------------------------------
@@ -70,86 +81,149 @@ class Interface(QMainWindow):
         self.layout_main.addWidget(right_container)
 
         # 3. Conexión de Navegación Automática
-        # Conexión directa: El Sidebar emite la instancia -> Canvas la muestra
+        # Conexión directa: El Sidebar emite la key -> Canvas la construye (si hace falta) y la muestra
         self.sidebar.action_navigate.connect(self.Canvas.set_current_page)
+        self.Canvas.page_created.connect(self.on_page_created)
+        self.Canvas.page_created.connect(self.sidebar.bind_page)
+        self.Canvas.page_evicted.connect(lambda key: self.sidebar.bind_page(key, None))
+
+        # Búsqueda del Header: Enter navega a la página o a la configuración elegida
+        self.header.command_palette.command_selected.connect(self._on_command_selected)
+        self.Canvas.page_created.connect(self._index_page_keywords)
+
+        # Pre-construcción de páginas perezosas mientras la app está ociosa
+        self.prewarmer = PagePrewarmer(self.Canvas, parent=self)
+
+        # Detector de bloqueos del event loop (opt-in: configuración general o APP_STALL_WATCHDOG=1)
+        self.stall_watchdog = StallWatchdog(parent=self)
+        self.Canvas.current_page_changed.connect(self.stall_watchdog.set_current_page)
 
         # 4. Configuración
         self.config_window = Configuracion()
+        self.config_window.page_created.connect(self.on_config_page_created)
         self.sidebar.action_config.connect(self.show_config)
 
-    def register_page(self, item: MenuItemProp) -> QWidget:
+    def register_page(self, item: MenuItemProp) -> Union[QWidget, str]:
         """
         Registra una nueva página en el sistema de navegación de la aplicación.
 
         Este método realiza dos acciones principales:
         1. Crea un botón en el Sidebar utilizando las propiedades proporcionadas (texto, icono, sección).
-        2. Agrega la instancia de la página al `QStackedWidget` del Canvas.
+        2. Agrega la página al `QStackedWidget` del Canvas.
+
+        Si `item.page_class` es una clase o factory, la página NO se construye aquí:
+        el Canvas guarda un placeholder liviano y la instancia se crea la primera vez
+        que se navega a ella (ver `on_page_created`).
 
         Si es la primera página registrada, se establece automáticamente como la página visible.
 
         Args:
             item (MenuItemProp): Objeto que contiene la configuración de la página 
-                                 (texto, icono, instancia de la página, sección).
+                                 (texto, icono, instancia/clase de la página, sección, key).
 
         Returns:
-            QWidget: La instancia de la página registrada. Útil para encadenar asignaciones.
+            QWidget | str: La instancia si se registró una instancia; la key si la página
+                           es perezosa. Ambas sirven para `navigate_to`.
         """
-        # 1. Agregar botón al Sidebar
-        self.sidebar.add_menu_item(item)
+        with profiler.phase(f"register_page: {item.key}"):
+            # 1. Agregar botón al Sidebar
+            self.sidebar.add_menu_item(item)
 
-        # 2. Agregar página al Canvas
-        self.Canvas.add_page(item.page_class)
+            # 2. Agregar página al Canvas (la primera queda como actual automáticamente)
+            self.Canvas.add_page(item.page_class, item.key)
+            self.prewarmer.add_page(item.key, fixed=item.section == "fixed")
 
-        # Opcional: Establecer como actual si es la primera
-        if self.Canvas.stack.count() == 1:
-            self.Canvas.set_current_page(item.page_class)
+            # 3. Indexar para la búsqueda del Header
+            self.header.command_palette.add_entry("page", item.key, item.text, item.keywords)
 
-        return item.page_class
+        if isinstance(item.page_class, QWidget):
+            return item.page_class
+        return item.key
 
-    def navigate_to(self, page: QWidget):
+    def navigate_to(self, page: Union[QWidget, str]):
         """
         Realiza la navegación programática a una página específica.
 
         Sincroniza el estado visual de la aplicación:
-        1. Busca y selecciona el botón del Sidebar asociado a la instancia de la página.
-        2. Cambia la página visible en el Canvas.
+        1. Busca y selecciona el botón del Sidebar asociado a la página.
+        2. Cambia la página visible en el Canvas (construyéndola si es perezosa).
 
         Args:
-            page (QWidget): La instancia de la página a la que se desea navegar.
-                            Debe haber sido registrada previamente con `register_page`.
+            page (QWidget | str): La instancia o la key de la página a la que se desea navegar.
+                                  Debe haber sido registrada previamente con `register_page`.
         """
+        key = self.Canvas.key_of(page)
+        if key is None:
+            print("⚠️ Error: La página no fue registrada con register_page.")
+            return
+
         # 1. Sincronizar Sidebar
-        self.sidebar.select_by_page_instance(page)
+        self.sidebar.select_by_key(key)
         
         # 2. Cambiar página
-        self.Canvas.set_current_page(page)
+        self.Canvas.set_current_page(key)
+
+    def get_page(self, key: str) -> QWidget:
+        """
+        Retorna la instancia de una página registrada, construyéndola si aún no existe.
 
-    def register_config(self, name: str, widget: QWidget) -> QWidget:
+        Args:
+            key (str): La key con la que se registró la página.
+        """
+        return self.Canvas.ensure_page(key)
+
+    def on_page_created(self, key: str, page: QWidget):
+        """
+        Hook que se ejecuta cuando una página perezosa se construye por primera vez.
+
+        Como las páginas no existen hasta que se visitan, las conexiones de señales
+        entre módulos deben hacerse aquí. Las subclases (ej. `Ventana`) lo sobrescriben.
+
+        Args:
+            key (str): La key de la página.
+            page (QWidget): La instancia recién creada.
+        """
+
+    def register_config(
+        self,
+        name: str,
+        widget: PageSource,
+        key: Optional[str] = None,
+        keywords: Iterable[str] = (),
+    ) -> Union[QWidget, str]:
         """
         Registra una página en la ventana de configuración.
 
         Args:
             name (str): Nombre visible en la lista lateral de configuración.
-            widget (QWidget): Instancia de la página de configuración.
+            widget (QWidget | clase | str): Instancia de la página de configuración, o
+                                            clase/factory/ruta "modulo:Clase" para crearla
+                                            la primera vez que se muestre.
+            key (str, opcional): ID único de la página (por defecto, `name`).
+            keywords (Iterable[str], opcional): Palabras extra para la búsqueda del Header.
 
         Returns:
-            QWidget: La misma instancia del widget, para encadenamiento.
+            QWidget | str: La instancia si se registró una instancia; si no, la key.
         """
-        self.config_window.add_config_page(name, widget)
-        return widget
-
-    def navigate_to_config(self, widget: QWidget):
+        with profiler.phase(f"register_config: {name}"):
+            key = self.config_window.add_config_page(name, widget, key)
+            self.header.command_palette.add_entry("config", key, name, keywords)
+        if isinstance(widget, QWidget):
+            return widget
+        return key
+
+    def navigate_to_config(self, widget: Union[QWidget, str]):
         """
         Abre la ventana de configuración y navega a la página especificada.
         
         Args:
-            widget (QWidget): La instancia de la página de configuración a mostrar.
+            widget (QWidget | str): La instancia o la key de la página de configuración a mostrar.
         """
         # 1. Asegurar que la ventana es visible
         self.show_config()
         
         # 2. Buscar el índice del widget en el stack de config
-        index = self.config_window.stack.indexOf(widget)
+        index = self.config_window.index_of(widget)
         
         if index >= 0:
             # 3. Seleccionar en la lista (esto dispara el cambio de página en el stack)
@@ -157,6 +231,28 @@ class Interface(QMainWindow):
         else:
             print(f"⚠️ Error: La página de configuración no fue encontrada en el stack.")
 
+    def on_config_page_created(self, key: str, page: QWidget):
+        """
+        Hook equivalente a `on_page_created` para las páginas de configuración perezosas.
+
+        Args:
+            key (str): La key de la página de configuración.
+            page (QWidget): La instancia recién creada.
+        """
+
+    def _on_command_selected(self, kind: str, key: str):
+        """Navega al resultado elegido en la búsqueda del Header."""
+        if kind == "config":
+            self.navigate_to_config(key)
+        else:
+            self.navigate_to(key)
+
+    def _index_page_keywords(self, key: str, page: QWidget):
+        """Las páginas pueden declarar `search_keywords`; se indexan al construirse."""
+        keywords = getattr(page, "search_keywords", None)
+        if keywords:
+            self.header.command_palette.add_keywords("page", key, keywords)
+
     def show_config(self):
         """Muestra la ventana de configuración o la trae al frente si ya existe."""
         if self.config_window.isVisible():
@@ -169,8 +265,31 @@ class Interface(QMainWindow):
         else:
             self.config_window.show()
 
+    def apply_theme(self, theme_manager: ThemeManager, theme_type: ThemeType):
+        """
+        Cambia el tema re-estilizando solo lo visible.
+
+        Las páginas ocultas del Canvas se marcan como stale (quedan fuera del árbol
+        de widgets) y se re-estilizan de forma perezosa cuando `set_current_page`
+        las vuelve a mostrar. Con 20+ páginas pesadas el cambio es instantáneo.
+
+        Args:
+            theme_manager (ThemeManager): Gestor de temas de la app.
+            theme_type (ThemeType): Tema a aplicar.
+        """
+        self.Canvas.mark_hidden_pages_stale()
+        theme_manager.apply_theme(theme_type, scope=[self, self.config_window])
+
+    def showEvent(self, event):
+        """Arranca el pre-construido de páginas (y el detector de bloqueos, si está activo)."""
+        super().showEvent(event)
+        self.prewarmer.start()
+        if watchdog_requested():
+            self.stall_watchdog.start()
+
     def closeEvent(self, event):
         """Asegura que las ventanas hijas se cierren al cerrar la principal."""
         if self.config_window:
             self.config_window.close()
+        self.stall_watchdog.stop()
         super().closeEvent(event)
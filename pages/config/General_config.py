@@ -1,7 +1,15 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QCheckBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
+
+from components.Select import Select
+from styles.themes import ThemeType
 
 class GeneralConfigPage(QWidget):
+    # Activar/desactivar el detector de bloqueos del event loop (lo conecta main.py)
+    stall_watchdog_toggled = Signal(bool)
+    # Tema elegido (valor de ThemeType; lo conecta main.py)
+    theme_selected = Signal(str)
+
     def __init__(self):
         super().__init__()
         
@@ -13,6 +21,16 @@ class GeneralConfigPage(QWidget):
         title = QLabel("Configuración General")
         title.setStyleSheet("font-size: 20px; font-weight: bold;")
         layout.addWidget(title)
+
+        # Apariencia
+        layout.addWidget(QLabel("Tema"))
+        self.select_theme = Select()
+        for theme in ThemeType:
+            self.select_theme.addItem(theme.value.capitalize(), theme.value)
+        self.select_theme.currentIndexChanged.connect(
+            lambda index: self.theme_selected.emit(self.select_theme.itemData(index))
+        )
+        layout.addWidget(self.select_theme)
         
         # Opciones de ejemplo
         self.check_updates = QCheckBox("Buscar actualizaciones automáticamente")
@@ -21,5 +39,19 @@ class GeneralConfigPage(QWidget):
         
         self.check_analytics = QCheckBox("Enviar datos de uso anónimos")
         layout.addWidget(self.check_analytics)
+
+        # Diagnóstico
+        self.check_stall_watchdog = QCheckBox("Detectar bloqueos de la interfaz (diagnóstico)")
+        self.check_stall_watchdog.setToolTip(
+            "Registra en la consola los bloqueos de más de 50 ms con la página y el código responsable."
+        )
+        self.check_stall_watchdog.toggled.connect(self.stall_watchdog_toggled.emit)
+        layout.addWidget(self.check_stall_watchdog)
         
         layout.addStretch()
+
+    def set_current_theme(self, theme: ThemeType):
+        """Muestra `theme` como seleccionado sin emitir `theme_selected`."""
+        self.select_theme.blockSignals(True)
+        self.select_theme.setCurrentIndex(self.select_theme.findData(theme.value))
+        self.select_theme.blockSignals(False)
@@ -1,44 +1,27 @@
 import logging
+import time
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
     QLineEdit,
     QPushButton,
     QLabel,
     QProgressBar,
 )
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtGui import QFont
 
 # Importamos el servicio
 from services.genai_service import GenAIService
+from services.genai_executor import PRIORITY_HIGH, shared_executor
+from components.ChatTranscript import ChatTranscript
 
 # Configuración básica de logging
 logging.basicConfig(level=logging.INFO)
 
-
-class ChatWorker(QThread):
-    """
-    Worker thread to handle API calls asynchronously.
-    """
-
-    response_received = Signal(str)
-    error_occurred = Signal(str)
-
-    def __init__(self, chat_session, text):
-        super().__init__()
-        self.chat_session = chat_session
-        self.text = text
-
-    def run(self):
-        try:
-            # Enviar mensaje usando la sesión de chat (mantiene historial)
-            response = self.chat_session.send_message(self.text)
-            self.response_received.emit(response.text)
-        except Exception as e:
-            self.error_occurred.emit(str(e))
+# Los fragmentos del streaming se agrupan: como máximo una actualización de la UI por frame
+STREAM_FLUSH_MS = 16
 
 
 class DemoPage(QWidget):
@@ -48,12 +31,30 @@ class DemoPage(QWidget):
         # --- Configuración del Servicio ---
         try:
             self.service = GenAIService()
-            self.chat_session = self.service.chat_session()
+            # El más rápido medido en sesiones anteriores (catálogo en disco, sin red)
+            self.service.select_model()
+            # Historial acotado: ventana de turnos recientes + resumen de los viejos
+            self.chat_session = self.service.managed_chat_session()
             self.service_ready = True
         except Exception as e:
             self.service_ready = False
             logging.error(f"Error initializing GenAI: {e}")
 
+        # Las llamadas van al ejecutor compartido (hilos reutilizados, cola con prioridades)
+        self.executor = shared_executor()
+        self.request = None
+
+        # Streaming: fragmentos pendientes de pintar y métricas de la respuesta en curso
+        self._pending_chunks = []
+        self._stream_started = 0.0
+        self._first_chunk_ms = None
+        self.ttft_history = []  # time-to-first-token (ms) de cada respuesta
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(STREAM_FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush_chunks)
+
         # --- UI Setup ---
         self.setup_ui()
 
@@ -74,12 +75,11 @@ class DemoPage(QWidget):
         title.setFont(QFont("Arial", 16, QFont.Bold))
         layout.addWidget(title)
 
-        # Área de Historial del Chat
-        self.chat_history = QTextEdit()
-        self.chat_history.setReadOnly(True)
+        # Área de Historial del Chat (virtualizada: solo se pintan las burbujas visibles)
+        self.chat_history = ChatTranscript()
         self.chat_history.setStyleSheet(
             """
-            QTextEdit {
+            #ChatTranscript {
                 background-color: #2b2b2b;
                 color: #e0e0e0;
                 border: 1px solid #3d3d3d;
@@ -144,6 +144,28 @@ class DemoPage(QWidget):
 
         layout.addLayout(input_layout)
 
+    # -------------------------------------------------------------------------
+    # PROTOCOLO DE CACHÉ DEL CANVAS (ver PageCachePolicy)
+    # -------------------------------------------------------------------------
+    def can_evict(self) -> bool:
+        """No permitir el desalojo mientras hay una petición en cola o en curso."""
+        return self.request is None or not self.request.is_pending()
+
+    def save_state(self) -> dict:
+        """Conserva el historial, el texto pendiente y la sesión de chat."""
+        return {
+            "messages": self.chat_history.messages(),
+            "input_text": self.input_field.text(),
+            "chat_session": self.chat_session if self.service_ready else None,
+        }
+
+    def restore_state(self, state: dict):
+        """Restaura el estado guardado por `save_state` tras reconstruir la página."""
+        self.chat_history.set_messages(state["messages"])
+        self.input_field.setText(state["input_text"])
+        if state["chat_session"] is not None and self.service_ready:
+            self.chat_session = state["chat_session"]
+
     def send_message(self):
         if not self.service_ready:
             return
@@ -159,54 +181,69 @@ class DemoPage(QWidget):
         self.send_btn.setDisabled(True)
         self.progress_bar.show()
 
-        # Start Worker
-        self.worker = ChatWorker(self.chat_session, text)
-        self.worker.response_received.connect(self.on_response_received)
-        self.worker.error_occurred.connect(self.on_error_occurred)
-        self.worker.finished.connect(self.on_worker_finished)
-        self.worker.start()
+        # Enviar al ejecutor compartido (el usuario está esperando: prioridad alta)
+        self._stream_started = time.perf_counter()
+        self._first_chunk_ms = None
+        self.request = self.executor.submit(
+            self.service.send_message_stream,
+            self.chat_session,
+            text,
+            priority=PRIORITY_HIGH,
+            label="demo.chat",
+        )
+        self.request.chunk_received.connect(self.on_chunk_received)
+        self.request.result_ready.connect(self.on_response_received)
+        self.request.error_occurred.connect(self.on_error_occurred)
+        self.request.finished.connect(self.on_request_finished)
 
     @Slot(str)
+    def on_chunk_received(self, chunk):
+        """Acumula el fragmento; el timer lo pinta junto con los que lleguen en el mismo frame."""
+        if self._first_chunk_ms is None:
+            self._first_chunk_ms = (time.perf_counter() - self._stream_started) * 1000
+            self.ttft_history.append(self._first_chunk_ms)
+            logging.info(f"DemoPage: primer token en {self._first_chunk_ms:.0f} ms")
+            self.progress_bar.hide()
+            self.append_ai_message("")
+        self._pending_chunks.append(chunk)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_chunks(self):
+        """Agrega a la última burbuja el texto acumulado (una sola actualización de la vista)."""
+        if not self._pending_chunks:
+            return
+        text = "".join(self._pending_chunks)
+        self._pending_chunks.clear()
+        self.chat_history.append_to_last(text)
+
+    @Slot(object)
     def on_response_received(self, response_text):
-        self.append_ai_message(response_text)
+        self._flush_timer.stop()
+        if self._first_chunk_ms is None:
+            # Respuesta vacía: no hubo fragmentos
+            self.append_ai_message(response_text)
+        self.flush_chunks()
 
     @Slot(str)
     def on_error_occurred(self, error_text):
+        # Lo recibido antes del fallo va a la burbuja de la IA, no a la del error
+        self._flush_timer.stop()
+        self.flush_chunks()
         self.append_system_message(f"Error: {error_text}")
 
     @Slot()
-    def on_worker_finished(self):
+    def on_request_finished(self):
         self.input_field.setDisabled(False)
         self.send_btn.setDisabled(False)
         self.input_field.setFocus()
         self.progress_bar.hide()
 
     def append_user_message(self, text):
-        formatted = f"""
-        <div style="margin-bottom: 10px; text-align: right;">
-            <span style="background-color: #0078d4; color: white; padding: 5px 10px; border-radius: 10px;">
-                <b>Tú:</b> {text}
-            </span>
-        </div>
-        """
-        self.chat_history.append(formatted)
+        self.chat_history.append_message("user", text)
 
     def append_ai_message(self, text):
-        # Convert markdown-like breaks to html if needed, but simple text works
-        text = text.replace("\n", "<br>")
-        formatted = f"""
-        <div style="margin-bottom: 15px; text-align: left;">
-            <span style="background-color: #3d3d3d; color: #e0e0e0; padding: 5px 10px; border-radius: 10px;">
-                <b>Gemini:</b> {text}
-            </span>
-        </div>
-        """
-        self.chat_history.append(formatted)
+        self.chat_history.append_message("ai", text)
 
     def append_system_message(self, text):
-        formatted = f"""
-        <div style="margin-bottom: 10px; text-align: center; color: #888;">
-            <i>{text}</i>
-        </div>
-        """
-        self.chat_history.append(formatted)
+        self.chat_history.append_message("system", text)
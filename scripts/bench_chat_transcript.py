@@ -0,0 +1,102 @@
+"""
+Costo por mensaje agregado al transcript del chat (components/ChatTranscript.py).
+
+Agrega N mensajes (por defecto 10.000) con la vista visible, pintando después de
+cada uno como en una sesión real, y reporta por lote de 1.000 el costo medio de
+agregar y de pintar.
+Compara con el QTextEdit que usaba DemoPage antes (HTML por mensaje) en los
+primeros mensajes. El costo del transcript debe mantenerse plano.
+
+Uso: python scripts/bench_chat_transcript.py [mensajes] [mensajes_qtextedit]
+"""
+
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QTextEdit  # noqa: E402
+
+from components.ChatTranscript import ChatTranscript  # noqa: E402
+
+BATCH = 1000
+SAMPLE = (
+    "Esta es una respuesta de ejemplo con varias oraciones para que la burbuja "
+    "ocupe más de una línea. Incluye un salto de línea\ny algo más de texto. "
+)
+
+
+def message(i: int):
+    role = ("user", "ai", "system")[i % 3]
+    return role, f"{i}: " + SAMPLE * (1 + i % 4)
+
+
+def run(widget, append, total: int):
+    """Retorna, por lote, el costo medio (µs) por mensaje: (agregar, pintar)."""
+    app = QApplication.instance()
+    widget.resize(700, 500)
+    widget.show()
+    app.processEvents()  # Hasta exponerse, repaint() no pinta nada
+    batches = []
+    for start in range(0, total, BATCH):
+        add = paint = 0.0
+        for i in range(start, min(start + BATCH, total)):
+            started = time.perf_counter()
+            append(*message(i))
+            add += time.perf_counter() - started
+            started = time.perf_counter()
+            widget.viewport().repaint()
+            paint += time.perf_counter() - started
+        batches.append((add / BATCH * 1e6, paint / BATCH * 1e6))
+        app.processEvents()
+    return batches
+
+
+def report(batches):
+    for n, (add, paint) in enumerate(batches):
+        print(
+            f"  mensajes {n * BATCH:6}-{(n + 1) * BATCH - 1:6}: "
+            f"agregar {add:7.1f} µs | pintar {paint:7.1f} µs"
+        )
+
+
+def html_append(edit: QTextEdit):
+    """Append equivalente al DemoPage anterior (un bloque HTML por mensaje)."""
+    def append(role, text):
+        edit.append(
+            f'<div style="margin-bottom: 10px;"><span style="background-color: #3d3d3d;">'
+            f"<b>{role}:</b> {text}</span></div>"
+        )
+    return append
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    total_html = int(sys.argv[2]) if len(sys.argv) > 2 else 3_000
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    transcript = ChatTranscript(memory_cap=2000)
+    batches = run(transcript, transcript.append_message, total)
+    print(f"ChatTranscript: {total} mensajes, {transcript.store.spilled} paginados a disco")
+    report(batches)
+    # El primer lote todavía está llenando el viewport: se compara contra el segundo
+    first = batches[min(1, len(batches) - 1)]
+    for name, column in (("agregar", 0), ("pintar", 1)):
+        ratio = batches[-1][column] / first[column]
+        print(f"  {name}: último lote / segundo lote = {ratio:.2f}x "
+              f"{'(plano)' if ratio < 1.5 else '(CRECE)'}")
+
+    # Verificación: el contenido paginado se recupera intacto
+    assert transcript.store.text(5) == message(5)[1]
+
+    edit = QTextEdit()
+    edit.setReadOnly(True)
+    print(f"QTextEdit (anterior): {total_html} mensajes")
+    report(run(edit, html_append(edit), total_html))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark del índice de la paleta de comandos (services/search_index.py).
+
+Indexa N entradas sintéticas (páginas + configuración con palabras clave) y mide
+el tiempo por consulta para prefijos, subcadenas, varias palabras y errores de tipeo.
+
+Uso: python scripts/bench_command_search.py [entradas]
+"""
+
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.search_index import SearchIndex  # noqa: E402
+
+WORDS = [
+    "vigas", "columnas", "losas", "cimentación", "reportes", "usuarios", "inventario",
+    "facturación", "análisis", "sísmico", "cargas", "materiales", "acero", "hormigón",
+    "planos", "proyectos", "clientes", "ventas", "tablero", "resumen", "historial",
+]
+QUERIES = [
+    "v", "vi", "vig", "vigas", "col", "carg acer", "fact", "configuracion",
+    "ormigon", "sismico 12", "reprotes", "hormgon", "hormgon reprotes", "zzz", "página 4",
+]
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    random.seed(0)
+    index = SearchIndex()
+
+    started = time.perf_counter()
+    for i in range(entries):
+        title = f"{random.choice(WORDS).capitalize()} {random.choice(WORDS)} {i}"
+        kind = "config" if i % 10 == 0 else "page"
+        index.add(kind, f"k{i}", title, random.sample(WORDS, 2))
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{entries} entradas indexadas en {build_ms:.0f} ms ({build_ms / entries * 1000:.1f} µs/entrada)")
+
+    worst = 0.0
+    for query in QUERIES:
+        repeats = 200
+        started = time.perf_counter()
+        for _ in range(repeats):
+            results = index.search(query)
+        per_call = (time.perf_counter() - started) / repeats * 1e6
+        worst = max(worst, per_call)
+        top = results[0].title if results else "-"
+        print(f"  {query!r:18} {per_call:8.1f} µs  {len(results)} resultados  ({top})")
+    print(f"Peor consulta: {worst:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
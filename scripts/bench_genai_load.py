@@ -0,0 +1,184 @@
+"""
+Carga del camino de IA sin red: N conversaciones simultáneas en DemoPage.
+
+Usa el backend falso de services/fake_genai.py (GENAI_BACKEND=fake), así corre
+sin API key (ej. en CI). Cada conversación es una DemoPage visible que envía
+`turnos` mensajes seguidos por el ejecutor compartido. Reporta:
+- Latencia del event loop: atraso de un timer de 5 ms (lo que percibe el usuario).
+- Primer fragmento: desde el envío hasta que llega al hilo de la GUI.
+- Primera pintura: desde el envío hasta que se pinta la burbuja con texto.
+- Memoria: pico del heap Python (tracemalloc) y RSS máximo del proceso.
+
+El backend se ajusta con GENAI_FAKE_* (ej. GENAI_FAKE_LATENCY_MS=200,
+GENAI_FAKE_CHUNK_INTERVAL_MS=10, GENAI_FAKE_ERROR_RATE=0.05).
+
+Uso: python scripts/bench_genai_load.py [conversaciones] [turnos] [concurrencia]
+"""
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("GENAI_BACKEND", "fake")
+
+import logging  # noqa: E402
+
+from PySide6.QtCore import QEvent, QObject, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from pages.main.Demo_page import DemoPage  # noqa: E402
+from services.genai_executor import shared_executor  # noqa: E402
+
+PROBE_MS = 5
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+
+def rss_mb():
+    """RSS máximo del proceso en MB (None si la plataforma no lo expone)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class LoopProbe(QObject):
+    """Timer de PROBE_MS: su atraso respecto de lo esperado es la latencia del loop."""
+
+    def __init__(self):
+        super().__init__()
+        self.lags = []
+        self._last = time.perf_counter()
+        self._timer = QTimer(self)
+        self._timer.setInterval(PROBE_MS)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start()
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.lags.append(max((now - self._last) * 1000 - PROBE_MS, 0.0))
+        self._last = now
+
+
+class Conversation(QObject):
+    """Maneja una DemoPage: envía los turnos y mide primer fragmento y primera pintura."""
+
+    def __init__(self, index: int, turns: int, results: dict):
+        super().__init__()
+        self.index = index
+        self.turns_left = turns
+        self.results = results
+        self.page = DemoPage()
+        self.page.setWindowTitle(f"Conversación {index}")
+        self.page.resize(480, 360)
+        self.page.move((index % 6) * 40, (index // 6) * 40)
+        self.page.show()
+        self.page.chat_history.viewport().installEventFilter(self)
+        self._sent_at = 0.0
+        self._awaiting_paint = False
+
+        # La primera pintura con texto llega después del primer flush del stream
+        flush = self.page.flush_chunks
+
+        def flush_and_mark():
+            if self._sent_at and not self._awaiting_paint and self.page._pending_chunks:
+                self._awaiting_paint = True
+            flush()
+
+        self.page.flush_chunks = flush_and_mark
+        self.page._flush_timer.timeout.disconnect()
+        self.page._flush_timer.timeout.connect(flush_and_mark)
+
+    def send(self):
+        if self.turns_left <= 0:
+            self.results["done"] += 1
+            return
+        self.turns_left -= 1
+        self.page.input_field.setText(f"Pregunta {self.turns_left} de la conversación {self.index}")
+        self._sent_at = time.perf_counter()
+        self.page.send_message()
+        self.page.request.chunk_received.connect(self._on_first_chunk)
+        self.page.request.error_occurred.connect(lambda _e: self._count("errors"))
+        self.page.request.finished.connect(self._on_finished)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self._awaiting_paint:
+            self._awaiting_paint = False
+            self.results["first_paint"].append((time.perf_counter() - self._sent_at) * 1000)
+            self._sent_at = 0.0
+        return False
+
+    def _on_first_chunk(self, _chunk):
+        self.page.request.chunk_received.disconnect(self._on_first_chunk)
+        self.results["first_chunk"].append(self.page.ttft_history[-1])
+
+    def _on_finished(self):
+        self._count("turns")
+        # Un instante "pensando" antes del próximo mensaje (deja pintar la respuesta)
+        QTimer.singleShot(50, self.send)
+
+    def _count(self, name):
+        self.results[name] += 1
+
+
+def main():
+    conversations = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    logging.disable(logging.INFO)
+    app = QApplication.instance() or QApplication([])
+    shared_executor().set_max_concurrency(concurrency)
+
+    tracemalloc.start()
+    results = {"first_chunk": [], "first_paint": [], "turns": 0, "errors": 0, "done": 0}
+    runs = [Conversation(i, turns, results) for i in range(conversations)]
+    app.processEvents()
+
+    probe = LoopProbe()
+    started = time.perf_counter()
+    for run in runs:
+        run.send()
+    while results["done"] < conversations:
+        app.processEvents()
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+
+    lags = probe.lags
+    print(
+        f"{conversations} conversaciones x {turns} turnos, concurrencia {concurrency}: "
+        f"{results['turns']} respuestas ({results['errors']} errores) en {elapsed:.1f} s"
+    )
+    print(
+        f"  event loop (atraso de un timer de {PROBE_MS} ms): p50 {percentile(lags, 0.5):.1f} ms"
+        f" | p95 {percentile(lags, 0.95):.1f} ms | p99 {percentile(lags, 0.99):.1f} ms"
+        f" | máx {max(lags, default=0):.1f} ms"
+    )
+    for name, label in (("first_chunk", "primer fragmento"), ("first_paint", "primera pintura")):
+        values = results[name]
+        print(
+            f"  {label}: p50 {percentile(values, 0.5):.0f} ms | p95 {percentile(values, 0.95):.0f} ms"
+            f" | media {statistics.fmean(values) if values else 0:.0f} ms ({len(values)} muestras)"
+        )
+    rss = rss_mb()
+    print(
+        f"  memoria: pico heap Python {peak / 1024 / 1024:.1f} MB"
+        + (f" | RSS máx {rss:.0f} MB" if rss is not None else "")
+    )
+    shared_executor().shutdown()
+
+
+if __name__ == "__main__":
+    main()
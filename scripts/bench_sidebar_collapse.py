@@ -0,0 +1,126 @@
+"""
+Tiempo por frame de la animación de colapso/expansión del Sidebar.
+
+Muestra una página pesada (una grilla de widgets) y mide el costo de cada frame
+de la animación (eventos + layout + pintura) en los dos modos de
+Sidebar.collapse_mode. Para sostener 60 fps cada frame debe costar < 16.7 ms:
+- "layout": setFixedWidth en cada frame (re-layout de todo el contenido).
+- "overlay": se anima una captura y el ancho final se aplica una sola vez.
+
+Corre con la plataforma offscreen por defecto (la pintura es real, por software).
+
+Uso: python scripts/bench_sidebar_collapse.py [filas] [columnas]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import (  # noqa: E402
+    QApplication, QGridLayout, QLabel, QLineEdit, QPushButton, QWidget,
+)
+
+from components.Sidebar import MenuItemProp  # noqa: E402
+from main_ui import Interface  # noqa: E402
+from styles.themes import ThemeManager, ThemeType  # noqa: E402
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+class HeavyPage(QWidget):
+    """Página con muchos widgets: cada resize recalcula una grilla grande."""
+
+    def __init__(self, rows: int, cols: int):
+        super().__init__()
+        grid = QGridLayout(self)
+        for r in range(rows):
+            for c in range(cols):
+                kind = (r + c) % 3
+                if kind == 0:
+                    widget = QLabel(f"Celda {r}:{c}")
+                elif kind == 1:
+                    widget = QLineEdit(f"{r * c}")
+                else:
+                    widget = QPushButton(f"Acción {r}")
+                grid.addWidget(widget, r, c)
+
+
+def settle(app):
+    """Procesa eventos hasta que no quede trabajo pendiente (layouts, repintados)."""
+    for _ in range(5):
+        app.processEvents()
+
+
+def measure(app, window, mode: str):
+    """
+    Colapsa y expande avanzando la animación a mano, un frame cada 16 ms de
+    animación, y mide lo que tarda cada frame en procesar eventos y pintar.
+    """
+    sidebar = window.sidebar
+    sidebar.collapse_mode = mode
+    results = []
+    for _direction in ("colapso", "expansión"):
+        settle(app)
+        sidebar.handleCollapse()
+        animation = sidebar.animation
+        animation.pause()
+        settle(app)
+
+        frame_ms = []
+        for t in range(16, animation.duration(), 16):
+            started = time.perf_counter()
+            animation.setCurrentTime(t)
+            app.processEvents()  # layouts pendientes + repintado de lo sucio
+            frame_ms.append((time.perf_counter() - started) * 1000)
+
+        # Último frame: incluye el commit del ancho final en modo overlay
+        started = time.perf_counter()
+        animation.resume()
+        animation.setCurrentTime(animation.duration())
+        app.processEvents()
+        frame_ms.append((time.perf_counter() - started) * 1000)
+        assert not sidebar.isAnimating
+        results.append(frame_ms)
+    return results
+
+
+def report(label: str, frame_ms):
+    """Frames de la animación y, aparte, el frame final (commit del ancho)."""
+    frames, final = frame_ms[:-1], frame_ms[-1]
+    p95 = sorted(frames)[int(len(frames) * 0.95) - 1]
+    over = sum(1 for ms in frames if ms > FRAME_BUDGET_MS)
+    print(
+        f"  {label:22} {len(frames):3} frames | media {statistics.mean(frames):6.2f} ms"
+        f" | p95 {p95:6.2f} ms | máx {max(frames):6.2f} ms | sobre 16.7 ms: {over:2}"
+        f" | frame final {final:6.2f} ms"
+    )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    cols = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+
+    app = QApplication.instance() or QApplication([])
+    window = Interface()
+    window.prewarmer.stop()
+    window.register_page(MenuItemProp("Pesada", "home.svg", lambda: HeavyPage(rows, cols), key="heavy"))
+    ThemeManager(ThemeType.DARK).apply_theme(ThemeType.DARK, scope=[window])
+    window.show()
+    window.navigate_to("heavy")
+    for _ in range(5):
+        app.processEvents()
+
+    print(f"Página pesada: {rows * cols} widgets")
+    for mode in ("layout", "overlay"):
+        collapse, expand = measure(app, window, mode)
+        report(f"{mode} / colapso", collapse)
+        report(f"{mode} / expansión", expand)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Prueba de escala del registro del Sidebar: 1.000 páginas registradas.
+
+Compara la búsqueda lineal anterior (recorrer btnGroup.buttons()) con el
+registro por key/instancia, y verifica que el registro no crece con el número
+de ítems: mide con items/100, items/10 e items páginas y falla si el costo por
+búsqueda (instancia -> key) o por select_by_key crece más de FLAT_TOLERANCE
+veces (una búsqueda lineal crecería ~100 veces).
+
+navigate_to se informa sin verificar: además del registro incluye
+QStackedWidget.setCurrentWidget, cuyo layout recorre todas las páginas (Qt).
+
+Uso: python scripts/bench_sidebar_registry.py [items]
+"""
+
+import os
+import random
+import sys
+import time
+from typing import Dict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from components.Sidebar import MenuItemProp  # noqa: E402
+from main_ui import Interface  # noqa: E402
+
+# Crecimiento máximo aceptado del costo por llamada entre la escala menor y la mayor
+FLAT_TOLERANCE = 3.0
+REPEATS = 5
+CALLS = 2000
+
+
+def linear_select(sidebar, key):
+    """Implementación anterior de select_by_page_instance (búsqueda lineal)."""
+    for btn in sidebar.btnGroup.buttons():
+        if getattr(btn, "_page_key", None) == key:
+            btn.setChecked(True)
+            return
+
+
+def per_call_us(func, keys) -> float:
+    """Mejor de REPEATS pasadas (descarta el ruido del sistema)."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for key in keys:
+            func(key)
+        best = min(best, time.perf_counter() - started)
+    return best / len(keys) * 1e6
+
+
+def measure(items: int) -> Dict[str, float]:
+    """Registra `items` páginas en una ventana nueva y mide el costo por llamada."""
+    window = Interface()
+    window.prewarmer.stop()
+
+    started = time.perf_counter()
+    for i in range(items):
+        window.register_page(MenuItemProp(f"Página {i}", "home.svg", QWidget, key=f"page_{i}"))
+    register_ms = (time.perf_counter() - started) * 1000
+
+    random.seed(0)
+    keys = [f"page_{random.randrange(items)}" for _ in range(CALLS)]
+
+    results = {
+        "registro (µs/ítem)": register_ms / items * 1000,
+        "búsqueda lineal (anterior)": per_call_us(lambda k: linear_select(window.sidebar, k), keys),
+        "select_by_key": per_call_us(window.sidebar.select_by_key, keys),
+    }
+    # navigate_to completo (las páginas se construyen antes de medir)
+    for key in set(keys):
+        window.navigate_to(key)
+    pages = [window.Canvas.page(key) for key in keys]
+    results["búsqueda instancia -> key"] = per_call_us(window.Canvas.key_of, pages)
+    results["select_by_page_instance"] = per_call_us(window.sidebar.select_by_page_instance, pages)
+    results["navigate_to (ya construidas)"] = per_call_us(window.navigate_to, keys)
+
+    assert window.sidebar._buttons_by_key[keys[-1]].isChecked()
+    window.close()
+    window.deleteLater()
+    return results
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    app = QApplication.instance() or QApplication([])
+    scales = [max(items // 100, 1), max(items // 10, 1), items]
+
+    table = {}
+    for count in scales:
+        table[count] = measure(count)
+        app.processEvents()  # Procesa los deleteLater de la ventana anterior
+
+    print(f"{'µs por llamada':32}" + "".join(f"{count:>10} ítems" for count in scales))
+    for name in table[items]:
+        print(f"  {name:30}" + "".join(f"{table[count][name]:16.2f}" for count in scales))
+
+    # El registro O(1) no debe crecer con la cantidad de ítems (la lineal sí)
+    smallest, largest = table[scales[0]], table[scales[-1]]
+    for name in ("búsqueda instancia -> key", "select_by_key", "select_by_page_instance"):
+        growth = largest[name] / smallest[name]
+        print(f"  {name}: x{growth:.2f} de {scales[0]} a {items} ítems")
+        assert growth <= FLAT_TOLERANCE, (
+            f"{name} crece x{growth:.2f} de {scales[0]} a {items} ítems (tolerancia x{FLAT_TOLERANCE})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Micro-benchmark del renderizado de temas: str.replace por variable (método
+anterior) vs. plantilla precompilada de ThemeManager vs. caché por tema.
+
+Uso: python scripts/bench_theme_render.py [repeticiones]
+"""
+
+import os
+import sys
+import timeit
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from styles.themes import THEME_PALETTES, ThemeManager, ThemeType  # noqa: E402
+
+
+def render_with_replace(template: str, palette: dict) -> str:
+    """Implementación anterior: una pasada completa de str.replace por variable."""
+    qss = template
+    for key, value in palette.items():
+        qss = qss.replace(key, value)
+    return qss
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    manager = ThemeManager(ThemeType.GRAY)
+    manager._load_template()
+    template = manager._template_content
+    palette = THEME_PALETTES[ThemeType.GRAY]
+
+    # Ambos caminos deben producir exactamente el mismo QSS
+    for theme in ThemeType:
+        assert render_with_replace(template, THEME_PALETTES[theme]) == (
+            manager._process_template(THEME_PALETTES[theme])
+        ), f"El QSS compilado difiere en {theme}"
+
+    cache = {ThemeType.GRAY: manager._process_template(palette)}
+    cases = {
+        "str.replace (anterior)": lambda: render_with_replace(template, palette),
+        "plantilla compilada": lambda: manager._process_template(palette),
+        "caché por tema": lambda: cache.get(ThemeType.GRAY),
+    }
+
+    print(f"Plantilla: {len(template)} caracteres, {len(palette)} variables, {number} repeticiones")
+    baseline = None
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        per_call_us = seconds / number * 1e6
+        baseline = baseline or per_call_us
+        print(f"  {name:<24} {per_call_us:10.2f} µs/render  (x{baseline / per_call_us:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Pipeline incremental de assets de iconos (reemplaza a replace_svg_colors.py).
+
+Por cada `assets/icons/*.svg` y cada color de icono de THEME_PALETTES genera en
+`assets/build/icons/<color>/`:
+- `<nombre>.svg`: variante con el fill del tema.
+- `<nombre>-<tamaño>@1x.png` / `@2x.png`: para los tamaños que usa la UI.
+Al final regenera `assets/icons.bundle` si algún SVG cambió o quedó desactualizado.
+
+Un manifest con el hash de contenido de cada icono (y de la configuración)
+permite reprocesar solo lo que cambió; el trabajo se reparte en un pool de
+procesos. Una ejecución sin cambios no abre ningún worker.
+
+Uso: python scripts/build_assets.py [--force] [--jobs N]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.paths import ASSETS_DIR, ICONS_DIR  # noqa: E402
+
+BUILD_DIR = os.path.join(ASSETS_DIR, "build", "icons")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+# Tamaños usados por la UI: 24px Sidebar, 20px Header
+ICON_SIZES = (24, 20)
+SCALES = (1, 2)
+
+# fill="#rgb", fill="#rrggbb(aa)" o el marcador que usaba replace_svg_colors.py
+FILL_PATTERN = re.compile(r'fill="(#[0-9a-fA-F]{3,8}|#COLOR_PLACEHOLDER)"')
+SVG_TAG_PATTERN = re.compile(r"<svg\b")
+
+THEMES_SOURCE = os.path.join(ROOT_DIR, "styles", "themes.py")
+
+
+def themes_signature() -> str:
+    """Firma (mtime + tamaño) de themes.py."""
+    stat = os.stat(THEMES_SOURCE)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def theme_colors(manifest: dict) -> Dict[str, str]:
+    """
+    Mapa tema -> @icon_color. Si themes.py no cambió se reutiliza el del manifest
+    (importar styles.themes carga PySide6 y es lo más caro de una ejecución sin cambios).
+    """
+    if manifest.get("themes_source") == themes_signature() and manifest.get("themes"):
+        return manifest["themes"]
+
+    from styles.themes import THEME_PALETTES
+
+    return {theme.value: palette["@icon_color"] for theme, palette in THEME_PALETTES.items()}
+
+
+def color_dir_name(color: str) -> str:
+    """Nombre del directorio de salida para un color (ej. '#E5E5E5' -> 'e5e5e5')."""
+    return color.lstrip("#").lower()
+
+
+def recolor_svg(content: str, color: str) -> str:
+    """Reemplaza los fill por `color`; si el SVG no tiene fill, lo agrega a la raíz."""
+    new_content, count = FILL_PATTERN.subn(f'fill="{color}"', content)
+    if count == 0:
+        new_content = SVG_TAG_PATTERN.sub(f'<svg fill="{color}"', content, count=1)
+    return new_content
+
+
+def outputs_for(name: str, colors: List[str]) -> List[str]:
+    """Rutas de salida que debe tener un icono procesado."""
+    stem = os.path.splitext(name)[0]
+    paths = []
+    for color in colors:
+        out_dir = os.path.join(BUILD_DIR, color_dir_name(color))
+        paths.append(os.path.join(out_dir, name))
+        for size in ICON_SIZES:
+            for scale in SCALES:
+                paths.append(os.path.join(out_dir, f"{stem}-{size}@{scale}x.png"))
+    return paths
+
+
+# -----------------------------------------------------------------------------
+# WORKER (se ejecuta en los procesos del pool)
+# -----------------------------------------------------------------------------
+_app = None
+
+
+def _init_worker():
+    """Cada proceso necesita su propia QGuiApplication (sin ventana) para rasterizar."""
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtGui import QGuiApplication
+
+    _app = QGuiApplication.instance() or QGuiApplication([])
+
+
+def process_icon(source_path: str, colors: List[str]) -> Tuple[str, int]:
+    """Genera las variantes SVG y los PNG de un icono. Retorna (nombre, archivos escritos)."""
+    from PySide6.QtCore import QByteArray, Qt
+    from PySide6.QtGui import QImage, QPainter
+    from PySide6.QtSvg import QSvgRenderer
+
+    name = os.path.basename(source_path)
+    stem = os.path.splitext(name)[0]
+    with open(source_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    written = 0
+    for color in colors:
+        out_dir = os.path.join(BUILD_DIR, color_dir_name(color))
+        os.makedirs(out_dir, exist_ok=True)
+
+        variant = recolor_svg(content, color)
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            f.write(variant)
+        written += 1
+
+        renderer = QSvgRenderer(QByteArray(variant.encode("utf-8")))
+        for size in ICON_SIZES:
+            for scale in SCALES:
+                image = QImage(size * scale, size * scale, QImage.Format_ARGB32_Premultiplied)
+                image.fill(Qt.transparent)
+                painter = QPainter(image)
+                renderer.render(painter)
+                painter.end()
+                image.save(os.path.join(out_dir, f"{stem}-{size}@{scale}x.png"), "PNG")
+                written += 1
+    return name, written
+
+
+# -----------------------------------------------------------------------------
+# PIPELINE
+# -----------------------------------------------------------------------------
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def config_hash(colors: List[str]) -> str:
+    """Si cambian los colores, tamaños o el formato, todo se reprocesa."""
+    config = {"version": MANIFEST_VERSION, "colors": colors, "sizes": ICON_SIZES, "scales": SCALES}
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict):
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def bundle_is_fresh() -> bool:
+    """True si `assets/icons.bundle` existe y corresponde a los SVG actuales."""
+    from services.icon_bundle import IconBundle, icons_dir_mtime_ns, source_signature
+
+    try:
+        bundle = IconBundle()
+    except (OSError, ValueError, KeyError):
+        return False
+    try:
+        # Las dos comprobaciones: la rápida del arranque y la firma por archivo
+        return (
+            bundle.source_mtime_ns == icons_dir_mtime_ns()
+            and bundle.source_signature == source_signature()
+        )
+    finally:
+        bundle.close()
+
+
+def build(force: bool = False, jobs: int = None) -> dict:
+    """Ejecuta el pipeline y retorna estadísticas."""
+    started = time.perf_counter()
+    manifest = load_manifest()
+    themes = theme_colors(manifest)
+    colors = sorted(set(themes.values()))
+    cfg_hash = config_hash(colors)
+
+    previous = manifest.get("icons", {}) if manifest.get("config") == cfg_hash else {}
+    if not previous and os.path.isdir(BUILD_DIR):
+        # Configuración nueva: las variantes de colores viejos sobran
+        shutil.rmtree(BUILD_DIR)
+
+    sources = sorted(glob.glob(os.path.join(ICONS_DIR, "*.svg")))
+    hashes = {os.path.basename(path): file_hash(path) for path in sources}
+
+    pending = [
+        path
+        for path in sources
+        if force
+        or previous.get(os.path.basename(path)) != hashes[os.path.basename(path)]
+        or not all(os.path.exists(p) for p in outputs_for(os.path.basename(path), colors))
+    ]
+
+    # Iconos eliminados: borrar sus salidas
+    removed = [name for name in previous if name not in hashes]
+    for name in removed:
+        for path in outputs_for(name, colors):
+            if os.path.exists(path):
+                os.remove(path)
+
+    written = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            futures = [pool.submit(process_icon, path, colors) for path in pending]
+            for future in as_completed(futures):
+                _name, count = future.result()
+                written += count
+
+    if pending or removed or not bundle_is_fresh():
+        from services.icon_bundle import write_bundle
+
+        write_bundle(sources)
+
+    if pending or removed or manifest.get("themes_source") != themes_signature():
+        save_manifest(
+            {
+                "config": cfg_hash,
+                "themes": themes,
+                "themes_source": themes_signature(),
+                "icons": hashes,
+            }
+        )
+
+    return {
+        "icons": len(sources),
+        "processed": len(pending),
+        "removed": len(removed),
+        "files_written": written,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="Reprocesar todos los iconos")
+    parser.add_argument("--jobs", type=int, default=None, help="Procesos del pool (por defecto: CPUs)")
+    args = parser.parse_args()
+
+    stats = build(force=args.force, jobs=args.jobs)
+    print(
+        f"Iconos: {stats['icons']} | reprocesados: {stats['processed']} | "
+        f"eliminados: {stats['removed']} | archivos: {stats['files_written']} | "
+        f"{stats['seconds'] * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Empaqueta `assets/icons/*.svg` en `assets/icons.bundle` (un único archivo indexado).
+
+Uso: python scripts/build_icon_bundle.py
+"""
+
+import glob
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.icon_bundle import BUNDLE_PATH, write_bundle  # noqa: E402
+from utils.paths import ICONS_DIR  # noqa: E402
+
+
+def main():
+    icons = glob.glob(os.path.join(ICONS_DIR, "*.svg"))
+    count = write_bundle(icons)
+    size_kb = os.path.getsize(BUNDLE_PATH) / 1024
+    print(f"Bundle generado: {BUNDLE_PATH} ({count} iconos, {size_kb:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
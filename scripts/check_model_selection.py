@@ -0,0 +1,91 @@
+"""
+Prueba de la selección de modelos (ModelCatalog) sin red.
+
+Un cliente falso lista dos modelos: el de por defecto (lento) y un "flash" más
+rápido que la app nunca usó. Verifica que:
+1. Con solo el modelo por defecto medido, `pick()` lo elige a él.
+2. Después del sondeo en segundo plano, `pick()` elige el modelo rápido.
+3. Las variantes especializadas (-tts) no se sondean.
+
+Uso: python scripts/check_model_selection.py
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from services.fake_genai import FakeGenAIClient, FakeGenAIConfig  # noqa: E402
+from services.genai_client import DEFAULT_MODEL  # noqa: E402
+from services.model_catalog import ModelCatalog  # noqa: E402
+
+FAST_MODEL = "gemini-fast-flash"
+TTS_MODEL = "gemini-fast-flash-preview-tts"
+
+
+class RoutedModels:
+    """`client.models` que responde cada modelo con su propio cliente falso."""
+
+    def __init__(self, latencies_ms: dict):
+        self._clients = {
+            name: FakeGenAIClient(
+                FakeGenAIConfig(latency_ms=latency, jitter_ms=0, chunk_interval_ms=1)
+            )
+            for name, latency in latencies_ms.items()
+        }
+
+    def list(self):
+        return [
+            SimpleNamespace(
+                name=f"models/{name}",
+                display_name=name,
+                supported_actions=["generateContent"],
+                input_token_limit=1_048_576,
+                output_token_limit=8192,
+            )
+            for name in self._clients
+        ]
+
+    def generate_content_stream(self, model: str, contents, config=None):
+        return self._clients[model].models.generate_content_stream(model, contents, config)
+
+
+def main():
+    models = RoutedModels({DEFAULT_MODEL: 120, FAST_MODEL: 10, TTS_MODEL: 1})
+    client = SimpleNamespace(models=models)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = ModelCatalog(
+            path=os.path.join(tmp, "models.json"), client_provider=lambda: client
+        )
+        assert catalog.refresh()
+
+        # La app solo usó el modelo por defecto
+        for _ in range(3):
+            catalog.record(DEFAULT_MODEL, ttft_ms=120, total_ms=140, chars=600)
+        assert catalog.pick() == DEFAULT_MODEL, catalog.pick()
+        print(f"Antes del sondeo: {catalog.pick()}")
+
+        thread = catalog.refresh_in_background()
+        assert thread is not None, "Hay modelos sin medir: debe sondearlos"
+        thread.join(timeout=10)
+
+        assert catalog.stats(FAST_MODEL) is not None, "El modelo rápido no se sondeó"
+        assert catalog.stats(TTS_MODEL) is None, "Una variante especializada se sondeó"
+        assert catalog.pick() == FAST_MODEL, catalog.pick()
+        print(
+            f"Después del sondeo: {catalog.pick()} "
+            f"({catalog.stats(FAST_MODEL).expected_ms():.0f} ms esperados vs "
+            f"{catalog.stats(DEFAULT_MODEL).expected_ms():.0f} ms)"
+        )
+
+        # Ya no quedan modelos sin medir ni lista vencida: no hay trabajo en segundo plano
+        assert catalog.refresh_in_background() is None
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
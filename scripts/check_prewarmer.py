@@ -0,0 +1,115 @@
+"""
+Prueba del pre-construido de páginas (PagePrewarmer) con costos medidos y sin medir.
+
+Primera sesión (sin mediciones guardadas): mientras el event loop está ocupado
+no se construye ninguna página sin medir; recién con el loop ocioso. La página
+pesada se mide y queda marcada.
+Segunda sesión (con mediciones): la página pesada ya no se pre-construye y
+ningún tick se pasa del presupuesto.
+
+Usa un QSettings temporal (no toca la configuración real).
+
+Uso: python scripts/check_prewarmer.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSettings, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from components.Canvas import Canvas  # noqa: E402
+from components.Prewarmer import PagePrewarmer  # noqa: E402
+
+BUDGET_MS = 8.0
+HEAVY_MS = 40
+LIGHT_MS = 2
+BUSY_UNTIL_S = 0.6  # El loop está ocupado (bloqueos de 30 ms) durante este tiempo
+IDLE_BEFORE_MS = 300
+
+built_at = {}
+
+
+def page_class(key: str, cost_ms: float):
+    class Page(QWidget):
+        def __init__(self):
+            super().__init__()
+            time.sleep(cost_ms / 1000)
+            built_at[key] = time.perf_counter()
+
+    return Page
+
+
+def run_session(app: QApplication, duration_s: float) -> PagePrewarmer:
+    """Una "sesión": Canvas nuevo, prewarmer y el loop corriendo `duration_s`."""
+    built_at.clear()
+    canvas = Canvas()
+    prewarmer = PagePrewarmer(canvas, budget_ms=BUDGET_MS)
+    prewarmer.idle_before_unmeasured_ms = IDLE_BEFORE_MS
+    pages = {"ligera_1": LIGHT_MS, "pesada": HEAVY_MS, "ligera_2": LIGHT_MS, "ligera_3": LIGHT_MS}
+    for key, cost in pages.items():
+        canvas.add_page(page_class(key, cost), key=key)
+        prewarmer.add_page(key)
+
+    # Mide la duración de cada tick
+    prewarmer.tick_ms = []
+    tick = prewarmer._tick
+
+    def timed_tick():
+        started = time.perf_counter()
+        tick()
+        prewarmer.tick_ms.append((time.perf_counter() - started) * 1000)
+
+    prewarmer._timer.timeout.disconnect()
+    prewarmer._timer.timeout.connect(timed_tick)
+
+    started = time.perf_counter()
+    busy = QTimer()
+    busy.setInterval(40)
+    busy.timeout.connect(
+        lambda: time.sleep(0.03) if time.perf_counter() - started < BUSY_UNTIL_S else busy.stop()
+    )
+    busy.start()
+
+    prewarmer.start()
+    QTimer.singleShot(int(duration_s * 1000), app.quit)
+    app.exec()
+    prewarmer.stop()
+    prewarmer.started_at = started
+    return prewarmer
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for settings_format in (QSettings.Format.NativeFormat, QSettings.Format.IniFormat):
+            QSettings.setPath(settings_format, QSettings.Scope.UserScope, tmp)
+        app = QApplication.instance() or QApplication([])
+
+        # 1. Sin mediciones: nada se construye hasta que el loop está ocioso
+        first = run_session(app, 2.0)
+        earliest_s = min(built_at.values()) - first.started_at
+        print(f"Sesión 1: primera página sin medir a los {earliest_s * 1000:.0f} ms")
+        assert earliest_s >= BUSY_UNTIL_S + IDLE_BEFORE_MS / 1000, (
+            "Se construyó una página sin medir con el event loop ocupado"
+        )
+        assert set(built_at) == {"ligera_1", "pesada", "ligera_2", "ligera_3"}, built_at
+        assert first._build_ms["pesada"] > BUDGET_MS
+
+        # 2. Con mediciones: la pesada se salta y los ticks respetan el presupuesto
+        second = run_session(app, 1.5)
+        slowest = max(second.tick_ms)
+        print(f"Sesión 2: construidas {sorted(built_at)}, tick más largo {slowest:.1f} ms")
+        assert "pesada" not in built_at, "La página pesada medida no debe pre-construirse"
+        assert set(built_at) == {"ligera_1", "ligera_2", "ligera_3"}, built_at
+        assert slowest <= BUDGET_MS * 1.5, f"Tick de {slowest:.1f} ms (presupuesto {BUDGET_MS} ms)"
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
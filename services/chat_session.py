@@ -0,0 +1,241 @@
+"""
+Sesión de chat con historial acotado (ventana + resumen).
+
+`client.chats.create()` reenvía la conversación completa en cada mensaje: en una
+sesión larga el prompt (latencia y costo en tokens) crece sin límite.
+ManagedChatSession arma cada prompt con:
+1. Un resumen de los turnos viejos (como system_instruction).
+2. Los turnos que el resumen todavía no cubre, completos.
+3. El mensaje nuevo.
+
+Cada turno se envía una sola vez: o dentro del resumen o textual. Los tokens se
+estiman localmente (sin llamadas a la API). Los turnos que salen de la ventana
+de `token_budget` (ventana deslizante; al menos `min_recent_turns` turnos
+completos) se resumen en un hilo aparte, junto con el resumen anterior (con
+reintentos si la llamada falla). Hasta que el resumen los cubre se siguen
+enviando completos: el prompt puede pasarse del presupuesto por un tiempo, pero
+ningún turno queda fuera de la conversación.
+
+Tiene la misma interfaz que la sesión del SDK (send_message y
+send_message_stream), así que sirve con GenAIService.send_message_stream:
+
+    chat = service.managed_chat_session(token_budget=4000)
+    for text in service.send_message_stream(chat, "Hola"):
+        ...
+    print(chat.last_metrics)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+# Estimación local: ~4 caracteres por token (texto en español/inglés)
+CHARS_PER_TOKEN = 4
+# Reintentos de un resumen fallido (espera creciente entre intentos)
+SUMMARY_RETRIES = 2
+SUMMARY_RETRY_DELAY_S = 1.0
+
+SUMMARY_PROMPT = (
+    "Resume la siguiente conversación entre un usuario y un asistente en a lo sumo "
+    "{words} palabras. Conserva datos, decisiones, nombres y preguntas pendientes; "
+    "omite saludos. Responde solo con el resumen.\n\n"
+    "Resumen anterior:\n{summary}\n\nConversación:\n{turns}"
+)
+SUMMARY_INSTRUCTION = "Resumen de la conversación anterior con el usuario:\n{summary}"
+
+
+def estimate_tokens(text: str) -> int:
+    """Tokens aproximados de un texto (sin tokenizador ni red)."""
+    return max((len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN, 1) if text else 0
+
+
+@dataclass
+class TurnMetrics:
+    """Tamaño del prompt de un turno, comparado con reenviar todo el historial."""
+
+    turn: int
+    prompt_tokens: int  # Lo enviado: resumen + ventana + mensaje
+    full_history_tokens: int  # Lo que hubiera enviado una sesión sin ventana
+    window_turns: int  # Mensajes del historial incluidos
+    summarized_messages: int  # Mensajes cubiertos por el resumen
+    latency_ms: float = 0.0
+    ttft_ms: Optional[float] = None
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.full_history_tokens - self.prompt_tokens
+
+
+class ManagedChatSession:
+    """Sesión de chat con presupuesto de tokens, ventana deslizante y resumen en segundo plano."""
+
+    def __init__(
+        self,
+        service,
+        token_budget: int = 4000,
+        min_recent_turns: int = 2,
+        summary_words: int = 200,
+        config: dict = None,
+    ):
+        self.service = service
+        self.token_budget = token_budget
+        self.min_recent_turns = min_recent_turns
+        self.summary_words = summary_words
+        self.config = dict(config or {})
+
+        self.history: List[Tuple[str, str]] = []  # (rol "user"/"model", texto)
+        self._tokens: List[int] = []  # Tokens estimados de cada mensaje del historial
+        self.summary = ""
+        self._summarized_upto = 0  # Mensajes [0, n) ya incluidos en el resumen
+        self._summary_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.metrics: List[TurnMetrics] = []
+
+    @property
+    def last_metrics(self) -> Optional[TurnMetrics]:
+        return self.metrics[-1] if self.metrics else None
+
+    def send_message(self, text: str):
+        """Como `chat.send_message`: retorna una respuesta con `.text`."""
+        parts = [chunk.text for chunk in self.send_message_stream(text) if chunk.text]
+        return _Reply("".join(parts))
+
+    def send_message_stream(self, text: str) -> Iterator:
+        """Como `chat.send_message_stream`: entrega los fragmentos de la respuesta."""
+        contents, config, metrics = self._build_prompt(text)
+
+        started = time.perf_counter()
+        parts = []
+        chunks = self.service.client.models.generate_content_stream(
+            model=self.service.model_name, contents=contents, config=config or None
+        )
+        for chunk in chunks:
+            if chunk.text:
+                if metrics.ttft_ms is None:
+                    metrics.ttft_ms = (time.perf_counter() - started) * 1000
+                parts.append(chunk.text)
+            yield chunk
+
+        # Solo los turnos completos entran al historial (igual que en el SDK)
+        metrics.latency_ms = (time.perf_counter() - started) * 1000
+        self._append("user", text)
+        self._append("model", "".join(parts))
+        self.metrics.append(metrics)
+        logging.info(
+            f"Chat turno {metrics.turn}: prompt ~{metrics.prompt_tokens} tokens "
+            f"(historial completo ~{metrics.full_history_tokens}, ahorro ~{metrics.saved_tokens}), "
+            f"{metrics.window_turns} mensajes en ventana, {metrics.summarized_messages} resumidos"
+        )
+        self._maybe_summarize()
+
+    def wait_for_summary(self, timeout: float = None) -> bool:
+        """Espera el resumen en curso (para pruebas y benchmarks). True si no quedó pendiente."""
+        thread = self._summary_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _append(self, role: str, text: str):
+        self.history.append((role, text))
+        self._tokens.append(estimate_tokens(text))
+
+    def _window_start(self, reserved: int) -> int:
+        """Primer mensaje de la ventana: los más recientes que entran en el presupuesto."""
+        budget = self.token_budget - reserved
+        start = len(self.history)
+        min_start = max(len(self.history) - 2 * self.min_recent_turns, 0)
+        used = 0
+        # De a turnos completos (usuario + modelo), del más nuevo al más viejo
+        while start >= 2:
+            turn_tokens = self._tokens[start - 2] + self._tokens[start - 1]
+            if start <= min_start and used + turn_tokens > budget:
+                break
+            used += turn_tokens
+            start -= 2
+        return start
+
+    def _build_prompt(self, text: str):
+        with self._lock:
+            summary = self.summary
+            summarized = self._summarized_upto
+        message_tokens = estimate_tokens(text)
+        summary_tokens = estimate_tokens(summary)
+
+        # La ventana empieza donde termina el resumen: lo anterior ya va en él y lo
+        # que aún no cubre (resumen en curso o fallido) va completo. El presupuesto
+        # se cumple resumiendo (ver _maybe_summarize), no recortando aquí.
+        start = summarized
+        window = self.history[start:]
+        contents = [{"role": role, "parts": [{"text": t}]} for role, t in window]
+        contents.append({"role": "user", "parts": [{"text": text}]})
+        config = dict(self.config)
+        if summary:
+            config["system_instruction"] = SUMMARY_INSTRUCTION.format(summary=summary)
+
+        metrics = TurnMetrics(
+            turn=len(self.history) // 2 + 1,
+            prompt_tokens=summary_tokens + sum(self._tokens[start:]) + message_tokens,
+            full_history_tokens=sum(self._tokens) + message_tokens,
+            window_turns=len(window),
+            summarized_messages=start,
+        )
+        return contents, config, metrics
+
+    def _maybe_summarize(self):
+        """Si hay mensajes fuera de la ventana sin resumir, los resume en segundo plano."""
+        if self._summary_thread is not None and self._summary_thread.is_alive():
+            return
+        # Ventana del próximo turno (reserva un mensaje típico)
+        reserve = estimate_tokens(self.summary) + (self._tokens[-2] if self._tokens else 0)
+        end = self._window_start(reserve)
+        if end <= self._summarized_upto:
+            return
+
+        turns = self.history[self._summarized_upto:end]
+        self._summary_thread = threading.Thread(
+            target=self._summarize, args=(self.summary, turns, end), name="ChatSummary", daemon=True
+        )
+        self._summary_thread.start()
+
+    def _summarize(self, previous: str, turns: List[Tuple[str, str]], end: int):
+        """Corre en un hilo: nuevo resumen = resumen anterior + turnos que salieron."""
+        speakers = {"user": "Usuario", "model": "Asistente"}
+        prompt = SUMMARY_PROMPT.format(
+            words=self.summary_words,
+            summary=previous or "(ninguno)",
+            turns="\n".join(f"{speakers.get(role, role)}: {text}" for role, text in turns),
+        )
+        for attempt in range(SUMMARY_RETRIES + 1):
+            try:
+                response = self.service.client.models.generate_content(
+                    model=self.service.model_name, contents=prompt
+                )
+                summary = (response.text or "").strip()
+                if not summary:
+                    raise ValueError("el modelo devolvió un resumen vacío")
+                break
+            except Exception as e:
+                print(f"⚠️ Error: no se pudo resumir el historial del chat (intento {attempt + 1}): {e}")
+                if attempt == SUMMARY_RETRIES:
+                    return  # Se vuelve a intentar después del próximo turno
+                time.sleep(SUMMARY_RETRY_DELAY_S * 2**attempt)
+
+        # Acotar por si el modelo ignora el largo pedido
+        summary = summary[: self.summary_words * 2 * CHARS_PER_TOKEN]
+        with self._lock:
+            self.summary = summary
+            self._summarized_upto = end
+
+
+class _Reply:
+    """Respuesta de `send_message` (solo `.text`, como en el SDK)."""
+
+    def __init__(self, text: str):
+        self.text = text
@@ -0,0 +1,176 @@
+"""
+Cliente local que imita a `google.genai.Client` sin red ni API key.
+
+Sirve para benchmarks y pruebas del camino de IA (GenAIService, DemoPage):
+latencia, cadencia de los fragmentos, tasa de errores y largo de las respuestas
+son configurables y reproducibles (semilla).
+
+Se usa pasándolo a GenAIService o con la variable de entorno GENAI_BACKEND=fake:
+
+    service = GenAIService(client=FakeGenAIClient(FakeGenAIConfig(latency_ms=300)))
+
+    GENAI_BACKEND=fake GENAI_FAKE_LATENCY_MS=500 python main.py
+
+Cubre lo que usa la app: models.generate_content(_stream), models.get/list y
+chats.create(...).send_message(_stream).
+"""
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Iterator, List, Optional
+
+BACKEND_ENV_VAR = "GENAI_BACKEND"
+ENV_PREFIX = "GENAI_FAKE_"
+
+_WORDS = (
+    "el modelo responde con texto de prueba generado localmente para medir la "
+    "interfaz sin depender de la red ni de una clave de api cada fragmento llega "
+    "con la cadencia configurada"
+).split()
+
+
+class FakeGenAIError(RuntimeError):
+    """Error simulado (según `error_rate`)."""
+
+
+@dataclass
+class FakeGenAIConfig:
+    """Comportamiento del cliente falso. Los tiempos son en milisegundos."""
+
+    latency_ms: float = 400  # Hasta el primer fragmento (o la respuesta completa)
+    jitter_ms: float = 100  # Variación aleatoria (+/-) de la latencia
+    chunk_interval_ms: float = 30  # Entre fragmentos de un stream
+    chunk_chars: int = 40  # Caracteres por fragmento
+    response_chars: int = 600  # Largo de cada respuesta
+    error_rate: float = 0.0  # Probabilidad de que una llamada falle (0-1)
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "FakeGenAIConfig":
+        """Lee GENAI_FAKE_<CAMPO> (ej. GENAI_FAKE_LATENCY_MS=250)."""
+        values = {}
+        for f in fields(cls):
+            raw = os.environ.get(ENV_PREFIX + f.name.upper())
+            if raw:
+                values[f.name] = float(raw) if f.type is float else int(raw)
+        return cls(**values)
+
+
+def fake_backend_requested() -> bool:
+    return os.environ.get(BACKEND_ENV_VAR, "").lower() == "fake"
+
+
+class _Response:
+    """Imita a GenerateContentResponse (solo `.text`)."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _Model:
+    """Imita a un elemento de `client.models.list()`."""
+
+    def __init__(self, name: str, display_name: str):
+        self.name = name
+        self.display_name = display_name
+        self.supported_actions = ["generateContent", "countTokens"]
+        self.input_token_limit = 1_048_576
+        self.output_token_limit = 8192
+
+
+class FakeModels:
+    def __init__(self, client: "FakeGenAIClient"):
+        self._client = client
+
+    def generate_content(self, model: str, contents, config=None) -> _Response:
+        return _Response("".join(self._client._stream(contents)))
+
+    def generate_content_stream(self, model: str, contents, config=None) -> Iterator[_Response]:
+        return (_Response(text) for text in self._client._stream(contents))
+
+    def get(self, model: str) -> _Model:
+        return _Model(model, model.split("/")[-1])
+
+    def list(self) -> List[_Model]:
+        return [
+            _Model("models/fake-flash", "Fake Flash"),
+            _Model("models/fake-pro", "Fake Pro"),
+        ]
+
+
+class FakeChat:
+    """Imita a `client.chats.create(...)`: guarda el historial."""
+
+    def __init__(self, client: "FakeGenAIClient", model: str):
+        self._client = client
+        self.model = model
+        self.history: List[tuple] = []
+
+    def send_message(self, message) -> _Response:
+        return _Response("".join(self.send_message_stream(message)))
+
+    def send_message_stream(self, message) -> Iterator[_Response]:
+        parts = []
+        for text in self._client._stream(message):
+            parts.append(text)
+            yield _Response(text)
+        self.history.append(("user", message))
+        self.history.append(("model", "".join(parts)))
+
+
+class FakeChats:
+    def __init__(self, client: "FakeGenAIClient"):
+        self._client = client
+
+    def create(self, model: str, **_kwargs) -> FakeChat:
+        return FakeChat(self._client, model)
+
+
+class FakeGenAIClient:
+    """Reemplazo local de `genai.Client`. Seguro para usar desde varios hilos."""
+
+    def __init__(self, config: FakeGenAIConfig = None):
+        self.config = config or FakeGenAIConfig()
+        self.models = FakeModels(self)
+        self.chats = FakeChats(self)
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _stream(self, prompt) -> Iterator[str]:
+        """Genera la respuesta en fragmentos, respetando latencia y cadencia."""
+        config = self.config
+        with self._lock:
+            self.calls += 1
+            fails = self._random.random() < config.error_rate
+            latency = config.latency_ms + self._random.uniform(-config.jitter_ms, config.jitter_ms)
+            start = self._random.randrange(len(_WORDS))
+
+        time.sleep(max(latency, 0) / 1000)
+        if fails:
+            raise FakeGenAIError("Error simulado del backend falso")
+
+        text = self._text(str(prompt), start, config.response_chars)
+        step = max(config.chunk_chars, 1)
+        for offset in range(0, len(text), step):
+            if offset:
+                time.sleep(config.chunk_interval_ms / 1000)
+            yield text[offset:offset + step]
+
+    @staticmethod
+    def _text(prompt: str, start: int, length: int) -> str:
+        words = []
+        size = 0
+        index = start
+        while size < length:
+            word = _WORDS[index % len(_WORDS)]
+            words.append(word)
+            size += len(word) + 1
+            index += 1
+        return (f"[{prompt[:40]}] " + " ".join(words))[:length]
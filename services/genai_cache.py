@@ -0,0 +1,211 @@
+"""
+Caché de respuestas de GenAIService (opt-in).
+
+Dos niveles, consultados en orden:
+1. Memoria: LRU de `memory_entries` respuestas.
+2. Disco: SQLite en la caché de la app (`cache_dir("genai")`), con límite de
+   entradas y de bytes; al pasarse se borran las menos usadas.
+
+La clave es un hash de (modelo, prompt, configuración de generación). Las
+entradas vencen a los `ttl_s` segundos. Solo se guardan respuestas exitosas.
+`stats` cuenta aciertos/fallos y la latencia ahorrada (la que tuvo la llamada
+original de cada respuesta servida desde la caché).
+
+    service = GenAIService(cache=True)            # Caché por defecto
+    service.generate_text(prompt, use_cache=False)  # Saltear la caché en una llamada
+    print(service.cache.stats.format())
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from utils.paths import cache_dir
+
+
+@dataclass
+class CacheStats:
+    """Contadores de uso de la caché (desde que se abrió)."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    expired: int = 0  # Entradas encontradas pero vencidas (cuentan también como miss)
+    stores: int = 0
+    evictions: int = 0  # Borradas del disco por los límites de tamaño
+    saved_ms: float = 0.0  # Latencia de red evitada
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def format(self) -> str:
+        return (
+            f"GenAI cache: {self.hits} aciertos ({self.memory_hits} memoria, "
+            f"{self.disk_hits} disco), {self.misses} fallos, tasa {self.hit_rate:.0%}, "
+            f"{self.saved_ms / 1000:.1f} s ahorrados"
+        )
+
+
+class ResponseCache:
+    """LRU en memoria respaldado por SQLite. Seguro para usar desde varios hilos."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_entries: int = 256,
+        max_disk_entries: int = 5000,
+        max_disk_bytes: int = 50 * 1024 * 1024,
+        ttl_s: float = 7 * 24 * 3600,
+    ):
+        if path is None:
+            try:
+                path = os.path.join(cache_dir("genai"), "responses.sqlite3")
+            except OSError as e:
+                print(f"⚠️ Error: caché de respuestas no disponible ({e}), se usa solo memoria.")
+                path = ":memory:"
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_s = ttl_s
+        self.stats = CacheStats()
+
+        self._lock = threading.Lock()
+        # key -> (respuesta, creada, latencia original en ms)
+        self._memory: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL,"
+            " accessed REAL NOT NULL, latency_ms REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+        self._db.commit()
+        count, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._disk_entries, self._disk_bytes = count, size
+
+    @staticmethod
+    def make_key(model_name: str, prompt: Any, config: Any = None) -> str:
+        """Hash estable de (modelo, prompt, configuración)."""
+        payload = json.dumps([model_name, prompt, config], sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Respuesta guardada para `key`, o None (fallo o vencida)."""
+        now = time.time()
+        with self._lock:
+            # 1. Memoria
+            cached = self._memory.get(key)
+            if cached is not None:
+                value, created, latency_ms = cached
+                if now - created <= self.ttl_s:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    self.stats.saved_ms += latency_ms
+                    return value
+                del self._memory[key]
+
+            # 2. Disco
+            row = self._db.execute(
+                "SELECT value, created, latency_ms FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            value, created, latency_ms = row
+            if now - created > self.ttl_s:
+                self._delete(key)
+                self._db.commit()
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._remember(key, (value, created, latency_ms))
+            self.stats.disk_hits += 1
+            self.stats.saved_ms += latency_ms
+            return value
+
+    def put(self, key: str, value: str, latency_ms: float = 0.0):
+        """Guarda una respuesta exitosa y la latencia que costó obtenerla."""
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._remember(key, (value, now, latency_ms))
+            self._delete(key)  # Reemplazo: descontar el tamaño anterior
+            self._db.execute(
+                "INSERT INTO responses (key, value, created, accessed, latency_ms, size)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, now, now, latency_ms, size),
+            )
+            self._disk_entries += 1
+            self._disk_bytes += size
+            self.stats.stores += 1
+            self._enforce_limits()
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._disk_entries = self._disk_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _remember(self, key: str, entry: Tuple[str, float, float]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _delete(self, key: str):
+        row = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._disk_entries -= 1
+            self._disk_bytes -= row[0]
+
+    def _enforce_limits(self):
+        """Borra las entradas menos usadas hasta quedar en el 90% de los límites."""
+        if self._disk_entries <= self.max_disk_entries and self._disk_bytes <= self.max_disk_bytes:
+            return
+        target_entries = int(self.max_disk_entries * 0.9)
+        target_bytes = int(self.max_disk_bytes * 0.9)
+        # Primero las vencidas, después por último acceso
+        self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_s,))
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        entries = len(rows)
+        total = sum(size for _key, size in rows)
+        doomed = []
+        for key, size in rows:
+            if entries <= target_entries and total <= target_bytes:
+                break
+            doomed.append((key,))
+            entries -= 1
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.stats.evictions += len(doomed)
+        self._disk_entries, self._disk_bytes = entries, total
@@ -0,0 +1,126 @@
+"""
+Cliente de GenAI compartido por todo el proceso.
+
+Construir un `genai.Client` (y leer el .env) cuesta tiempo, y cada cliente nuevo
+abre su propia conexión (handshake TLS en frío). Este módulo:
+- Lee el .env una sola vez.
+- Construye un cliente por API key, una sola vez (thread-safe), con un pool de
+  conexiones keep-alive (`KEEPALIVE_S`) que reutilizan todas las llamadas.
+- Con GENAI_BACKEND=fake entrega el cliente falso local (services/fake_genai.py).
+- `warm_up_in_background()` abre la conexión en un hilo aparte (ej. después de
+  mostrar la ventana) para que el primer mensaje no pague el handshake.
+
+`google.genai`, dotenv y el cliente falso se importan recién al usarlos, así
+importar este módulo no suma al arranque.
+
+    client = get_client()  # None si no hay API key
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Modelo por defecto de la app (Flash es más rápido para chat)
+DEFAULT_MODEL = "gemini-2.0-flash-exp"
+# Tiempo que una conexión ociosa queda abierta en el pool (httpx usa 5 s por defecto)
+KEEPALIVE_S = 120
+MAX_CONNECTIONS = 20
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_env_loaded = False
+_clients: Dict[str, object] = {}  # API key (o "fake") -> cliente
+_warm_thread: Optional[threading.Thread] = None
+
+
+def load_env():
+    """Carga el .env la primera vez que se llama."""
+    global _env_loaded
+    with _lock:
+        if not _env_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _env_loaded = True
+
+
+def get_api_key() -> Optional[str]:
+    load_env()
+    return os.getenv("GOOGLE_API_KEY")
+
+
+def get_client(api_key: str = None):
+    """Cliente compartido para `api_key` (por defecto GOOGLE_API_KEY). None si no hay key."""
+    from services.fake_genai import fake_backend_requested
+
+    load_env()
+    if fake_backend_requested():
+        key = "fake"
+    else:
+        key = api_key or os.getenv("GOOGLE_API_KEY")
+        if not key:
+            return None
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _build_client(key)
+        return client
+
+
+def warm_up(model: str = DEFAULT_MODEL) -> bool:
+    """
+    Construye el cliente y hace una consulta liviana (metadatos del modelo) para
+    dejar una conexión abierta en el pool. Bloqueante; retorna True si funcionó.
+    """
+    started = time.perf_counter()
+    client = get_client()
+    if client is None:
+        return False
+    try:
+        get = getattr(client.models, "get", None)
+        if get is not None:
+            get(model=model)
+    except Exception as e:
+        logger.warning(f"GenAI: no se pudo precalentar la conexión: {e}")
+        return False
+    logger.info(f"GenAI: conexión precalentada en {(time.perf_counter() - started) * 1000:.0f} ms")
+    return True
+
+
+def warm_up_in_background(model: str = DEFAULT_MODEL) -> Optional[threading.Thread]:
+    """Lanza `warm_up` en un hilo daemon (solo la primera vez)."""
+    global _warm_thread
+    with _lock:
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(
+                target=warm_up, args=(model,), name="GenAIWarmUp", daemon=True
+            )
+            _warm_thread.start()
+        return _warm_thread
+
+
+# ---------------------------------------------------------------------------
+# MÉTODOS PRIVADOS (Auxiliares)
+# ---------------------------------------------------------------------------
+def _build_client(key: str):
+    if key == "fake":
+        from services.fake_genai import FakeGenAIClient, FakeGenAIConfig
+
+        return FakeGenAIClient(FakeGenAIConfig.from_env())
+
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_S,
+    )
+    return genai.Client(
+        api_key=key, http_options=types.HttpOptions(client_args={"limits": limits})
+    )
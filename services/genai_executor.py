@@ -0,0 +1,361 @@
+"""
+Ejecutor compartido para las llamadas a GenAIService (u otras llamadas bloqueantes).
+
+En lugar de un QThread nuevo por mensaje, las páginas envían sus llamadas a un
+único ejecutor con un QThreadPool propio:
+- Límite de concurrencia (`max_concurrency` hilos, que se reutilizan).
+- Cola con prioridades: las peticiones que no entran esperan su turno; a igual
+  prioridad se respeta el orden de llegada.
+- Cancelación por petición: una petición en cola se descarta; una en curso deja
+  de emitir señales (y si es un stream, se corta en el siguiente fragmento).
+
+Cada `submit` retorna un GenAIRequest (QObject) cuyas señales llegan siempre al
+hilo de la GUI. Si la función retorna un iterador (ej. `send_message_stream`),
+cada elemento se emite con `chunk_received` y el resultado es el texto completo.
+
+    request = shared_executor().submit(service.generate_text, prompt)
+    request.result_ready.connect(self.on_result)
+    request.error_occurred.connect(self.on_error)
+    ...
+    request.cancel()
+
+GenAIBatchJob corre `GenAIService.generate_many` en el ejecutor y reporta el
+progreso del lote con señales (para una barra de progreso sin bloquear la GUI).
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QCoreApplication, QObject, QThreadPool, Signal, Slot
+
+# Prioridades sugeridas (cualquier entero sirve: mayor = antes)
+PRIORITY_LOW = -10
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 10
+
+logger = logging.getLogger(__name__)
+
+
+class GenAIRequest(QObject):
+    """
+    Una petición enviada al GenAIExecutor.
+
+    Estados: "queued" -> "running" -> "done" | "error" | "cancelled".
+    `finished` se emite siempre una vez, termine como termine.
+    """
+
+    chunk_received = Signal(str)  # Fragmento de un stream
+    result_ready = Signal(object)  # Resultado (texto completo si era un stream)
+    error_occurred = Signal(str)
+    cancelled = Signal()
+    finished = Signal()
+
+    # Señales internas: las emite el hilo del pool y se reciben en el de la GUI
+    _chunk = Signal(str)
+    _result = Signal(object)
+    _error = Signal(str)
+    _ran = Signal(object)  # La función terminó y el hilo quedó libre
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict, priority: int, label: str):
+        super().__init__()
+        self.priority = priority
+        self.label = label or getattr(fn, "__qualname__", "genai")
+        self.state = "queued"
+        self.result = None
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancel_event = threading.Event()
+
+        self._chunk.connect(self._on_chunk)
+        self._result.connect(self._on_result)
+        self._error.connect(self._on_error)
+
+    def is_pending(self) -> bool:
+        """True mientras está en cola o en ejecución."""
+        return self.state in ("queued", "running")
+
+    def cancel(self):
+        """
+        Cancela la petición. En cola: no llega a ejecutarse. En curso: no emite más
+        señales; la llamada bloqueante termina en segundo plano (un stream se corta
+        en el siguiente fragmento).
+        """
+        if not self.is_pending():
+            return
+        if self.state == "queued":
+            self._release()  # Nunca va a ejecutarse
+        self._cancel_event.set()
+        self.state = "cancelled"
+        self.cancelled.emit()
+        self.finished.emit()
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _execute(self):
+        """Corre en un hilo del pool."""
+        try:
+            if self._cancel_event.is_set():
+                return
+            result = self._fn(*self._args, **self._kwargs)
+            if isinstance(result, Iterator):
+                parts = []
+                for chunk in result:
+                    if self._cancel_event.is_set():
+                        close = getattr(result, "close", None)
+                        if close is not None:
+                            close()
+                        return
+                    parts.append(chunk)
+                    self._chunk.emit(chunk)
+                result = "".join(parts) if all(isinstance(p, str) for p in parts) else parts
+            if not self._cancel_event.is_set():
+                self._result.emit(result)
+        except Exception as e:
+            if not self._cancel_event.is_set():
+                self._error.emit(str(e))
+        finally:
+            self._release()
+            self._ran.emit(self)
+
+    def _release(self):
+        """Suelta la función y sus argumentos (sesiones de chat, prompts grandes)."""
+        self._fn = self._args = self._kwargs = None
+
+    @Slot(str)
+    def _on_chunk(self, chunk: str):
+        if self.state == "running":
+            self.chunk_received.emit(chunk)
+
+    @Slot(object)
+    def _on_result(self, result):
+        if self.state != "running":
+            return
+        self.result = result
+        self.state = "done"
+        self.result_ready.emit(result)
+        self.finished.emit()
+
+    @Slot(str)
+    def _on_error(self, error_text: str):
+        if self.state != "running":
+            return
+        self.state = "error"
+        self.error_occurred.emit(error_text)
+        self.finished.emit()
+
+
+class GenAIExecutor(QObject):
+    """Cola con prioridades sobre un QThreadPool acotado. Usar desde el hilo de la GUI."""
+
+    # (peticiones en cola, hilos ocupados)
+    load_changed = Signal(int, int)
+
+    def __init__(self, max_concurrency: int = 4, parent: QObject = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(max_concurrency, 1))
+        self._queue: List[Tuple[int, int, GenAIRequest]] = []  # Heap (-prioridad, orden, petición)
+        self._order = itertools.count()
+        self._queued = 0
+        # Peticiones cuya función sigue corriendo (incluye las canceladas en curso)
+        self._busy: List[GenAIRequest] = []
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._pool.maxThreadCount()
+
+    def set_max_concurrency(self, max_concurrency: int):
+        self._pool.setMaxThreadCount(max(max_concurrency, 1))
+        self._dispatch()
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def busy(self) -> int:
+        return len(self._busy)
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        priority: int = PRIORITY_NORMAL,
+        label: str = "",
+        **kwargs,
+    ) -> GenAIRequest:
+        """Encola `fn(*args, **kwargs)` y retorna la petición (ya conectable)."""
+        request = GenAIRequest(fn, args, kwargs, priority, label)
+        request.cancelled.connect(self._on_cancelled)
+        request._ran.connect(self._on_ran)
+        heapq.heappush(self._queue, (-priority, next(self._order), request))
+        self._queued += 1
+        # Puede arrancar ya: las señales del hilo llegan por la cola de eventos,
+        # así el llamador alcanza a conectar las suyas
+        self._dispatch()
+        return request
+
+    def cancel_all(self):
+        """Cancela las peticiones en cola y en curso."""
+        pending = [request for _p, _o, request in self._queue] + list(self._busy)
+        for request in pending:
+            request.cancel()
+
+    def shutdown(self, wait_ms: int = 3000):
+        """Cancela todo y espera (acotado) a que los hilos terminen. Para el cierre de la app."""
+        self.cancel_all()
+        if not self._pool.waitForDone(wait_ms):
+            logger.warning("GenAIExecutor: quedaron llamadas en curso al cerrar")
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _dispatch(self):
+        """Pasa peticiones de la cola al pool mientras haya hilos libres."""
+        while self._queue and len(self._busy) < self._pool.maxThreadCount():
+            _priority, _order, request = heapq.heappop(self._queue)
+            if request.state != "queued":
+                continue  # Cancelada mientras esperaba (ya descontada)
+            self._queued -= 1
+            request.state = "running"
+            self._busy.append(request)
+            self._pool.start(request._execute)
+        self.load_changed.emit(self._queued, len(self._busy))
+
+    @Slot()
+    def _on_cancelled(self):
+        request = self.sender()
+        if request not in self._busy:
+            # Estaba en cola: queda en el heap y _dispatch la descarta
+            self._queued -= 1
+            self.load_changed.emit(self._queued, len(self._busy))
+
+    @Slot(object)
+    def _on_ran(self, request: GenAIRequest):
+        if request in self._busy:
+            self._busy.remove(request)
+        self._dispatch()
+
+
+class GenAIBatchJob(QObject):
+    """
+    Lote de `GenAIService.generate_many` corriendo en el ejecutor, con progreso por señales.
+
+        job = GenAIBatchJob(service, prompts, max_concurrency=8)
+        job.progress.connect(lambda done, total: bar.setValue(done * 100 // total))
+        job.finished.connect(self.on_batch_done)  # BatchItems en el orden de los prompts
+        job.start()
+
+    Ocupa un lugar del ejecutor; las llamadas en paralelo corren en el pool de
+    lotes compartido de generate_many (`max_concurrency` por lote y a lo sumo
+    BATCH_MAX_WORKERS hilos entre todos los lotes).
+    """
+
+    item_finished = Signal(object)  # BatchItem, a medida que terminan
+    progress = Signal(int, int)  # (terminados, total)
+    finished = Signal(list)  # Todos los BatchItem, en el orden de los prompts
+    cancelled = Signal()
+
+    # Emitida desde el hilo del ejecutor
+    _item_ready = Signal(object)
+
+    def __init__(
+        self,
+        service,
+        prompts: Iterable[str],
+        max_concurrency: int = 4,
+        config: dict = None,
+        use_cache: bool = True,
+        priority: int = PRIORITY_LOW,
+        executor: GenAIExecutor = None,
+        parent: QObject = None,
+    ):
+        super().__init__(parent)
+        self.service = service
+        self.prompts = list(prompts)
+        self.max_concurrency = max_concurrency
+        self.config = config
+        self.use_cache = use_cache
+        self.priority = priority
+        self.executor = executor or shared_executor()
+
+        self.results: List = [None] * len(self.prompts)
+        self.completed = 0
+        self.failed = 0
+        self.request: Optional[GenAIRequest] = None
+        self._stop_event = threading.Event()
+
+        self._item_ready.connect(self._on_item_ready)
+
+    def start(self) -> GenAIRequest:
+        self.request = self.executor.submit(self._run, priority=self.priority, label="genai.batch")
+        self.request.result_ready.connect(self._on_done)
+        self.request.error_occurred.connect(self._on_error)
+        return self.request
+
+    def cancel(self):
+        """No lanza más llamadas; las que están en vuelo terminan y se descartan."""
+        self._stop_event.set()
+        if self.request is not None and self.request.is_pending():
+            self.request.cancel()
+            self.cancelled.emit()
+
+    def is_running(self) -> bool:
+        return self.request is not None and self.request.is_pending()
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _run(self):
+        """Corre en el hilo del ejecutor."""
+        items = self.service.generate_many(
+            self.prompts, self.max_concurrency, self.config, self.use_cache
+        )
+        try:
+            for item in items:
+                if self._stop_event.is_set():
+                    break
+                self._item_ready.emit(item)
+        finally:
+            items.close()
+
+    @Slot(object)
+    def _on_item_ready(self, item):
+        if self._stop_event.is_set():
+            return
+        self.results[item.index] = item
+        self.completed += 1
+        if not item.ok:
+            self.failed += 1
+        self.item_finished.emit(item)
+        self.progress.emit(self.completed, len(self.prompts))
+
+    @Slot(object)
+    def _on_done(self, _result):
+        # Los items se emitieron antes que el resultado: ya están todos en `results`
+        self.finished.emit(self.results)
+
+    @Slot(str)
+    def _on_error(self, error_text: str):
+        logger.warning(f"GenAIBatchJob: el lote falló: {error_text}")
+        self.finished.emit(self.results)
+
+
+_shared: Optional[GenAIExecutor] = None
+
+
+def shared_executor() -> GenAIExecutor:
+    """Ejecutor único de la aplicación (se crea al primer uso y se cierra con la app)."""
+    global _shared
+    if _shared is None:
+        app = QCoreApplication.instance()
+        _shared = GenAIExecutor(parent=app)
+        if app is not None:
+            app.aboutToQuit.connect(_shared.shutdown)
+    return _shared
@@ -1,48 +1,194 @@
-from google import genai
-import os
-from dotenv import load_dotenv
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Iterator, Optional, Union
+
+from services.chat_session import ManagedChatSession
+from services.genai_cache import ResponseCache
+from services.genai_client import DEFAULT_MODEL, get_api_key, get_client
+from services.model_catalog import ModelCatalog, shared_catalog
+
+# Hilos del pool compartido por todos los lotes (generate_many/agenerate_many):
+# varios lotes a la vez no suman hilos, se reparten estos
+BATCH_MAX_WORKERS = 8
+
+_batch_pool: Optional[ThreadPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+@dataclass
+class StreamMetrics:
+    """Métricas de una respuesta en streaming."""
+
+    label: str  # "generate" o "chat"
+    ttft_ms: Optional[float] = None  # Tiempo hasta el primer fragmento con texto
+    total_ms: float = 0.0
+    chunks: int = 0
+    chars: int = 0
+
+
+@dataclass
+class BatchItem:
+    """Resultado de un prompt de `generate_many`: `text` o `error`, nunca ambos."""
+
+    index: int  # Posición del prompt en la entrada
+    prompt: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class GenAIService:
     """
     Servicio wrapper para interactuar con Google Generative AI (Gemini) usando el SDK google-genai (v1.0+).
     """
 
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        cache: Union[bool, ResponseCache] = False,
+        client=None,
+        catalog: ModelCatalog = None,
+    ):
         """
         Inicializa el servicio.
         Si no se pasa api_key, intenta cargarla desde variables de entorno (GOOGLE_API_KEY).
+        El cliente es el compartido del proceso (services/genai_client.py): no se
+        reconstruye ni reabre conexiones por cada servicio.
+        `client`: backend alternativo con la API de genai.Client (ej. FakeGenAIClient).
+        Con GENAI_BACKEND=fake se usa el cliente falso local (ver services/fake_genai.py).
+        `cache`: True para la caché de respuestas por defecto, o un ResponseCache propio
+        (ver services/genai_cache.py). Solo afecta a generate_text y generate_text_stream.
+        `catalog`: catálogo de modelos donde se registra la latencia de cada llamada
+        (por defecto el compartido, ver services/model_catalog.py).
         """
-        load_dotenv()
-
-        self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
-        if not self.api_key:
+        self.api_key = api_key or get_api_key()
+        self.client = client or get_client(self.api_key)
+        if self.client is None:
             print(
                 "⚠️ Advertencia: No se encontró GOOGLE_API_KEY en variables de entorno."
             )
-            self.client = None
-        else:
-            # Inicializar cliente con el nuevo SDK
-            self.client = genai.Client(api_key=self.api_key)
 
-        # Modelo recomendado y actual (Flash es más rápido para chat)
-        self.model_name = "gemini-2.0-flash-exp"
+        # Modelo recomendado y actual (Flash es más rápido para chat); ver select_model
+        self.model_name = DEFAULT_MODEL
+        self.catalog = catalog or shared_catalog()
+
+        # Métricas de la última respuesta en streaming (time-to-first-token, etc.)
+        self.last_stream_metrics: Optional[StreamMetrics] = None
 
-    def generate_text(self, prompt: str) -> str:
+        # Caché de respuestas (opt-in)
+        if cache is True:
+            cache = ResponseCache()
+        self.cache: Optional[ResponseCache] = cache or None
+
+    def generate_text(self, prompt: str, config: dict = None, use_cache: bool = True) -> str:
         """
         Genera texto basado en un prompt simple.
+        `config`: configuración de generación (temperature, etc.).
+        `use_cache=False` saltea la caché (si está activa) en esta llamada.
         """
         if not self.client:
             return "Error: API Key no configurada."
 
         try:
-            # API nuevo SDK: client.models.generate_content
-            response = self.client.models.generate_content(
-                model=self.model_name, contents=prompt
-            )
-            return response.text
+            return self._generate(prompt, config, use_cache)
         except Exception as e:
             return f"Error generando contenido: {str(e)}"
 
+    def generate_many(
+        self,
+        prompts: Iterable[str],
+        max_concurrency: int = 4,
+        config: dict = None,
+        use_cache: bool = True,
+    ) -> Iterator[BatchItem]:
+        """
+        Ejecuta `generate_text` sobre muchos prompts con a lo sumo `max_concurrency`
+        llamadas en paralelo (en el pool compartido de lotes, que además acota el
+        total del proceso a BATCH_MAX_WORKERS). Entrega un BatchItem por prompt a medida que terminan
+        (`item.index` es la posición original); un fallo queda en `item.error` y no
+        corta el lote. Cerrar el iterador antes de tiempo no lanza más llamadas.
+
+            items = sorted(service.generate_many(prompts), key=lambda item: item.index)
+        """
+        prompts = list(prompts)
+        if not self.client:
+            for index, prompt in enumerate(prompts):
+                yield BatchItem(index, prompt, error="API Key no configurada.")
+            return
+
+        limit = max(min(max_concurrency, len(prompts)), 1)
+        pool = _shared_batch_pool()
+        pending = {}
+        next_index = 0
+        try:
+            while next_index < len(prompts) or pending:
+                # Mantener `limit` llamadas en vuelo (no se encola todo de una vez)
+                while next_index < len(prompts) and len(pending) < limit:
+                    future = pool.submit(
+                        self._batch_item, next_index, prompts[next_index], config, use_cache
+                    )
+                    pending[future] = next_index
+                    next_index += 1
+
+                done, _running = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    yield future.result()
+        finally:
+            # Las que aún no arrancaron no se ejecutan; las que corren terminan solas
+            for future in pending:
+                future.cancel()
+
+    async def agenerate_many(
+        self,
+        prompts: Iterable[str],
+        max_concurrency: int = 4,
+        config: dict = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Versión asyncio de `generate_many` (mismo contrato). Las llamadas bloqueantes
+        corren en el pool compartido de lotes, acotadas por un semáforo.
+
+            async for item in service.agenerate_many(prompts):
+                ...
+        """
+        prompts = list(prompts)
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        loop = asyncio.get_running_loop()
+
+        async def run(index: int, prompt: str) -> BatchItem:
+            async with semaphore:
+                if not self.client:
+                    return BatchItem(index, prompt, error="API Key no configurada.")
+                return await loop.run_in_executor(
+                    _shared_batch_pool(), self._batch_item, index, prompt, config, use_cache
+                )
+
+        tasks = [asyncio.ensure_future(run(i, p)) for i, p in enumerate(prompts)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def select_model(self, required_actions=("generateContent",), **filters) -> str:
+        """
+        Usa el modelo más rápido medido que cumple el filtro (ver ModelCatalog.pick).
+        No hace llamadas de red: el catálogo se lee del disco.
+        """
+        self.model_name = self.catalog.pick(required_actions, **filters)
+        return self.model_name
+
     def chat_session(self):
         """
         Inicia una sesión de chat (con historia).
@@ -52,3 +198,139 @@ class GenAIService:
         
         # API nuevo SDK: client.chats.create
         return self.client.chats.create(model=self.model_name)
+
+    def managed_chat_session(self, token_budget: int = 4000, **kwargs):
+        """
+        Sesión de chat con historial acotado: ventana de turnos recientes dentro de
+        `token_budget` y resumen de los viejos (ver services/chat_session.py).
+        """
+        if not self.client:
+            raise ValueError("API Key no configurada")
+        return ManagedChatSession(self, token_budget, **kwargs)
+
+    def generate_text_stream(
+        self, prompt: str, config: dict = None, use_cache: bool = True
+    ) -> Iterator[str]:
+        """
+        Igual que `generate_text`, pero entrega el texto en fragmentos a medida que llega.
+        Los errores se entregan como un fragmento final con el mensaje.
+        Con la caché activa, un acierto se entrega como un único fragmento.
+        """
+        if not self.client:
+            yield "Error: API Key no configurada."
+            return
+
+        key = self._cache_key(prompt, config, use_cache)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        # Latencia propia de este stream (last_stream_metrics es compartida entre hilos)
+        started = time.perf_counter()
+        try:
+            chunks = self.client.models.generate_content_stream(
+                model=self.model_name, contents=prompt, config=config
+            )
+            for text in self._timed_stream(chunks, "generate"):
+                parts.append(text)
+                yield text
+        except Exception as e:
+            yield f"Error generando contenido: {str(e)}"
+            return
+
+        # Solo se guarda la respuesta completa (un stream cortado no llega aquí)
+        if key is not None and parts:
+            self.cache.put(key, "".join(parts), (time.perf_counter() - started) * 1000)
+
+    def send_message_stream(self, chat_session, text: str) -> Iterator[str]:
+        """
+        Envía un mensaje a una sesión de `chat_session()` y entrega la respuesta en
+        fragmentos (la sesión conserva el historial igual que con `send_message`).
+        Los errores se propagan como excepción, igual que `chat_session.send_message`.
+        """
+        chunks = chat_session.send_message_stream(text)
+        yield from self._timed_stream(chunks, "chat")
+
+    def _generate(self, prompt, config, use_cache: bool) -> str:
+        """Llamada a generate_content con la caché. Los errores se propagan."""
+        key = self._cache_key(prompt, config, use_cache)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # API nuevo SDK: client.models.generate_content
+        model = self.model_name
+        started = time.perf_counter()
+        try:
+            response = self.client.models.generate_content(
+                model=model, contents=prompt, config=config
+            )
+        except Exception:
+            self.catalog.record(model, error=True)
+            raise
+        text = response.text
+        self.catalog.record(
+            model, total_ms=(time.perf_counter() - started) * 1000, chars=len(text or "")
+        )
+        if key is not None and text:
+            self.cache.put(key, text, (time.perf_counter() - started) * 1000)
+        return text
+
+    def _batch_item(self, index: int, prompt: str, config, use_cache: bool) -> BatchItem:
+        """Un prompt de generate_many; el error queda en el item en lugar de propagarse."""
+        started = time.perf_counter()
+        item = BatchItem(index, prompt)
+        try:
+            item.text = self._generate(prompt, config, use_cache)
+        except Exception as e:
+            item.error = str(e)
+        item.latency_ms = (time.perf_counter() - started) * 1000
+        return item
+
+    def _cache_key(self, prompt, config, use_cache: bool) -> Optional[str]:
+        """Clave de la caché para esta llamada, o None si no se usa la caché."""
+        if self.cache is None or not use_cache:
+            return None
+        return ResponseCache.make_key(self.model_name, prompt, config)
+
+    def _timed_stream(self, chunks: Iterable, label: str) -> Iterator[str]:
+        """Entrega el texto de cada fragmento y registra el time-to-first-token."""
+        metrics = StreamMetrics(label)
+        model = self.model_name
+        started = time.perf_counter()
+        try:
+            for chunk in chunks:
+                text = chunk.text
+                if not text:
+                    continue
+                if metrics.ttft_ms is None:
+                    metrics.ttft_ms = (time.perf_counter() - started) * 1000
+                metrics.chunks += 1
+                metrics.chars += len(text)
+                yield text
+        except Exception:
+            self.catalog.record(model, error=True)
+            raise
+
+        metrics.total_ms = (time.perf_counter() - started) * 1000
+        self.last_stream_metrics = metrics
+        self.catalog.record(model, metrics.ttft_ms, metrics.total_ms, metrics.chars)
+        logging.info(
+            f"GenAI stream ({label}): primer token {metrics.ttft_ms or 0:.0f} ms, "
+            f"total {metrics.total_ms:.0f} ms, {metrics.chunks} fragmentos, {metrics.chars} caracteres"
+        )
+
+
+def _shared_batch_pool() -> ThreadPoolExecutor:
+    """Pool acotado de los lotes, único en el proceso (se crea al primer uso)."""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ThreadPoolExecutor(
+                max_workers=BATCH_MAX_WORKERS, thread_name_prefix="genai-batch"
+            )
+        return _batch_pool
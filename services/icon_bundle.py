@@ -0,0 +1,159 @@
+"""
+Paquete indexado de iconos: todos los SVG de `assets/icons` en un único archivo.
+
+Formato de `assets/icons.bundle`:
+    MAGIC (8 bytes) | tamaño del índice (uint32 LE) | índice JSON | datos
+El índice mapea `nombre -> [offset, tamaño]` (offset relativo al inicio de los
+datos). En tiempo de ejecución el archivo se abre una vez con mmap y cada icono
+es un slice, en lugar de un open() por icono.
+
+El índice guarda además el mtime de `assets/icons` y una firma de los SVG de
+origen (nombre, mtime y tamaño de cada archivo):
+- Al arrancar solo se compara el mtime del directorio (un stat): detecta iconos
+  agregados, quitados o renombrados.
+- La firma completa detecta también ediciones en el lugar. La verifican
+  `scripts/build_assets.py` (que regenera el bundle) y, en desarrollo, la app
+  con APP_CHECK_ICON_BUNDLE=1.
+
+Se genera con `python scripts/build_icon_bundle.py`.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+
+from utils.paths import ASSETS_DIR, ICONS_DIR
+
+BUNDLE_PATH = os.path.join(ASSETS_DIR, "icons.bundle")
+CHECK_ENV_VAR = "APP_CHECK_ICON_BUNDLE"
+MAGIC = b"ICNBNDL1"
+_HEADER = struct.Struct("<I")
+
+
+def write_bundle(icon_paths: Iterable[str], bundle_path: str = BUNDLE_PATH) -> int:
+    """
+    Empaqueta los archivos indicados en un bundle (escritura atómica).
+
+    Returns:
+        int: Cantidad de iconos empaquetados.
+    """
+    entries: Dict[str, Tuple[int, int]] = {}
+    chunks = []
+    offset = 0
+    for path in sorted(icon_paths):
+        with open(path, "rb") as f:
+            data = f.read()
+        entries[os.path.basename(path)] = (offset, len(data))
+        chunks.append(data)
+        offset += len(data)
+
+    index = json.dumps(
+        {
+            "source_mtime_ns": icons_dir_mtime_ns(),
+            "source_signature": source_signature(),
+            "entries": entries,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    tmp_path = f"{bundle_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(index)))
+        f.write(index)
+        for data in chunks:
+            f.write(data)
+    os.replace(tmp_path, bundle_path)
+    return len(entries)
+
+
+class IconBundle:
+    """Lector del bundle: un único open + mmap, acceso O(1) por nombre."""
+
+    def __init__(self, path: str = BUNDLE_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._map[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"'{path}' no es un bundle de iconos válido")
+            (index_size,) = _HEADER.unpack_from(self._map, len(MAGIC))
+            index_start = len(MAGIC) + _HEADER.size
+            index = json.loads(self._map[index_start : index_start + index_size])
+        except Exception:
+            self._file.close()
+            raise
+        self.source_mtime_ns: int = index["source_mtime_ns"]
+        # Bundles de versiones anteriores no tienen firma: quedan desactualizados
+        self.source_signature: str = index.get("source_signature", "")
+        self._entries: Dict[str, Tuple[int, int]] = index["entries"]
+        self._data_start = index_start + index_size
+
+    @classmethod
+    def open_if_fresh(cls, path: str = BUNDLE_PATH, full_check: bool = None) -> Optional["IconBundle"]:
+        """
+        Abre el bundle si existe y `assets/icons` no cambió desde que se generó. Si no, None.
+
+        Por defecto solo compara el mtime del directorio; con `full_check` (o
+        APP_CHECK_ICON_BUNDLE=1) compara además la firma de cada SVG.
+        """
+        if full_check is None:
+            full_check = os.environ.get(CHECK_ENV_VAR, "") not in ("", "0")
+        try:
+            bundle = cls(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        if bundle.source_mtime_ns != icons_dir_mtime_ns() or (
+            full_check and bundle.source_signature != source_signature()
+        ):
+            print("⚠️ Advertencia: icons.bundle desactualizado, ejecuta scripts/build_icon_bundle.py")
+            bundle.close()
+            return None
+        return bundle
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def names(self):
+        """Nombres de los iconos empaquetados."""
+        return self._entries.keys()
+
+    def read(self, name: str) -> Optional[bytes]:
+        """Contenido del icono, o None si no está en el bundle."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        offset, size = entry
+        start = self._data_start + offset
+        return self._map[start : start + size]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def source_signature() -> str:
+    """Firma de `assets/icons/*.svg`: hash de (nombre, mtime_ns, tamaño) de cada archivo."""
+    digest = hashlib.sha256()
+    try:
+        entries = sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in os.scandir(ICONS_DIR)
+            if entry.name.endswith(".svg")
+        )
+    except OSError:
+        return ""
+    for name, mtime_ns, size in entries:
+        digest.update(f"{name}:{mtime_ns}:{size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def icons_dir_mtime_ns() -> int:
+    """mtime de `assets/icons` (cambia al agregar, quitar o renombrar iconos)."""
+    try:
+        return os.stat(ICONS_DIR).st_mtime_ns
+    except OSError:
+        return 0
@@ -0,0 +1,217 @@
+"""
+Servicio de iconos compartido.
+
+Cada SVG se lee una sola vez (del bundle `assets/icons.bundle` si existe, o del
+archivo suelto como respaldo) y se re-colorea en memoria con el
+`@icon_color` del tema activo. Los pixmaps rasterizados se cachean (LRU) por
+(nombre, tamaño, device-pixel-ratio, color), así un cambio de tema re-tiñe los
+iconos sin volver a tocar el disco.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QByteArray, QObject, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QIcon, QIconEngine, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+from services.icon_bundle import IconBundle
+from utils.paths import ASSETS_DIR, ICONS_DIR, cache_dir
+
+DEFAULT_ICON_COLOR = "#e5e5e5"
+# PNG pre-rasterizados por scripts/build_assets.py: <color>/<nombre>-<tamaño>@2x.png
+PREBUILT_DIR = os.path.join(ASSETS_DIR, "build", "icons")
+
+
+def get_icon_path(filename: str) -> str:
+    """Retorna la ruta absoluta al icono."""
+    return os.path.join(ICONS_DIR, filename)
+
+
+class ThemedIconEngine(QIconEngine):
+    """
+    Motor de QIcon que pide el pixmap al IconService en cada paint.
+    Así el icono siempre usa el color vigente del tema sin recrear el QIcon.
+    """
+
+    def __init__(self, service: "IconService", name: str):
+        super().__init__()
+        self._service = service
+        self._name = name
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float
+    ) -> QPixmap:
+        return self._service.pixmap(
+            self._name, size, scale, disabled=mode == QIcon.Mode.Disabled
+        )
+
+    def paint(self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State):
+        scale = painter.device().devicePixelRatioF() if painter.device() else 1.0
+        painter.drawPixmap(rect, self.scaledPixmap(rect.size(), mode, state, scale))
+
+    def clone(self) -> "ThemedIconEngine":
+        return ThemedIconEngine(self._service, self._name)
+
+    def key(self) -> str:
+        return "ThemedIconEngine"
+
+
+class IconService(QObject):
+    """
+    Carga, re-colorea y cachea los iconos SVG de `assets/icons`.
+
+    Uso: `get_icon_service().icon("home.svg")` devuelve un QIcon que se re-tiñe
+    solo cuando el tema cambia (`set_color`, llamado por ThemeManager).
+    """
+
+    # Se emite con el nuevo color cuando cambia el tema
+    color_changed = Signal(str)
+
+    def __init__(self, max_pixmaps: int = 256):
+        super().__init__()
+        self.max_pixmaps = max_pixmaps
+        self._color = DEFAULT_ICON_COLOR
+        self._svg_data: Dict[str, bytes] = {}
+        self._renderers: Dict[str, QSvgRenderer] = {}
+        self._pixmaps: "OrderedDict[Tuple, QPixmap]" = OrderedDict()
+        self._bundle: Optional[IconBundle] = None
+        self._bundle_checked = False
+
+    @property
+    def color(self) -> str:
+        """Color actual de los iconos."""
+        return self._color
+
+    def set_color(self, color: str):
+        """Cambia el color de los iconos (no invalida la caché: la clave incluye el color)."""
+        if color == self._color:
+            return
+        self._color = color
+        self.color_changed.emit(color)
+
+    def icon(self, name: str) -> QIcon:
+        """QIcon temático para el SVG `name` (ej. "home.svg")."""
+        return QIcon(ThemedIconEngine(self, name))
+
+    def pixmap(
+        self,
+        name: str,
+        size: QSize,
+        device_pixel_ratio: float = 1.0,
+        color: Optional[str] = None,
+        disabled: bool = False,
+    ) -> QPixmap:
+        """Pixmap re-coloreado del icono (cacheado por nombre, tamaño, dpr y color)."""
+        color = color or self._color
+        key = (name, size.width(), size.height(), device_pixel_ratio, color, disabled)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = self._render(name, size, device_pixel_ratio, color, disabled)
+        self._pixmaps[key] = pixmap
+        if len(self._pixmaps) > self.max_pixmaps:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def icon_file(self, name: str, size: int, color: Optional[str] = None) -> str:
+        """
+        Ruta a un PNG re-coloreado del icono (para `image: url(...)` en QSS).
+        Usa el PNG del pipeline de assets si existe; si no, se genera una sola vez
+        por (nombre, tamaño, color) en la caché de la app. Si la caché no se puede
+        escribir, retorna el SVG original.
+        """
+        color = color or self._color
+        stem = os.path.splitext(name)[0]
+        prebuilt = os.path.join(
+            PREBUILT_DIR, color.lstrip("#").lower(), f"{stem}-{size}@2x.png"
+        )
+        if os.path.exists(prebuilt):
+            return prebuilt.replace(os.sep, "/")
+
+        try:
+            path = os.path.join(
+                cache_dir("icons"), f"{stem}-{size}-{color.lstrip('#')}@2x.png"
+            )
+        except OSError as e:
+            # Sin caché en disco: el SVG original (sin re-colorear) sigue siendo válido
+            print(f"⚠️ Error: caché de iconos no disponible ({e}), se usa el SVG original.")
+            return get_icon_path(name).replace(os.sep, "/")
+        if not os.path.exists(path):
+            if not self.pixmap(name, QSize(size, size), 2.0, color).save(path, "PNG"):
+                return get_icon_path(name).replace(os.sep, "/")
+        return path.replace(os.sep, "/")
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _renderer(self, name: str) -> QSvgRenderer:
+        """QSvgRenderer del icono; el SVG se lee una sola vez."""
+        renderer = self._renderers.get(name)
+        if renderer is None:
+            renderer = QSvgRenderer(QByteArray(self._read_svg(name)))
+            self._renderers[name] = renderer
+        return renderer
+
+    def _read_svg(self, name: str) -> bytes:
+        data = self._svg_data.get(name)
+        if data is None and self._get_bundle() is not None:
+            data = self._bundle.read(name)
+            if data is not None:
+                self._svg_data[name] = data
+        if data is None:
+            try:
+                with open(get_icon_path(name), "rb") as f:
+                    data = f.read()
+            except OSError:
+                print(f"⚠️ Error: No se encontró el icono '{name}'.")
+                data = b""
+            self._svg_data[name] = data
+        return data
+
+    def _get_bundle(self) -> Optional[IconBundle]:
+        """Abre el bundle de iconos una sola vez (None si no existe o está desactualizado)."""
+        if not self._bundle_checked:
+            self._bundle_checked = True
+            self._bundle = IconBundle.open_if_fresh()
+        return self._bundle
+
+    def _render(
+        self, name: str, size: QSize, device_pixel_ratio: float, color: str, disabled: bool
+    ) -> QPixmap:
+        """Rasteriza el SVG y lo tiñe: SourceIn conserva la forma (alpha) y aplica el color."""
+        pixmap = QPixmap(size * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        renderer = self._renderer(name)
+        if not renderer.isValid():
+            return pixmap
+
+        tint = QColor(color)
+        if disabled:
+            tint.setAlphaF(tint.alphaF() * 0.4)
+
+        painter = QPainter(pixmap)
+        renderer.render(painter, QRect(0, 0, size.width(), size.height()))
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(QRect(0, 0, size.width(), size.height()), tint)
+        painter.end()
+        return pixmap
+
+
+_icon_service: Optional[IconService] = None
+
+
+def get_icon_service() -> IconService:
+    """Instancia compartida del servicio de iconos."""
+    global _icon_service
+    if _icon_service is None:
+        _icon_service = IconService()
+    return _icon_service
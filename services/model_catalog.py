@@ -0,0 +1,350 @@
+"""
+Catálogo de modelos de GenAI con caché en disco y latencias medidas.
+
+- La lista de `client.models.list()` se guarda en la caché de la app
+  (`cache_dir("genai")`) y vence a los `ttl_s` segundos. Al arrancar se lee el
+  disco (sin red); si está vencida, `refresh_in_background()` la renueva en un hilo.
+- GenAIService registra cada llamada real (`record`): latencia hasta el primer
+  texto y velocidad (caracteres/s), como promedios móviles exponenciales por modelo.
+- `probe_unmeasured()` mide con una llamada corta los modelos de uso general que
+  todavía no tienen mediciones (a lo sumo `probe_models` por vez, en el hilo de
+  `refresh_in_background()`): así los modelos que la app no usa también compiten.
+- `pick()` elige el modelo más rápido medido entre los que cumplen un filtro de
+  capacidades; sin mediciones, el modelo por defecto o un "flash" de uso general
+  (nunca una variante especializada como -tts, -image-generation o -live).
+
+    catalog = shared_catalog()
+    service.model_name = catalog.pick(required_actions=("generateContent",))
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from services.fake_genai import fake_backend_requested
+from services.genai_client import DEFAULT_MODEL, get_client
+from utils.paths import cache_dir
+
+# Peso de la última medición en los promedios móviles
+EWMA_ALPHA = 0.3
+# Largo de respuesta típico para comparar modelos (latencia + tiempo de generarla)
+EXPECTED_CHARS = 500
+# Modelos que fallan más que esto (con al menos MIN_SAMPLES llamadas) no se eligen
+MAX_ERROR_RATE = 0.5
+MIN_SAMPLES = 3
+# Partes del nombre de las variantes especializadas (voz, imágenes, tiempo real,
+# embeddings): anuncian generateContent pero no sirven para chat de texto
+SPECIALIZED_MARKERS = {"tts", "image", "live", "audio", "embedding", "imagen", "veo", "aqa"}
+# Sondeo de modelos sin mediciones: respuesta de largo típico (mide latencia y velocidad)
+PROBE_PROMPT = "Escribe un párrafo de unas 80 palabras sobre cómo se forma el arcoíris."
+PROBE_MAX_MODELS = 3
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelInfo:
+    """Un modelo del catálogo (nombre sin el prefijo "models/")."""
+
+    name: str
+    display_name: str = ""
+    supported_actions: List[str] = field(default_factory=list)
+    input_token_limit: int = 0
+    output_token_limit: int = 0
+
+
+@dataclass
+class ModelStats:
+    """Rendimiento observado de un modelo en llamadas reales."""
+
+    ttft_ms: Optional[float] = None  # Promedio móvil hasta el primer texto
+    chars_per_s: Optional[float] = None  # Promedio móvil de velocidad de generación
+    samples: int = 0
+    errors: int = 0
+    last_used: float = 0.0
+
+    def expected_ms(self, chars: int = EXPECTED_CHARS) -> Optional[float]:
+        """Tiempo estimado para una respuesta de `chars` caracteres."""
+        if self.ttft_ms is None:
+            return None
+        generation = chars / self.chars_per_s * 1000 if self.chars_per_s else 0.0
+        return self.ttft_ms + generation
+
+
+def _short_name(name: str) -> str:
+    return name.split("/", 1)[1] if name.startswith("models/") else name
+
+
+def _is_specialized(name: str) -> bool:
+    return not SPECIALIZED_MARKERS.isdisjoint(name.split("-"))
+
+
+class ModelCatalog:
+    """Lista de modelos cacheada en disco más estadísticas por modelo. Thread-safe."""
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl_s: float = 24 * 3600,
+        client_provider: Callable = get_client,
+        save_interval_s: float = 30,
+        probe_models: int = PROBE_MAX_MODELS,
+    ):
+        if path is None:
+            # El backend falso no debe mezclar sus modelos con los reales
+            filename = "models-fake.json" if fake_backend_requested() else "models.json"
+            try:
+                path = os.path.join(cache_dir("genai"), filename)
+            except OSError as e:
+                print(f"⚠️ Error: caché de modelos no disponible ({e}), el catálogo queda en memoria.")
+        self.path: Optional[str] = path  # None: catálogo solo en memoria
+        self.ttl_s = ttl_s
+        self.client_provider = client_provider
+        self.save_interval_s = save_interval_s
+        self.probe_models = probe_models  # 0: no sondear (solo compiten los modelos usados)
+
+        self._lock = threading.Lock()
+        self._models: Dict[str, ModelInfo] = {}
+        self._stats: Dict[str, ModelStats] = {}
+        self._fetched_at = 0.0
+        self._saved_at = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._load()
+
+    @property
+    def fetched_at(self) -> float:
+        return self._fetched_at
+
+    def is_stale(self) -> bool:
+        return time.time() - self._fetched_at > self.ttl_s
+
+    def models(self) -> List[ModelInfo]:
+        with self._lock:
+            return list(self._models.values())
+
+    def stats(self, model: str) -> Optional[ModelStats]:
+        with self._lock:
+            return self._stats.get(_short_name(model))
+
+    def refresh(self) -> bool:
+        """Descarga la lista de modelos (bloqueante). Retorna True si se actualizó."""
+        client = self.client_provider()
+        if client is None:
+            return False
+        try:
+            models = [
+                ModelInfo(
+                    name=_short_name(m.name),
+                    display_name=m.display_name or "",
+                    supported_actions=list(m.supported_actions or []),
+                    input_token_limit=m.input_token_limit or 0,
+                    output_token_limit=m.output_token_limit or 0,
+                )
+                for m in client.models.list()
+            ]
+        except Exception as e:
+            logger.warning(f"ModelCatalog: no se pudo listar los modelos: {e}")
+            return False
+
+        with self._lock:
+            self._models = {m.name: m for m in models}
+            self._fetched_at = time.time()
+        self.save()
+        logger.info(f"ModelCatalog: {len(models)} modelos actualizados")
+        return True
+
+    def refresh_in_background(self) -> Optional[threading.Thread]:
+        """
+        En un hilo daemon (uno a la vez): renueva la lista si está vencida y sondea
+        los modelos sin mediciones. None si no hay nada que hacer.
+        """
+        with self._lock:
+            if not self.is_stale() and not (self.probe_models and self._unmeasured()):
+                return None
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return self._refresh_thread
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_and_probe, name="ModelCatalogRefresh", daemon=True
+            )
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def probe_unmeasured(self, max_models: int = None) -> List[str]:
+        """
+        Mide (bloqueante) hasta `max_models` modelos de uso general que nunca se
+        usaron, con una llamada en stream de largo típico. Los "flash" van primero.
+        Retorna los modelos medidos.
+        """
+        limit = self.probe_models if max_models is None else max_models
+        with self._lock:
+            names = sorted(self._unmeasured(), key=lambda name: "flash" not in name)[:limit]
+        if not names:
+            return []
+        client = self.client_provider()
+        if client is None:
+            return []
+
+        probed = []
+        for name in names:
+            started = time.perf_counter()
+            ttft_ms = None
+            chars = 0
+            try:
+                for chunk in client.models.generate_content_stream(model=name, contents=PROBE_PROMPT):
+                    if chunk.text:
+                        if ttft_ms is None:
+                            ttft_ms = (time.perf_counter() - started) * 1000
+                        chars += len(chunk.text)
+            except Exception as e:
+                logger.warning(f"ModelCatalog: falló el sondeo de {name}: {e}")
+                self.record(name, error=True)
+                continue
+            self.record(name, ttft_ms, (time.perf_counter() - started) * 1000, chars)
+            probed.append(name)
+        if probed:
+            self.save()
+            logger.info(f"ModelCatalog: modelos sondeados: {', '.join(probed)}")
+        return probed
+
+    def record(
+        self,
+        model: str,
+        ttft_ms: Optional[float] = None,
+        total_ms: float = 0.0,
+        chars: int = 0,
+        error: bool = False,
+    ):
+        """Registra una llamada real a `model` (la llama GenAIService)."""
+        with self._lock:
+            stats = self._stats.setdefault(_short_name(model), ModelStats())
+            stats.samples += 1
+            stats.last_used = time.time()
+            if error:
+                stats.errors += 1
+            elif ttft_ms is not None:
+                # Stream: separa la espera inicial de la generación
+                stats.ttft_ms = self._ewma(stats.ttft_ms, ttft_ms)
+                generation_s = (total_ms - ttft_ms) / 1000
+                if chars and generation_s > 0:
+                    stats.chars_per_s = self._ewma(stats.chars_per_s, chars / generation_s)
+            else:
+                # Sin stream solo hay el total: se descuenta la generación estimada
+                generation_ms = chars / stats.chars_per_s * 1000 if stats.chars_per_s else 0.0
+                stats.ttft_ms = self._ewma(stats.ttft_ms, max(total_ms - generation_ms, 0.0))
+            due = time.time() - self._saved_at > self.save_interval_s
+        if due:
+            self.save()
+
+    def pick(
+        self,
+        required_actions: Iterable[str] = ("generateContent",),
+        min_input_tokens: int = 0,
+        name_contains: str = "",
+        default: str = DEFAULT_MODEL,
+    ) -> str:
+        """
+        Modelo más rápido que cumple el filtro, entre los que ya tienen mediciones
+        (de llamadas reales o de `probe_unmeasured`; uno sin medir nunca se prefiere
+        a uno medido). Sin catálogo
+        retorna `default`; sin mediciones, `default` si está disponible, si no el
+        primer "flash" de uso general y si no el primero de uso general que cumpla.
+        Las variantes especializadas solo se eligen si el filtro no deja otras.
+        """
+        required = set(required_actions)
+        with self._lock:
+            candidates = [
+                m for m in self._models.values()
+                if required.issubset(m.supported_actions)
+                and m.input_token_limit >= min_input_tokens
+                and name_contains in m.name
+            ]
+            if not candidates:
+                return default
+
+            measured = []
+            for m in candidates:
+                stats = self._stats.get(m.name)
+                if stats is None or stats.expected_ms() is None:
+                    continue
+                if stats.samples >= MIN_SAMPLES and stats.errors / stats.samples > MAX_ERROR_RATE:
+                    continue
+                measured.append((stats.expected_ms(), m.name))
+        if measured:
+            return min(measured)[1]
+
+        names = [m.name for m in candidates]
+        if default in names:
+            return default
+        general = [name for name in names if not _is_specialized(name)] or names
+        flash = [name for name in general if "flash" in name]
+        return (flash or general)[0]
+
+    def save(self):
+        """Escribe catálogo y estadísticas (reemplazo atómico del archivo)."""
+        with self._lock:
+            data = {
+                "fetched_at": self._fetched_at,
+                "models": [asdict(m) for m in self._models.values()],
+                "stats": {name: asdict(s) for name, s in self._stats.items()},
+            }
+            self._saved_at = time.time()
+        if self.path is None:
+            return
+        tmp = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️ Error: no se pudo guardar el catálogo de modelos: {e}")
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _refresh_and_probe(self):
+        if self.is_stale():
+            self.refresh()
+        if self.probe_models:
+            self.probe_unmeasured()
+
+    def _unmeasured(self) -> List[str]:
+        """Modelos de chat de uso general sin ninguna llamada registrada (con el lock tomado)."""
+        return [
+            m.name for m in self._models.values()
+            if "generateContent" in m.supported_actions
+            and not _is_specialized(m.name)
+            and m.name not in self._stats
+        ]
+
+    def _load(self):
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._models = {m["name"]: ModelInfo(**m) for m in data.get("models", [])}
+            self._stats = {n: ModelStats(**s) for n, s in data.get("stats", {}).items()}
+            self._fetched_at = data.get("fetched_at", 0.0)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"⚠️ Error: catálogo de modelos ilegible, se descarta: {e}")
+
+    @staticmethod
+    def _ewma(current: Optional[float], value: float) -> float:
+        return value if current is None else current + EWMA_ALPHA * (value - current)
+
+
+_shared: Optional[ModelCatalog] = None
+_shared_lock = threading.Lock()
+
+
+def shared_catalog() -> ModelCatalog:
+    """Catálogo único del proceso (se lee del disco al primer uso, sin red)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ModelCatalog()
+        return _shared
@@ -0,0 +1,243 @@
+"""
+Índice de búsqueda de la paleta de comandos (barra de búsqueda del Header).
+
+Cada entrada (página, página de configuración, palabras clave) se indexa al
+registrarse, de forma incremental:
+- Prefijos del título completo y de cada palabra (hasta MAX_PREFIX caracteres).
+- Trigramas del texto completo (título + palabras clave).
+
+Una búsqueda llena los resultados por niveles y se detiene al alcanzar el
+límite, así el costo depende de los resultados pedidos y no del tamaño del índice:
+1. El título empieza con la consulta.
+2. Cada palabra de la consulta es prefijo de alguna palabra de la entrada.
+3. La consulta aparece dentro del texto (intersección de trigramas).
+4. Aproximada: palabras del vocabulario con trigramas parecidos (errores de tipeo).
+
+No depende de Qt.
+"""
+
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Largo máximo de los prefijos indexados; consultas más largas se verifican con startswith
+MAX_PREFIX = 6
+# Similitud mínima (coeficiente de Dice sobre trigramas) para un resultado aproximado
+FUZZY_MIN_SIMILARITY = 0.45
+
+
+def normalize(text: str) -> str:
+    """Minúsculas, sin acentos y con espacios simples ("Configuración" -> "configuracion")."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigramas de un texto normalizado, con un espacio de relleno a cada lado."""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class SearchEntry:
+    """Una entrada del índice: algo a lo que se puede navegar."""
+
+    kind: str  # "page" o "config"
+    key: str  # Key con la que se registró (sirve para navigate_to / navigate_to_config)
+    title: str  # Texto visible
+    keywords: Tuple[str, ...] = ()
+    # Campos derivados (los completa SearchIndex)
+    norm_title: str = field(default="", repr=False)
+    words: Tuple[str, ...] = field(default=(), repr=False)
+    haystack: str = field(default="", repr=False)
+
+
+class SearchIndex:
+    """Índice incremental de entradas para la paleta de comandos."""
+
+    def __init__(self):
+        self._entries: List[SearchEntry] = []
+        self._ids: Dict[Tuple[str, str], int] = {}  # (kind, key) -> id
+        self._title_prefix: Dict[str, List[int]] = {}
+        self._word_prefix: Dict[str, List[int]] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
+        # Vocabulario para la búsqueda aproximada
+        self._word_entries: Dict[str, List[int]] = {}
+        self._word_grams: Dict[str, int] = {}  # palabra -> cantidad de trigramas
+        self._vocab_grams: Dict[str, Set[str]] = {}  # trigrama -> palabras
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self, kind: str, key: str, title: str, keywords: Iterable[str] = ()
+    ) -> SearchEntry:
+        """
+        Agrega una entrada. Si (kind, key) ya existe, solo se suman las palabras clave nuevas.
+        """
+        entry_id = self._ids.get((kind, key))
+        if entry_id is not None:
+            return self.add_keywords(kind, key, keywords)
+
+        entry_id = len(self._entries)
+        entry = SearchEntry(kind, key, title)
+        entry.norm_title = normalize(title)
+        self._entries.append(entry)
+        self._ids[(kind, key)] = entry_id
+
+        for prefix in self._prefixes(entry.norm_title):
+            self._title_prefix.setdefault(prefix, []).append(entry_id)
+        self._index_words(entry_id, entry.norm_title.split())
+        self._refresh_haystack(entry_id, entry.norm_title)
+
+        if keywords:
+            self.add_keywords(kind, key, keywords)
+        return entry
+
+    def add_keywords(self, kind: str, key: str, keywords: Iterable[str]) -> Optional[SearchEntry]:
+        """Agrega palabras clave a una entrada existente (ej. declaradas por la página al construirse)."""
+        entry_id = self._ids.get((kind, key))
+        if entry_id is None:
+            return None
+        entry = self._entries[entry_id]
+
+        new = tuple(k for k in keywords if k and k not in entry.keywords)
+        if not new:
+            return entry
+        entry.keywords += new
+
+        normalized = normalize(" ".join(new))
+        self._index_words(entry_id, normalized.split())
+        self._refresh_haystack(entry_id, normalized)
+        return entry
+
+    def search(self, query: str, limit: int = 8) -> List[SearchEntry]:
+        """Retorna hasta `limit` entradas ordenadas por relevancia."""
+        q = normalize(query)
+        if not q or limit <= 0:
+            return []
+
+        results: List[int] = []
+        seen: Set[int] = set()
+
+        def take(entry_ids: Iterable[int], match) -> bool:
+            """Agrega los ids que cumplen `match`; retorna True al llenar el límite."""
+            for entry_id in entry_ids:
+                if entry_id not in seen and match(self._entries[entry_id]):
+                    seen.add(entry_id)
+                    results.append(entry_id)
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        # 1. El título empieza con la consulta
+        if take(self._title_prefix.get(q[:MAX_PREFIX], ()), lambda e: e.norm_title.startswith(q)):
+            return self._to_entries(results)
+
+        # 2. Cada palabra de la consulta es prefijo de alguna palabra de la entrada
+        tokens = q.split()
+        candidates = min(
+            (self._word_prefix.get(t[:MAX_PREFIX], ()) for t in tokens), key=len
+        )
+        if take(
+            candidates,
+            lambda e: all(any(w.startswith(t) for w in e.words) for t in tokens),
+        ):
+            return self._to_entries(results)
+
+        # 3. La consulta aparece dentro del texto (sus trigramas interiores, sin relleno)
+        if len(q) >= 3:
+            inner = {q[i:i + 3] for i in range(len(q) - 2)}
+            postings = sorted((self._trigrams.get(g, set()) for g in inner), key=len)
+            if postings[0]:
+                exact = set.intersection(*postings)
+                if take(sorted(exact), lambda e: q in e.haystack):
+                    return self._to_entries(results)
+
+        # 4. Aproximada: cada palabra de la consulta se compara contra el vocabulario
+        # (mucho más chico que el número de entradas) y luego se mapea a entradas
+        take(self._fuzzy(tokens), lambda e: True)
+        return self._to_entries(results)
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _prefixes(text: str) -> Iterable[str]:
+        return (text[:n] for n in range(1, min(len(text), MAX_PREFIX) + 1))
+
+    def _index_words(self, entry_id: int, words: List[str]):
+        entry = self._entries[entry_id]
+        new_words = [w for w in dict.fromkeys(words) if w not in entry.words]
+        entry.words += tuple(new_words)
+        for word in new_words:
+            self._index_vocabulary(word, entry_id)
+            for prefix in self._prefixes(word):
+                posting = self._word_prefix.setdefault(prefix, [])
+                # Una palabra repetida en la entrada no debe duplicar el id
+                if not posting or posting[-1] != entry_id:
+                    posting.append(entry_id)
+
+    def _index_vocabulary(self, word: str, entry_id: int):
+        entries = self._word_entries.get(word)
+        if entries is None:
+            entries = self._word_entries[word] = []
+            grams = trigrams(word)
+            self._word_grams[word] = len(grams)
+            for gram in grams:
+                self._vocab_grams.setdefault(gram, set()).add(word)
+        entries.append(entry_id)
+
+    def _similar_words(self, token: str) -> Dict[str, float]:
+        """Palabras del vocabulario parecidas a `token` -> similitud (1.0 si es prefijo)."""
+        grams = trigrams(token)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._vocab_grams.get(gram, ()))
+
+        similar = {}
+        for word, hits in shared.items():
+            score = 2 * hits / (len(grams) + self._word_grams[word])
+            if word.startswith(token):
+                score = 1.0
+            if score >= FUZZY_MIN_SIMILARITY:
+                similar[word] = score
+        return similar
+
+    def _fuzzy(self, tokens: List[str]) -> Iterable[int]:
+        """Entradas donde cada palabra de la consulta tiene una palabra parecida, por puntaje."""
+        matches = [self._similar_words(t) for t in tokens]
+        if not all(matches):
+            return []
+        if len(matches) == 1:
+            # Una sola palabra: el puntaje de la entrada es el de la palabra; se
+            # recorren las palabras de mejor a peor y take() corta al llenar el límite
+            ranked = sorted(matches[0].items(), key=lambda item: -item[1])
+            return (i for word, _score in ranked for i in self._word_entries[word])
+
+        # Candidatos: entradas con alguna palabra parecida a CADA palabra de la consulta
+        candidates = set.intersection(
+            *(
+                {i for word in match for i in self._word_entries[word]}
+                for match in matches
+            )
+        )
+
+        scored = []
+        for entry_id in candidates:
+            words = self._entries[entry_id].words
+            total = sum(max(match.get(w, 0.0) for w in words) for match in matches)
+            scored.append((-total, entry_id))
+        scored.sort()
+        return [entry_id for _score, entry_id in scored]
+
+    def _refresh_haystack(self, entry_id: int, text: str):
+        entry = self._entries[entry_id]
+        entry.haystack = f"{entry.haystack} {text}".strip()
+        for gram in trigrams(text):
+            self._trigrams.setdefault(gram, set()).add(entry_id)
+
+    def _to_entries(self, entry_ids: List[int]) -> List[SearchEntry]:
+        return [self._entries[i] for i in entry_ids]
@@ -1,5 +1,15 @@
+import hashlib
+import json
+import os
+import re
 from enum import Enum
-from PySide6.QtWidgets import QApplication
+from typing import Dict, Iterable, List, Optional
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from services.icon_service import get_icon_service
+from utils.paths import STYLES_DIR, cache_dir
+from utils.startup_profiler import profiler
 
 
 class ThemeType(str, Enum):
@@ -101,24 +111,74 @@ THEME_PALETTES = {
 }
 
 
+# Variables de la plantilla: "@" + identificador (ej. @bg_root, @bg_root_alt)
+VARIABLE_PATTERN = re.compile(r"(@[A-Za-z_][A-Za-z0-9_]*)")
+
+TEMPLATE_PATH = os.path.join(STYLES_DIR, "style.qss")
+# Fuentes del QSS compilado: si cambian, la caché en disco se invalida
+CACHE_SOURCES = (TEMPLATE_PATH, os.path.abspath(__file__))
+CACHE_VERSION = "v1"
+
+
 class ThemeManager:
     """
     Gestor de temas, carga las hojas de estilo qss.
+
+    La plantilla se compila una sola vez en una lista de segmentos (texto literal
+    y variables), así renderizar un tema es un único join. El QSS renderizado se
+    memoriza por tema: volver a un tema ya usado es una búsqueda en un dict.
+
+    Además se guarda en disco (`.cache/qss/<TEMA>.qss`) con una cabecera que
+    contiene el hash de la plantilla + paleta y la firma (mtime/tamaño) de
+    style.qss y themes.py. En un arranque en frío con caché válida se hace una
+    única lectura y ningún procesamiento de la plantilla.
     """
 
     def __init__(self, initial_theme: ThemeType):
         self._current_theme: ThemeType = initial_theme
 
         self._template_content: str = ""
+        # Plantilla compilada: segmentos y posiciones de las variables dentro de ella
+        self._segments: List[str] = []
+        self._variable_slots: List[int] = []
+        # QSS ya renderizado por tema
+        self._qss_cache: Dict[ThemeType, str] = {}
+
+        # La plantilla se carga recién si la caché en disco no sirve
+        self._template_loaded = False
 
-        # Cargar plantilla inicial
-        self._load_template()
+    @property
+    def current_theme(self) -> ThemeType:
+        return self._current_theme
 
     # -------------------------------------------------------------------------
     # GESTIÓN DE TEMAS
     # -------------------------------------------------------------------------
-    def apply_theme(self, theme_type: ThemeType) -> None:
-        """Aplica un tema específico a la aplicación."""
+    def apply_theme(
+        self, theme_type: ThemeType, scope: Optional[Iterable[QWidget]] = None
+    ) -> None:
+        """
+        Aplica un tema específico a la aplicación.
+
+        Sin `scope`, el QSS se aplica con `QApplication.setStyleSheet` (re-pule TODOS
+        los widgets). Con `scope`, se aplica solo a esas ventanas: el QSS de ventana
+        tiene prioridad sobre el de la aplicación y solo re-pule su árbol de widgets
+        (ver `Interface.apply_theme`, que además saca del árbol las páginas ocultas).
+
+        Con `scope` el QSS de la aplicación no cambia (actualizarlo re-pule también
+        las páginas ocultas y cuesta más que el cambio global). Las ventanas sin
+        padre que estén visibles en ese momento (diálogos abiertos) se re-estilizan
+        igual; las que se creen después sin padre muestran el tema del arranque, así
+        que diálogos y menús deben crearse con un padre dentro del alcance (los
+        tooltips ya heredan el QSS del widget que los muestra).
+        """
+        with profiler.phase(f"ThemeManager.apply_theme: {theme_type}"):
+            self._apply_theme(theme_type, scope)
+
+    def _apply_theme(
+        self, theme_type: ThemeType, scope: Optional[Iterable[QWidget]] = None
+    ) -> None:
+        """Implementación de `apply_theme` (separada para medirla con el profiler)."""
         # Asegurar que es Enum si viene como string
         if isinstance(theme_type, str):
             try:
@@ -133,9 +193,28 @@ class ThemeManager:
 
         self._current_theme = theme_type
 
-        # 1. Preparar el QSS
-        palette = THEME_PALETTES[theme_type]
-        qss_content = self._process_template(palette)
+        # 1. Preparar el QSS (memoria -> disco -> renderizado)
+        qss_content = self._qss_cache.get(theme_type)
+        if qss_content is None:
+            qss_content = self._load_cached_qss(theme_type)
+            self._qss_cache[theme_type] = qss_content
+
+        # Los iconos se re-tiñen en memoria con el color del tema
+        get_icon_service().set_color(THEME_PALETTES[theme_type]["@icon_color"])
+
+        # 2. Aplicar solo a las ventanas indicadas
+        if scope is not None:
+            windows = list(scope)
+            # Ventanas sin padre abiertas fuera del alcance (ej. un QMessageBox sin padre)
+            app = QApplication.instance()
+            if app:
+                windows += [
+                    w for w in app.topLevelWidgets()
+                    if w.isVisible() and w.parent() is None and w not in windows
+                ]
+            for widget in windows:
+                widget.setStyleSheet(qss_content)
+            return
 
         # 2. Aplicar a la aplicación ⭐
         app: QApplication = QApplication.instance()
@@ -147,15 +226,103 @@ class ThemeManager:
     # -------------------------------------------------------------------------
     def _load_template(self):
         """Carga la plantilla QSS en memoria."""
+        with profiler.phase("ThemeManager._load_template"):
+            self._read_template()
+
+    def _read_template(self):
+        """Lee style.qss del disco."""
         try:
-            with open("styles/style.qss", "r", encoding="utf-8") as f:
+            with open(TEMPLATE_PATH, "r", encoding="utf-8") as f:
                 self._template_content = f.read()
         except FileNotFoundError:
             print("No se encontró el archivo style.qss")
+        self._template_loaded = True
+        self._compile_template()
+
+    def _load_cached_qss(self, theme_type: ThemeType) -> str:
+        """
+        Retorna el QSS del tema desde la caché en disco, renderizándolo si no es válida.
+
+        1. Firma de fuentes igual a la de la cabecera -> se usa sin leer la plantilla.
+        2. Firma distinta pero mismo hash de contenido -> se actualiza la cabecera.
+        3. Si no -> se renderiza y se reescribe la entrada.
+        """
+        try:
+            path = os.path.join(cache_dir("qss"), f"{theme_type.value}.qss")
+        except OSError as e:
+            # La caché es una optimización: sin directorio se renderiza en memoria
+            print(f"⚠️ Error: caché de QSS no disponible ({e}), se renderiza en memoria.")
+            path = None
+        sources = self._sources_signature()
+
+        cached_key, cached_sources, body = None, None, None
+        if path is not None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    header, _, body = f.read().partition("\n")
+                _, version, key_field, sources_field, _ = header.split(" ", 4)
+                if version == CACHE_VERSION:
+                    cached_key = key_field.removeprefix("key=")
+                    cached_sources = sources_field.removeprefix("src=")
+            except (OSError, ValueError):
+                pass
+
+        if cached_key is not None and cached_sources == sources:
+            return body
+
+        if not self._template_loaded:
+            self._load_template()
+        palette = THEME_PALETTES[theme_type]
+        key = self._content_key(palette)
+
+        if cached_key != key:
+            body = self._process_template(palette)
+        if path is not None:
+            self._write_cached_qss(path, key, sources, body)
+        return body
+
+    def _content_key(self, palette: dict) -> str:
+        """Hash de la plantilla + la paleta: identifica el contenido del QSS compilado."""
+        digest = hashlib.sha256(self._template_content.encode("utf-8"))
+        digest.update(json.dumps(palette, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _sources_signature() -> str:
+        """Firma barata (mtime + tamaño) de style.qss y themes.py, sin leerlos."""
+        parts = []
+        for source in CACHE_SOURCES:
+            try:
+                stat = os.stat(source)
+                parts.append(f"{stat.st_mtime_ns}-{stat.st_size}")
+            except OSError:
+                parts.append("missing")
+        return ",".join(parts)
+
+    @staticmethod
+    def _write_cached_qss(path: str, key: str, sources: str, body: str):
+        """Escribe la entrada de forma atómica (la caché es opcional: los errores se ignoran)."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(f"/* {CACHE_VERSION} key={key} src={sources} */\n{body}")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _compile_template(self):
+        """
+        Divide la plantilla en segmentos alternando texto literal y variables.
+        El regex toma el identificador completo, así `@bg_root` nunca pisa a `@bg_root_alt`.
+        """
+        # re.split con grupo de captura: [literal, @var, literal, @var, ..., literal]
+        self._segments = VARIABLE_PATTERN.split(self._template_content)
+        self._variable_slots = list(range(1, len(self._segments), 2))
+        self._qss_cache.clear()
 
     def _process_template(self, palette: dict) -> str:
-        """Reemplaza las variables en el string del QSS."""
-        qss = self._template_content
-        for key, value in palette.items():
-            qss = qss.replace(key, value)
-        return qss
+        """Renderiza la plantilla compilada con la paleta (variables desconocidas se dejan igual)."""
+        parts = self._segments.copy()
+        for i in self._variable_slots:
+            parts[i] = palette.get(parts[i], parts[i])
+        return "".join(parts)
@@ -0,0 +1,22 @@
+"""Rutas absolutas del proyecto (independientes del directorio de trabajo)."""
+
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
+ICONS_DIR = os.path.join(ASSETS_DIR, "icons")
+STYLES_DIR = os.path.join(ROOT_DIR, "styles")
+
+# Se puede redirigir la caché (ej. instalación de solo lectura) con APP_CACHE_DIR
+CACHE_ENV_VAR = "APP_CACHE_DIR"
+
+
+def cache_dir(*parts: str) -> str:
+    """
+    Retorna (y crea si hace falta) un subdirectorio de la caché de la app.
+    Lanza OSError si no se puede crear: los llamadores deben seguir sin caché.
+    """
+    base = os.environ.get(CACHE_ENV_VAR) or os.path.join(ROOT_DIR, ".cache")
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,190 @@
+"""
+Detector de bloqueos del event loop (opt-in).
+
+Un QTimer en el hilo de la GUI marca un "latido" cada `interval_ms`; un hilo
+auxiliar vigila el último latido. Si pasa más de `threshold_ms` sin latidos, el
+hilo auxiliar toma una muestra del stack Python del hilo principal
+(`sys._current_frames()`) y, cuando el loop se recupera, registra:
+- Duración del bloqueo y la página visible del Canvas.
+- El slot (o event handler) Python que Qt estaba ejecutando: el frame más externo
+  llamado desde el event loop.
+- Los frames del stack en el momento de la muestra.
+
+Qt no expone a Python qué señal se está entregando; el slot es la atribución más
+precisa disponible sin instrumentar cada conexión. La muestra solo extrae
+archivo/línea/función de cada frame (`traceback.extract_stack`): no lee las
+variables locales del hilo principal desde el hilo auxiliar.
+
+Desactivado no hay timer ni hilo: costo nulo. Se activa desde la configuración
+general, con la variable de entorno APP_STALL_WATCHDOG=1 o por código:
+
+    watchdog = StallWatchdog(parent=window)
+    watchdog.set_enabled(True)
+"""
+
+import linecache
+import os
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal
+
+ENV_VAR = "APP_STALL_WATCHDOG"
+SETTINGS_KEY = "stall_watchdog/enabled"
+
+
+@dataclass
+class StallReport:
+    """Un bloqueo del event loop detectado por StallWatchdog."""
+
+    duration_ms: float
+    page: Optional[str]  # Key de la página visible en el Canvas
+    slot: str  # Slot/handler más externo ("metodo (archivo:línea)")
+    frames: List[str] = field(default_factory=list)  # Stack, del más externo al más interno
+
+    def format(self) -> str:
+        lines = [
+            f"⚠️ Event loop bloqueado {self.duration_ms:.0f} ms "
+            f"| página: {self.page or '-'} | slot: {self.slot}"
+        ]
+        lines.extend(f"    {frame}" for frame in self.frames)
+        return "\n".join(lines)
+
+
+def watchdog_requested() -> bool:
+    """True si el usuario activó el detector (variable de entorno o configuración guardada)."""
+    if os.environ.get(ENV_VAR, "") not in ("", "0"):
+        return True
+    return QSettings("TemplatePySide6", "Diagnostics").value(SETTINGS_KEY, False, type=bool)
+
+
+class StallWatchdog(QObject):
+    """Mide la latencia del event loop y registra los bloqueos con su stack."""
+
+    # Se emite (en el hilo de la GUI) con un StallReport al terminar cada bloqueo
+    stall_detected = Signal(object)
+
+    def __init__(
+        self,
+        threshold_ms: float = 50,
+        interval_ms: int = 20,
+        max_frames: int = 12,
+        parent: QObject = None,
+    ):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.max_frames = max_frames
+        self._main_thread_id = threading.main_thread().ident
+        self._current_page: Optional[str] = None
+
+        # Latido en el hilo de la GUI: si el loop se bloquea, deja de actualizarse
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(interval_ms)
+        self._heartbeat.timeout.connect(self._beat)
+        self._last_beat = time.perf_counter()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self._thread is not None
+
+    def set_enabled(self, enabled: bool, persist: bool = True):
+        """Activa/desactiva el detector (y opcionalmente guarda la preferencia)."""
+        if persist:
+            QSettings("TemplatePySide6", "Diagnostics").setValue(SETTINGS_KEY, enabled)
+        if enabled:
+            self.start()
+        else:
+            self.stop()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._last_beat = time.perf_counter()
+        self._heartbeat.start()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="StallWatchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._heartbeat.stop()
+        self._stop_event.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+
+    def set_current_page(self, key: str):
+        """Slot para Canvas.current_page_changed (la key se lee desde el hilo auxiliar)."""
+        self._current_page = key
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    def _beat(self):
+        self._last_beat = time.perf_counter()
+
+    def _watch(self):
+        """Hilo auxiliar: detecta el bloqueo, toma la muestra y reporta al recuperarse."""
+        poll = self._heartbeat.interval() / 1000
+        threshold = self.threshold_ms / 1000 + poll  # El latido normal llega cada `poll`
+        stall_beat = None
+        sample = None
+
+        while not self._stop_event.wait(poll):
+            last_beat = self._last_beat
+            lag = time.perf_counter() - last_beat
+
+            if stall_beat is None and lag > threshold:
+                # Bloqueo en curso: muestra del stack del hilo principal
+                stall_beat = last_beat
+                sample = self._sample_main_stack()
+            elif stall_beat is not None and last_beat != stall_beat:
+                # El loop volvió a latir: el bloqueo duró hasta este latido
+                duration = (last_beat - stall_beat) * 1000 - self._heartbeat.interval()
+                self._report(duration, sample)
+                stall_beat = sample = None
+
+    def _sample_main_stack(self) -> List[traceback.FrameSummary]:
+        """Stack del hilo principal, del más externo al más interno (sin variables locales)."""
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return []
+        return list(traceback.extract_stack(frame))
+
+    @staticmethod
+    def _slot_index(stack: List[traceback.FrameSummary]) -> int:
+        """Índice del frame más externo llamado por el event loop (exec/processEvents)."""
+        slot = 1
+        for index, summary in enumerate(stack[:-1]):
+            line = summary.line or linecache.getline(summary.filename, summary.lineno)
+            if "exec(" in line or "processEvents(" in line:
+                slot = index + 1
+        return slot
+
+    def _report(self, duration_ms: float, stack: List[traceback.FrameSummary]):
+        index = self._slot_index(stack)
+        if index >= len(stack):
+            # El hilo principal estaba dentro de Qt (layout, pintura, etc.)
+            slot = "(código de Qt, sin slot Python)"
+            index = max(len(stack) - 1, 0)
+        else:
+            top = stack[index]
+            slot = f"{top.name} ({os.path.basename(top.filename)}:{top.lineno})"
+
+        frames = [
+            f"{os.path.basename(s.filename)}:{s.lineno} {s.name} — {(s.line or '').strip()}"
+            for s in stack[index:][-self.max_frames:]
+        ]
+        report = StallReport(duration_ms, self._current_page, slot, frames)
+        print(report.format())
+        # Señal emitida desde el hilo auxiliar: Qt la entrega en el hilo de la GUI
+        self.stall_detected.emit(report)
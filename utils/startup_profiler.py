@@ -0,0 +1,150 @@
+"""
+Instrumentación del arranque de la app.
+
+Se activa con `python main.py --profile-startup[=archivo.json]` o con la variable
+de entorno APP_PROFILE_STARTUP=1 (o =archivo.json). Registra fases anidadas hasta
+el primer paint de la ventana principal y al terminar:
+- Escribe un Chrome trace (abrir en chrome://tracing o https://ui.perfetto.dev).
+- Imprime un resumen por consola.
+
+Desactivado, `phase()` devuelve un context manager vacío compartido (costo ~0).
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import List, Optional, Tuple
+
+FLAG = "--profile-startup"
+ENV_VAR = "APP_PROFILE_STARTUP"
+DEFAULT_OUTPUT = "startup_profile.json"
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+class StartupProfiler:
+    """Registra fases del arranque con `perf_counter` relativo a la importación del módulo."""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self.enabled, self.output_path = self._read_config()
+        # (nombre, inicio, fin, profundidad); fin == inicio para marcas instantáneas
+        self._events: List[Tuple[str, float, float, int]] = []
+        self._depth = 0
+        self._finished = False
+        self._paint_filter = None
+
+    def phase(self, name: str):
+        """Context manager que mide una fase: `with profiler.phase("imports"): ...`"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._measure(name)
+
+    def mark(self, name: str):
+        """Registra un evento instantáneo (ej. el primer paint)."""
+        if self.enabled:
+            now = time.perf_counter()
+            self._events.append((name, now, now, self._depth))
+
+    def watch_first_paint(self, widget):
+        """Registra el primer paint de `widget` y cierra el perfil en el siguiente ciclo."""
+        if not self.enabled:
+            return
+
+        from PySide6.QtCore import QEvent, QObject, QTimer
+
+        profiler = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    profiler.mark("first paint")
+                    QTimer.singleShot(0, profiler.finish)
+                return False
+
+        self._paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
+
+    def finish(self):
+        """Escribe el trace y el resumen (solo la primera vez)."""
+        if not self.enabled or self._finished:
+            return
+        self._finished = True
+        self.write_trace(self.output_path)
+        print(self.summary(), flush=True)
+
+    def write_trace(self, path: str):
+        """Exporta los eventos en formato Chrome trace (JSON)."""
+        pid = os.getpid()
+        tid = threading.get_ident()
+        trace = []
+        for name, start, end, _depth in self._events:
+            event = {
+                "name": name,
+                "cat": "startup",
+                "ts": round((start - self._t0) * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+            }
+            if end > start:
+                event.update(ph="X", dur=round((end - start) * 1e6, 1))
+            else:
+                event.update(ph="i", s="g")
+            trace.append(event)
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f, indent=1)
+        except OSError as e:
+            print(f"⚠️ Error: No se pudo escribir el perfil de arranque: {e}")
+
+    def summary(self) -> str:
+        """Tabla legible con inicio y duración de cada fase (en ms)."""
+        lines = [
+            f"⏱️  Perfil de arranque ({self.output_path})",
+            f"{'inicio':>9} {'duración':>9}  fase",
+        ]
+        for name, start, end, depth in sorted(self._events, key=lambda e: e[1]):
+            duration = f"{(end - start) * 1000:8.1f}" if end > start else f"{'':>8}·"
+            lines.append(
+                f"{(start - self._t0) * 1000:9.1f} {duration}  {'  ' * depth}{name}"
+            )
+        return "\n".join(lines)
+
+    # -------------------------------------------------------------------------
+    # MÉTODOS PRIVADOS (Auxiliares)
+    # -------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def _measure(self, name: str):
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self._events.append((name, start, time.perf_counter(), depth))
+
+    @staticmethod
+    def _read_config() -> Tuple[bool, Optional[str]]:
+        """Lee el flag de línea de comandos o la variable de entorno."""
+        for arg in sys.argv[1:]:
+            if arg == FLAG:
+                return True, DEFAULT_OUTPUT
+            if arg.startswith(FLAG + "="):
+                return True, arg.split("=", 1)[1] or DEFAULT_OUTPUT
+
+        value = os.environ.get(ENV_VAR, "").strip()
+        if not value or value.lower() in ("0", "false", "no"):
+            return False, None
+        if value.lower() in ("1", "true", "yes"):
+            return True, DEFAULT_OUTPUT
+        return True, value
+
+
+# Instancia única del proceso: importarla lo antes posible en main.py
+profiler = StartupProfiler()